@@ -2,4 +2,12 @@
 
 from fastapi import APIRouter
 
+from src.app.factory import Factory
+from src.core.fastapi.router import add_export_route
+
 router = APIRouter()
+
+add_export_route(
+    router=router,
+    get_controller=Factory().get_user_controller,
+)
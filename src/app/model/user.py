@@ -2,17 +2,27 @@
 
 import uuid
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql.sqltypes import UUID, String, Text
 
 from src.core.database.base import Base
 from src.core.database.mixin import AsDictMixin, TimestampMixin
+from src.core.database.search import gin_index, search_vector, trgm_index
 
 
 class User(Base, TimestampMixin, AsDictMixin):
     """User model."""
 
     __tablename__ = "user"
+    __searchable__ = ("username", "email")
+    __sort_orders__ = ("created_at,id", "username", "email")
+    __table_args__ = (
+        Index("ix_user_created_at_id", "created_at", "id"),
+        trgm_index("ix_user_username_trgm", "username"),
+        trgm_index("ix_user_email_trgm", "email"),
+        gin_index("ix_user_search_vector", "search_vector"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -34,3 +44,4 @@ class User(Base, TimestampMixin, AsDictMixin):
         Text,
         nullable=False,
     )
+    search_vector: Mapped[str] = search_vector("username", "email")
@@ -4,10 +4,13 @@ from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.model import User
+from src.core.helper.type.guard import GuardPolicy
 from src.core.repository import SQLAlchemyRepository
 
 
 class UserRepository(SQLAlchemyRepository[User, AsyncSession, Select]):  # type: ignore[type-arg]
     """User repository."""
 
-    pass
+    facet_exclude = frozenset({"hashed_password"})
+    rows_exclude = frozenset({"hashed_password"})
+    unindexed_filter_policy = GuardPolicy.reject
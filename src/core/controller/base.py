@@ -3,16 +3,19 @@
 """Базовый контроллер."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
 from typing import Any
 from uuid import UUID
 
+import orjson
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from src.core.exception.base import (
     NotFoundException,
     UnprocessableEntityException,
 )
+from src.core.fastapi.response import RawJSONResponse
 from src.core.helper.scheme.request.filter import (
     FilterParam,
     FilterRequest,
@@ -24,10 +27,27 @@ from src.core.helper.scheme.response.for_filter import (
 from src.core.helper.scheme.response.pagination import (
     PaginationResponse,
 )
+from src.core.helper.type.conflict import ConflictAction
 from src.core.helper.type.controller import DTOMode
+from src.core.helper.type.count import CountMode
+from src.core.helper.type.export import ExportFormat
+from src.core.helper.type.facet import FacetParams
 from src.core.helper.type.filter import FilterType, OperatorType
+from src.core.helper.type.pagination import (
+    Cursor,
+    CursorDirection,
+    PaginationMode,
+    PaginationStrategy,
+)
 from src.core.helper.type.sort import SortType
 from src.core.repository import BaseRepository
+from src.core.util.cursor import decode_cursor
+from src.core.util.dto import list_adapter, nested_paths, partial_scheme
+from src.core.util.export import (
+    EXPORT_MEDIA_TYPES,
+    encode_csv,
+    encode_ndjson,
+)
 
 
 class BaseController[ModelType](ABC):
@@ -39,11 +59,17 @@ class BaseController[ModelType](ABC):
         repository: BaseRepository,
         exclude_fields: set[str],
         response_scheme: BaseModel,
+        pagination_strategy: PaginationStrategy = PaginationStrategy.separate,
+        count_mode: CountMode = CountMode.exact,
+        count_cap: int = 10_000,
     ):
         self.model_class = model
         self.repository = repository
         self.exclude_fields = exclude_fields
         self.response_scheme = response_scheme
+        self.pagination_strategy = pagination_strategy
+        self.count_mode = count_mode
+        self.count_cap = count_cap
 
     @abstractmethod
     async def processing_transaction(
@@ -59,19 +85,69 @@ class BaseController[ModelType](ABC):
         self,
         value: ModelType | list[ModelType],
         dto_mode: DTOMode,
+        projection: list[str] | None = None,
     ) -> BaseModel | dict[str, Any] | list[BaseModel | dict[str, Any]]:
-        """Mapping ModelType in dict or BaseModel."""
+        """Mapping ModelType in dict or BaseModel.
+
+        Lists are validated in one call by the cached adapter of
+        response_scheme. With projection only projected fields are returned
+        (partial response_scheme, cached per field set).
+        """
+        scheme = self._response_scheme(projection)
         match dto_mode:
             case DTOMode.pydantic:
                 if isinstance(value, list):
-                    return [
-                        self.response_scheme.model_validate(el) for el in value
-                    ]
-                return self.response_scheme.model_validate(value)
+                    return list_adapter(scheme).validate_python(
+                        value,
+                        from_attributes=True,
+                    )
+                return scheme.model_validate(value)
             case DTOMode.dict:
+                if projection:
+                    keys = scheme.model_fields.keys()
+                    if isinstance(value, list):
+                        return [
+                            {
+                                key: item
+                                for key, item in el.model_dump().items()  # type: ignore[union-attr]
+                                if key in keys
+                            }
+                            for el in value
+                        ]
+                    return {
+                        key: item
+                        for key, item in value.model_dump().items()
+                        if key in keys
+                    }
                 if isinstance(value, list):
                     return [el.model_dump() for el in value]  # type: ignore[union-attr]
                 return value.model_dump()
+            case DTOMode.rows:
+                rows: list[Any] = value if isinstance(value, list) else [value]
+                labels = [
+                    (key, field, column or None)
+                    for key in (rows[0]._mapping if rows else [])
+                    for field, _, column in [key.partition(".")]
+                    if field in scheme.model_fields
+                ]
+                mappings: list[BaseModel | dict[str, Any]] = [
+                    self._row_dict(row, labels) for row in rows
+                ]
+                return mappings if isinstance(value, list) else mappings[0]
+
+    def dto_json(
+        self,
+        value: ModelType | list[ModelType],
+        projection: list[str] | None = None,
+    ) -> bytes:
+        """Mapping ModelType in JSON bytes of response_scheme."""
+        scheme = self._response_scheme(projection)
+        if isinstance(value, list):
+            adapter = list_adapter(scheme)
+            return adapter.dump_json(
+                adapter.validate_python(value, from_attributes=True),
+            )
+        return scheme.model_validate(value).model_dump_json().encode()
 
     def transactional(function):  # type: ignore
         """Декоратор для транзакций."""
@@ -100,6 +176,7 @@ class BaseController[ModelType](ABC):
         projection: list[str] | None = None,
         with_related: Sequence[Any] | bool | None = None,
         dto_mode: DTOMode | None = None,
+        count_mode: CountMode | None = None,
     ) -> (
         ModelType
         | PaginationResponse
@@ -121,22 +198,46 @@ class BaseController[ModelType](ABC):
             projection: Выборка по определённым полям.
             with_related: Указание подтягивание отношений с другими моделями.
             dto_mode: Маппинг ModelType в BaseModel или dict
+            count_mode: Способ подсчёта total_count, по умолчанию контроллера.
 
         Returns:
             Экземпляры модели.
         """
-        result = await self.repository.get_by(
-            field=field,
-            value=value,
-            skip=skip,
-            limit=limit,
-            sort_by=sort_by,
-            sort_type=sort_type,
-            operator=operator,
-            unique=unique,
-            projection=projection,
-            with_related=with_related,
+        filter_request = FilterRequest(
+            filters=[
+                FilterParam(field=field, value=value, operator=operator),
+            ],
+            type=FilterType.AND,
         )
+        result: ModelType | None | list[ModelType]
+        total_count = None
+        if not unique and self._use_window_count(count_mode, dto_mode):
+            (
+                result,
+                total_count,
+            ) = await self.repository.get_by_filters_with_count(
+                filter_request=filter_request,
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                projection=projection,
+                with_related=self._with_related(with_related, projection),
+            )
+        else:
+            result = await self.repository.get_by(
+                field=field,
+                value=value,
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                operator=operator,
+                unique=unique,
+                projection=projection,
+                with_related=self._with_related(with_related, projection),
+                rows=dto_mode == DTOMode.rows,
+            )
         if not result:
             raise NotFoundException(
                 f"{self.model_class.__name__} {field} со значением {value} не существует",  # noqa: E501
@@ -144,21 +245,26 @@ class BaseController[ModelType](ABC):
 
         if unique:
             if dto_mode:
-                return self.dto(value=result, dto_mode=dto_mode)
-            return result
+                return self.dto(
+                    value=result,
+                    dto_mode=dto_mode,
+                    projection=projection,
+                )
+            return result  # type: ignore[return-value]
 
         return await self.make_pagination_response(
-            data=self.dto(value=result, dto_mode=dto_mode)
+            data=self.dto(
+                value=result,
+                dto_mode=dto_mode,
+                projection=projection,
+            )
             if dto_mode
             else result,
             skip=skip,
             limit=limit,
-            filter_request=FilterRequest(
-                filters=[
-                    FilterParam(field=field, value=value, operator=operator),
-                ],
-                type=FilterType.AND,
-            ),
+            filter_request=filter_request,
+            total_count=total_count,
+            count_mode=count_mode,
         )
 
     async def get_by_filters(
@@ -172,6 +278,9 @@ class BaseController[ModelType](ABC):
         projection: list[str] | None = None,
         with_related: Sequence[Any] | bool | None = None,
         dto_mode: DTOMode | None = None,
+        cursor: str | None = None,
+        pagination_mode: PaginationMode = PaginationMode.offset,
+        count_mode: CountMode | None = None,
     ) -> (
         ModelType
         | list[ModelType]
@@ -192,68 +301,265 @@ class BaseController[ModelType](ABC):
             projection: Выборка по определённым полям.
             with_related: Указание подтягивание отношений с другими моделями.
             dto_mode: Маппинг ModelType в BaseModel или dict
+            cursor: Курсор страницы для keyset-пагинации.
+            pagination_mode: Режим пагинации (курсор включает режим cursor).
+            count_mode: Способ подсчёта total_count, по умолчанию контроллера.
 
         Returns:
             Экземпляры модели или уникальный экземпляр.
         """
-        result = await self.repository.get_by_filters(
-            filter_request=filter_request,
-            skip=skip,
-            limit=limit,
-            sort_by=sort_by,
-            sort_type=sort_type,
-            unique=unique,
-            projection=projection,
-            with_related=with_related,
-        )
+        decoded_cursor = decode_cursor(cursor) if cursor else None
+        if decoded_cursor is not None:
+            pagination_mode = PaginationMode.cursor
+
+        result: ModelType | None | list[ModelType]
+        total_count = None
+        if (
+            not unique
+            and pagination_mode == PaginationMode.offset
+            and self._use_window_count(count_mode, dto_mode)
+        ):
+            (
+                result,
+                total_count,
+            ) = await self.repository.get_by_filters_with_count(
+                filter_request=filter_request,
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                projection=projection,
+                with_related=self._with_related(with_related, projection),
+            )
+        else:
+            result = await self.repository.get_by_filters(
+                filter_request=filter_request,
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                unique=unique,
+                projection=projection,
+                with_related=self._with_related(with_related, projection),
+                rows=dto_mode == DTOMode.rows,
+                cursor=decoded_cursor,
+                pagination_mode=pagination_mode,
+            )
 
         if unique:
             if result:
                 if dto_mode:
-                    return self.dto(value=result, dto_mode=dto_mode)
+                    return self.dto(
+                        value=result,
+                        dto_mode=dto_mode,
+                        projection=projection,
+                    )
                 return result
             else:
                 raise NotFoundException(
                     f"Уникального {self.model_class.__name__} с данными фильтрами не существует",
                 )
 
+        if pagination_mode == PaginationMode.cursor:
+            return await self.make_cursor_pagination_response(
+                data=result,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                cursor=decoded_cursor,
+                filter_request=filter_request,
+                dto_mode=dto_mode,
+                projection=projection,
+                count_mode=count_mode,
+            )
+
         return await self.make_pagination_response(
-            data=self.dto(value=result, dto_mode=dto_mode)
+            data=self.dto(
+                value=result,
+                dto_mode=dto_mode,
+                projection=projection,
+            )
             if dto_mode
             else result,
             skip=skip,
             limit=limit,
             filter_request=filter_request,
+            total_count=total_count,
+            count_mode=count_mode,
         )
 
     async def count(
         self,
         filter_request: FilterRequest | None = None,
+        count_mode: CountMode | None = None,
     ) -> CountResponse:
         """Возвращает количество записей в модели по фильтрам.
 
         Args:
             filter_request: Фильтры для совпадения.
+            count_mode: Способ подсчёта, по умолчанию контроллера.
+
+        Notes:
+            count_mode ответа - способ, которым получено значение: если
+            в режиме capped записей не больше предела, значение точное.
 
         Returns:
             Количество записей.
         """
-        return CountResponse(
-            count=await self.repository.count(filter_request=filter_request),
+        count_mode = count_mode or self.count_mode
+        count = await self.repository.count(
+            filter_request=filter_request,
+            count_mode=count_mode,
+            count_cap=self.count_cap,
         )
+        if count_mode == CountMode.capped and count is not None:
+            if count > self.count_cap:
+                count = self.count_cap
+            else:
+                count_mode = CountMode.exact
+
+        return CountResponse(count=count, count_mode=count_mode)
 
     async def get_for_filters(
         self,
         filter_request: FilterRequest | None = None,
         sort_type: SortType | None = SortType.asc,
+        facet_params: FacetParams | None = None,
     ) -> ForFiltersResponse:
         """Возвращает словарь полей с их уникальными значениями."""
         for_filters = await self.repository.get_columns_unique_values(
             filter_request=filter_request,
             sort_type=sort_type,
+            facet_params=facet_params,
         )
         return ForFiltersResponse(columns=for_filters)
 
+    async def get_json_by_filters(
+        self,
+        filter_request: FilterRequest | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_type: SortType | None = SortType.asc,
+        projection: list[str] | None = None,
+        count_mode: CountMode | None = None,
+    ) -> RawJSONResponse:
+        """Возвращает страницу пагинации с данными, собранными в JSON базой.
+
+        Args:
+            filter_request: Фильтры для совпадения.
+            skip: Количество записей для пропуска.
+            limit: Количество записей для возврата.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            projection: Выборка по определённым полям, по умолчанию поля
+                response_scheme (должны быть колонками модели).
+            count_mode: Способ подсчёта total_count, по умолчанию контроллера.
+
+        Notes:
+            Данные не проходят через ORM и pydantic: байты из базы
+            вставляются в ответ как поле data рядом с метаданными пагинации.
+
+        Returns:
+            Ответ с готовым JSON.
+        """
+        data, page_size = await self.repository.get_json_by_filters(
+            filter_request=filter_request,
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            sort_type=sort_type,
+            projection=self._public_fields(
+                projection or self.response_scheme.model_fields,
+            ),
+        )
+        count_response = await self.count(
+            filter_request=filter_request,
+            count_mode=count_mode,
+        )
+        meta = PaginationResponse[Any](
+            data=[],
+            page=skip // limit + 1 if limit > 0 else 1,
+            page_size=page_size,
+            total_pages=self._total_pages(count_response.count, limit),
+            total_count=count_response.count,
+            count_mode=count_response.count_mode,
+        ).model_dump(mode="json", exclude={"data"})
+        return RawJSONResponse(
+            content=orjson.dumps(meta)[:-1] + b',"data":' + data + b"}",
+        )
+
+    async def export(
+        self,
+        filter_request: FilterRequest | None = None,
+        export_format: ExportFormat = ExportFormat.ndjson,
+        projection: list[str] | None = None,
+        sort_by: str | None = None,
+        sort_type: SortType | None = SortType.asc,
+        chunk_size: int = 1000,
+    ) -> StreamingResponse:
+        """Выгружает объекты, соответствующие фильтрам, потоком.
+
+        Args:
+            filter_request: Фильтры для совпадения.
+            export_format: Формат выгрузки.
+            projection: Выгружаемые поля, по умолчанию поля response_scheme.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            chunk_size: Кол-во записей, читаемых из базы за раз.
+
+        Notes:
+            Каждая пачка из базы кодируется и отправляется целиком,
+            следующая читается только после отправки предыдущей,
+            поэтому медленный клиент не накапливает данные в памяти.
+            Первая пачка читается до отправки заголовков, чтобы ошибки
+            фильтров вернулись клиенту как 4xx.
+
+        Returns:
+            Потоковый ответ.
+        """
+        fields = self._public_fields(
+            projection or self.response_scheme.model_fields,
+        )
+        chunks = self.repository.iter_by_filters(
+            filter_request=filter_request,
+            sort_by=sort_by,
+            sort_type=sort_type,
+            projection=projection,
+            chunk_size=chunk_size,
+        )
+        first_chunk = await anext(chunks, None)
+
+        async def content() -> AsyncIterator[bytes]:
+            """Кодирует пачки по мере чтения из базы."""
+            chunk = first_chunk
+            header = True
+            while chunk is not None:
+                rows = [
+                    [self._export_value(model, field) for field in fields]
+                    for model in chunk
+                ]
+                match export_format:
+                    case ExportFormat.ndjson:
+                        yield encode_ndjson(rows=rows, fields=fields)
+                    case ExportFormat.csv:
+                        yield encode_csv(
+                            rows=rows, fields=fields, header=header
+                        )
+                header = False
+                chunk = await anext(chunks, None)
+            if header and export_format == ExportFormat.csv:
+                yield encode_csv(rows=[], fields=fields, header=True)
+
+        filename = f"{self.model_class.__name__.lower()}.{export_format}"
+        return StreamingResponse(
+            content=content(),
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+            },
+        )
+
     async def get_by_id(
         self,
         id_: int,
@@ -277,7 +583,8 @@ class BaseController[ModelType](ABC):
             value=id_,
             unique=True,
             projection=projection,
-            with_related=with_related,
+            with_related=self._with_related(with_related, projection),
+            rows=dto_mode == DTOMode.rows,
         )
         if not result:
             raise NotFoundException(
@@ -285,7 +592,11 @@ class BaseController[ModelType](ABC):
             )
 
         if dto_mode:
-            return self.dto(value=result, dto_mode=dto_mode)  # type: ignore[return-value]
+            return self.dto(
+                value=result,
+                dto_mode=dto_mode,
+                projection=projection,
+            )  # type: ignore[return-value]
 
         return result  # type: ignore[return-value]
 
@@ -309,7 +620,8 @@ class BaseController[ModelType](ABC):
             field="uuid",
             value=uuid,
             unique=True,
-            with_related=with_related,
+            with_related=self._with_related(with_related, None),
+            rows=dto_mode == DTOMode.rows,
         )
         if not result:
             raise NotFoundException(
@@ -330,6 +642,9 @@ class BaseController[ModelType](ABC):
         projection: list[str] | None = None,
         with_related: Sequence[Any] | bool | None = None,
         dto_mode: DTOMode | None = None,
+        cursor: str | None = None,
+        pagination_mode: PaginationMode = PaginationMode.offset,
+        count_mode: CountMode | None = None,
     ) -> PaginationResponse | list[BaseModel | dict[str, Any]]:
         """Возвращает список записей на основе параметров пагинации.
 
@@ -341,25 +656,67 @@ class BaseController[ModelType](ABC):
             projection: Выборка по определённым полям.
             with_related: Указание подтягивание отношений с другими моделями.
             dto_mode: Маппинг ModelType в BaseModel или dict
+            cursor: Курсор страницы для keyset-пагинации.
+            pagination_mode: Режим пагинации (курсор включает режим cursor).
+            count_mode: Способ подсчёта total_count, по умолчанию контроллера.
 
         Returns:
             Список записей.
         """
-        result = await self.repository.get_all(
-            skip=skip,
-            limit=limit,
-            sort_by=sort_by,
-            sort_type=sort_type,
-            projection=projection,
-            with_related=with_related,
-        )
+        decoded_cursor = decode_cursor(cursor) if cursor else None
+        if decoded_cursor is not None:
+            pagination_mode = PaginationMode.cursor
+
+        total_count = None
+        if pagination_mode == PaginationMode.offset and self._use_window_count(
+            count_mode,
+            dto_mode,
+        ):
+            result, total_count = await self.repository.get_all_with_count(
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                projection=projection,
+                with_related=self._with_related(with_related, projection),
+            )
+        else:
+            result = await self.repository.get_all(
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                projection=projection,
+                with_related=self._with_related(with_related, projection),
+                rows=dto_mode == DTOMode.rows,
+                cursor=decoded_cursor,
+                pagination_mode=pagination_mode,
+            )
+
+        if pagination_mode == PaginationMode.cursor:
+            return await self.make_cursor_pagination_response(
+                data=result,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                cursor=decoded_cursor,
+                dto_mode=dto_mode,
+                projection=projection,
+                count_mode=count_mode,
+            )
 
         return await self.make_pagination_response(
-            data=self.dto(value=result, dto_mode=dto_mode)
+            data=self.dto(
+                value=result,
+                dto_mode=dto_mode,
+                projection=projection,
+            )
             if dto_mode
             else result,
             skip=skip,
             limit=limit,
+            total_count=total_count,
+            count_mode=count_mode,
         )
 
     @transactional
@@ -375,6 +732,96 @@ class BaseController[ModelType](ABC):
         created_model = await self.repository.create(attributes=attributes)
         return created_model
 
+    @transactional
+    async def create_many(
+        self,
+        attributes: list[dict[str, Any]],
+        chunk_size: int = 1000,
+        returning: bool = True,
+    ) -> list[ModelType]:
+        """Создает объекты в базе данных пачкой в одной транзакции.
+
+        Args:
+            attributes: Атрибуты для создания объектов.
+            chunk_size: Кол-во строк в одном запросе.
+            returning: Возвращать ли созданные объекты.
+
+        Notes:
+            Большие пачки без returning загружаются через COPY.
+
+        Returns:
+            Созданные объекты.
+        """
+        created_models = await self.repository.create_many(
+            attributes=attributes,
+            chunk_size=chunk_size,
+            returning=returning,
+        )
+        return created_models
+
+    @transactional
+    async def upsert(
+        self,
+        attributes: dict[str, Any],
+        index_elements: list[str],
+        on_conflict: ConflictAction = ConflictAction.update,
+        update_fields: list[str] | None = None,
+        returning: bool = True,
+    ) -> ModelType | None:
+        """Создает или обновляет объект в базе данных одним запросом.
+
+        Args:
+            attributes: Атрибуты объекта.
+            index_elements: Уникальные поля, по которым определяется конфликт.
+            on_conflict: Действие при конфликте.
+            update_fields: Поля для обновления при конфликте.
+            returning: Возвращать ли объект.
+
+        Returns:
+            Созданный или обновленный объект.
+        """
+        upserted_model = await self.repository.upsert(
+            attributes=attributes,
+            index_elements=index_elements,
+            on_conflict=on_conflict,
+            update_fields=update_fields,
+            returning=returning,
+        )
+        return upserted_model
+
+    @transactional
+    async def upsert_many(
+        self,
+        attributes: list[dict[str, Any]],
+        index_elements: list[str],
+        on_conflict: ConflictAction = ConflictAction.update,
+        update_fields: list[str] | None = None,
+        chunk_size: int = 1000,
+        returning: bool = True,
+    ) -> list[ModelType]:
+        """Создает или обновляет объекты в базе данных пачкой.
+
+        Args:
+            attributes: Атрибуты объектов.
+            index_elements: Уникальные поля, по которым определяется конфликт.
+            on_conflict: Действие при конфликте.
+            update_fields: Поля для обновления при конфликте.
+            chunk_size: Кол-во строк в одном запросе.
+            returning: Возвращать ли объекты.
+
+        Returns:
+            Созданные и обновленные объекты.
+        """
+        upserted_models = await self.repository.upsert_many(
+            attributes=attributes,
+            index_elements=index_elements,
+            on_conflict=on_conflict,
+            update_fields=update_fields,
+            chunk_size=chunk_size,
+            returning=returning,
+        )
+        return upserted_models
+
     @transactional
     async def delete(self, model: ModelType) -> ModelType:
         """Удаляет объект из базы данных.
@@ -464,6 +911,8 @@ class BaseController[ModelType](ABC):
         skip: int = 0,
         limit: int = 100,
         filter_request: FilterRequest | None = None,
+        total_count: int | None = None,
+        count_mode: CountMode | None = None,
     ) -> PaginationResponse:
         """Возвращает ответ для пагинации с численными полями.
 
@@ -472,20 +921,216 @@ class BaseController[ModelType](ABC):
             skip: Кол-во записей для пропуска.
             limit: Кол-во записей для возврата.
             filter_request: Фильтры для совпадения.
+            total_count: Уже полученное точное кол-во записей, иначе считается.
+            count_mode: Способ подсчёта, по умолчанию контроллера.
         """
-        total_count = (await self.count(filter_request=filter_request)).count
+        if total_count is None:
+            count_response = await self.count(
+                filter_request=filter_request,
+                count_mode=count_mode,
+            )
+        else:
+            count_response = CountResponse(count=total_count)
         page = skip // limit + 1 if limit > 0 else 1
         page_size = len(data)
-        total_pages = (total_count + limit - 1) // limit if limit > 0 else 1
 
         return PaginationResponse(
             data=data,
             page=page,
             page_size=page_size,
-            total_pages=total_pages,
-            total_count=total_count,
+            total_pages=self._total_pages(count_response.count, limit),
+            total_count=count_response.count,
+            count_mode=count_response.count_mode,
+        )
+
+    async def make_cursor_pagination_response(
+        self,
+        data: Sequence[ModelType],
+        limit: int,
+        sort_by: str | None = None,
+        sort_type: SortType | None = SortType.asc,
+        cursor: Cursor | None = None,
+        filter_request: FilterRequest | None = None,
+        dto_mode: DTOMode | None = None,
+        projection: list[str] | None = None,
+        count_mode: CountMode | None = None,
+    ) -> PaginationResponse:
+        """Возвращает ответ для keyset-пагинации с курсорами соседних страниц.
+
+        Args:
+            data: Страница из репозитория (до limit + 1 записей).
+            limit: Кол-во записей для возврата.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            cursor: Курсор, по которому получена страница.
+            filter_request: Фильтры для совпадения.
+            dto_mode: Маппинг ModelType в BaseModel или dict
+            projection: Поля ответа.
+            count_mode: Способ подсчёта, по умолчанию контроллера.
+
+        Notes:
+            total_count считается только на первой странице (без курсора),
+            на следующих - если count_mode передан явно: иначе каждая
+            страница платила бы за полный count.
+        """
+        if cursor is not None and count_mode is None:
+            count_mode = CountMode.none
+        backward = (
+            cursor is not None and cursor.direction == CursorDirection.prev
+        )
+        has_more = len(data) > limit
+        if has_more:
+            data = data[1:] if backward else data[:limit]
+
+        has_next = True if backward else has_more
+        has_prev = has_more if backward else cursor is not None
+
+        next_cursor = prev_cursor = None
+        if data and has_next:
+            next_cursor = self.repository.make_cursor(
+                model=data[-1],
+                sort_by=sort_by,
+                sort_type=sort_type,
+                direction=CursorDirection.next,
+            )
+        if data and has_prev:
+            prev_cursor = self.repository.make_cursor(
+                model=data[0],
+                sort_by=sort_by,
+                sort_type=sort_type,
+                direction=CursorDirection.prev,
+            )
+
+        count_response = await self.count(
+            filter_request=filter_request,
+            count_mode=count_mode,
+        )
+
+        return PaginationResponse(
+            data=self.dto(
+                value=list(data),
+                dto_mode=dto_mode,
+                projection=projection,
+            )
+            if dto_mode
+            else data,
+            page=None,
+            page_size=len(data),
+            total_pages=self._total_pages(count_response.count, limit),
+            total_count=count_response.count,
+            count_mode=count_response.count_mode,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
 
+    @staticmethod
+    def _row_dict(
+        row: Any,
+        labels: list[tuple[str, str, str | None]],
+    ) -> dict[str, Any]:
+        """Строка колонок как dict полей схемы.
+
+        Args:
+            row: Строка.
+            labels: Метки колонок с полем схемы и колонкой связи (None
+                для колонок модели).
+
+        Notes:
+            Колонки `rel.column` вкладываются в {"rel": {"column": ...}},
+            связь без значений (нет связанной записи) - None.
+        """
+        mapping = row._mapping
+        data: dict[str, Any] = {}
+        related: dict[str, dict[str, Any]] = {}
+        for key, field, column in labels:
+            if column is None:
+                data[field] = mapping[key]
+            else:
+                related.setdefault(field, {})[column] = mapping[key]
+        for field, values in related.items():
+            data[field] = (
+                None
+                if all(item is None for item in values.values())
+                else values
+            )
+        return data
+
+    def _response_scheme(
+        self,
+        projection: list[str] | None,
+    ) -> type[BaseModel]:
+        """Возвращает response_scheme, суженную до полей projection."""
+        if not projection:
+            return self.response_scheme  # type: ignore[return-value]
+        return partial_scheme(
+            self.response_scheme,
+            frozenset(
+                field.split(".")[0] for field in self._public_fields(projection)
+            ),
+        )
+
+    def _with_related(
+        self,
+        with_related: Sequence[Any] | bool | None,
+        projection: list[str] | None,
+    ) -> Sequence[Any] | bool | None:
+        """Связи для загрузки, по умолчанию - вложенные схемы response_scheme.
+
+        Загружаются связи модели, которые есть в response_scheme (и в
+        projection, если она задана): сериализация ответа не делает
+        ленивых запросов.
+        """
+        if with_related is not None:
+            return with_related
+        paths = nested_paths(self.response_scheme)
+        if projection:
+            fields = {field.split(".")[0] for field in projection}
+            paths = tuple(
+                path for path in paths if path.split(".")[0] in fields
+            )
+        return self.repository.related_paths(paths) or None
+
+    def _public_fields(self, fields: Iterable[str]) -> list[str]:
+        """Оставляет поля, которые есть в response_scheme (rel.field - по rel)."""
+        return [
+            field
+            for field in fields
+            if field.split(".")[0] in self.response_scheme.model_fields
+        ]
+
+    @staticmethod
+    def _export_value(model: ModelType, field: str) -> Any:
+        """Возвращает значение поля, в том числе связанной модели (rel.field)."""
+        value: Any = model
+        for attribute in field.split("."):
+            if value is None:
+                return None
+            value = getattr(value, attribute)
+        return value
+
+    def _use_window_count(
+        self,
+        count_mode: CountMode | None,
+        dto_mode: DTOMode | None = None,
+    ) -> bool:
+        """Можно ли получить точный total_count вместе со страницей.
+
+        В режиме rows страница читается колонками, поэтому total_count
+        считается отдельным запросом.
+        """
+        return (
+            self.pagination_strategy == PaginationStrategy.window
+            and (count_mode or self.count_mode) == CountMode.exact
+            and dto_mode != DTOMode.rows
+        )
+
+    @staticmethod
+    def _total_pages(total_count: int | None, limit: int) -> int | None:
+        """Возвращает кол-во страниц, None если кол-во записей неизвестно."""
+        if total_count is None:
+            return None
+        return (total_count + limit - 1) // limit if limit > 0 else 1
+
     def __repr__(self) -> str:
         """Возвращает строковое представление объекта.
 
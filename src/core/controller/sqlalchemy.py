@@ -5,8 +5,11 @@
 from collections.abc import Callable
 from typing import Any
 
+from loguru import logger
+
 from src.core.controller import BaseController
 from src.core.database.base import Base
+from src.core.database.instrumentation import count_statements
 
 
 class SQLAlchemyController[ModelType: Base](
@@ -20,19 +23,23 @@ class SQLAlchemyController[ModelType: Base](
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        """Метод для обработки транзакции."""
+        """Метод для обработки транзакции.
+
+        Notes:
+            Серверные значения (created_at, updated_at, server_default)
+            приходят через RETURNING (eager_defaults у Base и RETURNING в
+            пакетных запросах), поэтому refresh после коммита не нужен.
+        """
         try:
-            result = await function(self, *args, **kwargs)
-            await self.repository.session.commit()
-            if result is not None and function.__name__.lower() in [
-                "update",
-                "create",
-            ]:
-                if isinstance(result, list):
-                    for res in result:
-                        await self.repository.session.refresh(res)
-                else:
-                    await self.repository.session.refresh(result)
+            with count_statements() as counter:
+                result = await function(self, *args, **kwargs)
+                await self.repository.session.commit()
+            logger.debug(
+                "{}.{}: {} statements",
+                self.model_class.__name__,
+                function.__name__,
+                counter.count,
+            )
         except Exception as exception:
             await self.repository.session.rollback()
             raise exception
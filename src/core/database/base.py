@@ -1,9 +1,10 @@
 """Base model sqlalchemy."""
 
+from functools import cache
 from typing import Any
 
-from sqlalchemy import MetaData
-from sqlalchemy.orm import DeclarativeBase, declared_attr
+from sqlalchemy import MetaData, inspect
+from sqlalchemy.orm import DeclarativeBase, Mapper, declared_attr
 
 from src.core.database.meta import meta
 
@@ -13,6 +14,9 @@ class Base(DeclarativeBase):
 
     metadata: MetaData = meta  # type: ignore[misc]
     __abstract__: bool = True
+    # Server-generated values (created_at, updated_at, server_default) are
+    # fetched via RETURNING on flush instead of a refresh after commit.
+    __mapper_args__ = {"eager_defaults": True}
 
     @declared_attr.directive
     def __tablename__(cls) -> str:
@@ -20,7 +24,18 @@ class Base(DeclarativeBase):
         return cls.__name__.lower()
 
     def model_dump(self) -> dict[str, Any]:
-        """SQLAlchemy object to dict."""
-        result = self.__dict__
-        result.pop("_sa_instance_state", None)
-        return result
+        """SQLAlchemy object to dict.
+
+        Only loaded attributes are dumped, the instance is not changed.
+        """
+        state = self.__dict__
+        return {
+            key: state[key] for key in mapped_keys(type(self)) if key in state
+        }
+
+
+@cache
+def mapped_keys(model: type) -> tuple[str, ...]:
+    """Return mapped attribute keys (columns and relationships) of model."""
+    mapper: Mapper[Any] = inspect(model)
+    return tuple(mapper.attrs.keys())
@@ -0,0 +1,30 @@
+"""EXPLAIN statement for database."""
+
+from typing import Any
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.sql.visitors import InternalTraversal
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement.
+
+    The statement is compiled and executed by SQLAlchemy with its bind
+    parameters, so their types (e.g. JSONB) are processed for the driver
+    as in the statement itself.
+    """
+
+    inherit_cache = True
+    _traverse_internals = [
+        ("statement", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    """Compile EXPLAIN of the statement."""
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
@@ -0,0 +1,35 @@
+"""Statement timeout budgets for database."""
+
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+statement_timeout_context: ContextVar[int | None] = ContextVar(
+    "statement_timeout_context",
+    default=None,
+)
+
+
+def set_statement_timeout(milliseconds: int | None) -> None:
+    """Set statement_timeout of transactions started in the current context."""
+    statement_timeout_context.set(milliseconds)
+
+
+def _after_begin(
+    session: Session,
+    transaction: Any,
+    connection: Any,
+) -> None:
+    """Apply statement_timeout of the current context to the transaction."""
+    milliseconds = statement_timeout_context.get()
+    if milliseconds is not None:
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {int(milliseconds)}",
+        )
+
+
+def setup_statement_timeout(session_class: type[Session]) -> None:
+    """Enable statement_timeout budgets for sessions of class."""
+    event.listen(session_class, "after_begin", _after_begin)
@@ -0,0 +1,136 @@
+"""Statement instrumentation for database."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.exception.database import StatementBudgetException
+from src.core.helper.type.guard import GuardPolicy
+
+
+class StatementCounter:
+    """Counter of statements sent to the database in the current context.
+
+    Counters are nested: a statement is counted by the counter and all of
+    its parents. A counter with max_statements is a budget: a statement
+    over the budget is logged (warn) or not sent (reject).
+    """
+
+    def __init__(
+        self,
+        parent: "StatementCounter | None" = None,
+        max_statements: int | None = None,
+        policy: GuardPolicy = GuardPolicy.reject,
+    ):
+        self.parent = parent
+        self.max_statements = max_statements
+        self.policy = policy
+        self.count = 0
+        self.statements: list[str] = []
+
+    def add(self, statement: str) -> None:
+        """Count statement.
+
+        Raises:
+            StatementBudgetException: Budget with reject policy is exceeded.
+        """
+        counter: StatementCounter | None = self
+        while counter is not None:
+            counter.count += 1
+            counter.statements.append(statement)
+            counter.check(statement)
+            counter = counter.parent
+
+    def check(self, statement: str) -> None:
+        """Apply policy if the counter is over its budget."""
+        if self.max_statements is None or self.count <= self.max_statements:
+            return
+        if self.policy == GuardPolicy.reject:
+            raise StatementBudgetException(
+                f"Превышен бюджет запросов к базе данных: "
+                f"{self.count} > {self.max_statements}",
+            )
+        if self.policy == GuardPolicy.warn:
+            logger.warning(
+                "Statement budget exceeded ({} > {}): {}",
+                self.count,
+                self.max_statements,
+                statement,
+            )
+
+
+statement_counter_context: ContextVar[StatementCounter | None] = ContextVar(
+    "statement_counter_context",
+    default=None,
+)
+
+
+@contextmanager
+def count_statements(
+    max_statements: int | None = None,
+    policy: GuardPolicy = GuardPolicy.reject,
+) -> Iterator[StatementCounter]:
+    """Count statements executed inside the block.
+
+    Args:
+        max_statements: Budget of statements, None - no budget.
+        policy: What to do with statements over the budget.
+
+    Yields:
+        Statement counter.
+    """
+    counter = StatementCounter(
+        parent=statement_counter_context.get(),
+        max_statements=max_statements,
+        policy=policy,
+    )
+    token = statement_counter_context.set(counter)
+    try:
+        yield counter
+    finally:
+        statement_counter_context.reset(token)
+
+
+def set_statement_budget(
+    max_statements: int | None,
+    policy: GuardPolicy = GuardPolicy.reject,
+) -> None:
+    """Set budget of statements of the current context.
+
+    The budget is set on the current counter (e.g. the request counter of
+    StatementCounterMiddleware), a new counter is started if there is none.
+    """
+    counter = statement_counter_context.get()
+    if counter is None:
+        counter = StatementCounter()
+        statement_counter_context.set(counter)
+    counter.max_statements = max_statements
+    counter.policy = policy
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Count statement in the current counter."""
+    counter = statement_counter_context.get()
+    if counter is not None:
+        counter.add(statement)
+
+
+def setup_statement_counter(engine: AsyncEngine) -> None:
+    """Enable statement counting for engine."""
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        _before_cursor_execute,
+    )
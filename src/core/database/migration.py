@@ -0,0 +1,145 @@
+"""Alembic helpers for search and JSONB indexes.
+
+Used in migration scripts:
+
+    def upgrade() -> None:
+        create_trgm_extension()
+        create_trgm_index("user", "username")
+        add_search_vector("user", ["username", "email"])
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from src.core.database.search import (
+    DEFAULT_SEARCH_CONFIG,
+    search_vector_expression,
+)
+
+
+def create_trgm_extension() -> None:
+    """Create pg_trgm extension."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def drop_trgm_extension() -> None:
+    """Drop pg_trgm extension."""
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
+
+
+def create_trgm_index(
+    table: str,
+    column: str,
+    name: str | None = None,
+) -> None:
+    """Create GIN pg_trgm index of text column."""
+    op.create_index(
+        name or f"ix_{table}_{column}_trgm",
+        table,
+        [column],
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
+def drop_trgm_index(
+    table: str,
+    column: str,
+    name: str | None = None,
+) -> None:
+    """Drop GIN pg_trgm index of text column."""
+    op.drop_index(name or f"ix_{table}_{column}_trgm", table_name=table)
+
+
+def create_search_index(
+    table: str,
+    column: str,
+    config: str = DEFAULT_SEARCH_CONFIG,
+    name: str | None = None,
+) -> None:
+    """Create GIN index of to_tsvector(config, column).
+
+    Used by SEARCH filters on text columns without a tsvector column.
+    """
+    op.create_index(
+        name or f"ix_{table}_{column}_tsv",
+        table,
+        [sa.text(f"to_tsvector('{config}'::regconfig, \"{column}\")")],
+        postgresql_using="gin",
+    )
+
+
+def drop_search_index(
+    table: str,
+    column: str,
+    name: str | None = None,
+) -> None:
+    """Drop GIN index of to_tsvector(config, column)."""
+    op.drop_index(name or f"ix_{table}_{column}_tsv", table_name=table)
+
+
+def add_search_vector(
+    table: str,
+    columns: Sequence[str],
+    column: str = "search_vector",
+    config: str = DEFAULT_SEARCH_CONFIG,
+    name: str | None = None,
+) -> None:
+    """Add generated tsvector column over columns and its GIN index."""
+    op.add_column(
+        table,
+        sa.Column(
+            column,
+            TSVECTOR(),
+            sa.Computed(
+                search_vector_expression(columns, config),
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        name or f"ix_{table}_{column}",
+        table,
+        [column],
+        postgresql_using="gin",
+    )
+
+
+def drop_search_vector(
+    table: str,
+    column: str = "search_vector",
+    name: str | None = None,
+) -> None:
+    """Drop generated tsvector column and its GIN index."""
+    op.drop_index(name or f"ix_{table}_{column}", table_name=table)
+    op.drop_column(table, column)
+
+
+def create_jsonb_index(
+    table: str,
+    column: str,
+    name: str | None = None,
+) -> None:
+    """Create GIN jsonb_path_ops index of JSONB column.
+
+    Used by JSONB filters (@> containment and @? jsonpath).
+    """
+    op.create_index(
+        name or f"ix_{table}_{column}_jsonb",
+        table,
+        [column],
+        postgresql_using="gin",
+        postgresql_ops={column: "jsonb_path_ops"},
+    )
+
+
+def drop_jsonb_index(
+    table: str,
+    column: str,
+    name: str | None = None,
+) -> None:
+    """Drop GIN jsonb_path_ops index of JSONB column."""
+    op.drop_index(name or f"ix_{table}_{column}_jsonb", table_name=table)
@@ -2,10 +2,14 @@
 
 from typing import Any
 
+from src.core.database.base import mapped_keys
+
 
 class AsDictMixin:
     """As dict mixin."""
 
     def as_dict(self) -> dict[str, Any]:
-        """Return dict representation of object."""
-        return self.__dict__
+        """Return dict representation of object (loaded attributes only)."""
+        state = self.__dict__
+        keys = mapped_keys(type(self))  # type: ignore[arg-type]
+        return {key: state[key] for key in keys if key in state}
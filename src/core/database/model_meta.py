@@ -0,0 +1,320 @@
+"""Metadata registry of mapped models.
+
+Everything the repositories need to know about a model (columns, python
+types, value coercers, relationships) is derived once per model and cached,
+so filters and sorts do not reflect on the mapper for every call.
+"""
+
+from collections.abc import Callable
+from datetime import datetime
+from functools import cache
+from typing import Any
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    Index,
+    PrimaryKeyConstraint,
+    UniqueConstraint,
+    inspect,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import Mapper, RelationshipDirection, aliased
+from sqlalchemy.orm.util import AliasedClass
+
+from src.core.database.search import DEFAULT_SEARCH_CONFIG
+from src.core.exception.database import FieldException
+from src.core.helper.type.sort import SortKey, parse_sort_by
+
+
+class ColumnMeta:
+    """Metadata of a mapped column.
+
+    indexed - column leads a btree index (equality, ranges, sorts),
+    trgm_indexed - pg_trgm index (FUZZY, LIKE), gin_indexed - GIN index of
+    tsvector/JSONB column or to_tsvector index of text column (SEARCH).
+    """
+
+    __slots__ = (
+        "key",
+        "column",
+        "attribute",
+        "python_type",
+        "coerce",
+        "indexed",
+        "trgm_indexed",
+        "gin_indexed",
+        "sortable",
+        "tsvector",
+        "json",
+        "jsonb",
+    )
+
+    def __init__(self, model: type, key: str, column: Column[Any]):
+        self.key = key
+        self.column = column
+        self.attribute = getattr(model, key)
+        self.python_type = _python_type(column)
+        self.coerce = _make_coercer(key=key, python_type=self.python_type)
+        self.indexed = _is_indexed(column)
+        self.trgm_indexed = _is_trgm_indexed(column)
+        self.gin_indexed = _is_gin_indexed(column)
+        self.tsvector = isinstance(column.type, TSVECTOR)
+        self.json = isinstance(column.type, JSON)
+        self.jsonb = isinstance(column.type, JSONB)
+        self.sortable = (
+            self.python_type not in (dict, list) and not self.tsvector
+        )
+
+
+class RelationshipMeta:
+    """Metadata of a relationship.
+
+    alias is one aliased class of the target, shared by all filters, joins
+    and projections of the relationship.
+    """
+
+    __slots__ = ("key", "attribute", "target", "alias", "direction", "uselist")
+
+    def __init__(self, model: type, key: str):
+        self.key = key
+        self.attribute = getattr(model, key)
+        prop = self.attribute.property
+        self.target: type = prop.mapper.class_
+        self.alias: AliasedClass[Any] = aliased(self.target)
+        self.direction: RelationshipDirection = prop.direction
+        self.uselist: bool = bool(prop.uselist)
+
+
+class ModelMeta:
+    """Metadata of a mapped model.
+
+    searchable holds text columns declared in `__searchable__` and tsvector
+    columns, search_config is `__search_config__` of model. sort_orders are
+    index-backed sorts declared in `__sort_orders__` (`created_at,id`), the
+    first one is the default sort.
+    """
+
+    __slots__ = (
+        "model",
+        "columns",
+        "relationships",
+        "primary_key",
+        "searchable",
+        "search_config",
+        "sort_orders",
+    )
+
+    def __init__(self, model: type):
+        mapper: Mapper[Any] = inspect(model)
+        self.model = model
+        self.columns = {
+            attribute.key: ColumnMeta(
+                model=model,
+                key=attribute.key,
+                column=attribute.columns[0],  # type: ignore[arg-type]
+            )
+            for attribute in mapper.column_attrs
+        }
+        self.relationships = {
+            relationship.key: RelationshipMeta(
+                model=model,
+                key=relationship.key,
+            )
+            for relationship in mapper.relationships
+        }
+        self.primary_key: str = mapper.get_property_by_column(
+            mapper.primary_key[0],
+        ).key
+        self.searchable = frozenset(
+            getattr(model, "__searchable__", ()),
+        ) | {key for key, column in self.columns.items() if column.tsvector}
+        self.search_config: str = getattr(
+            model,
+            "__search_config__",
+            DEFAULT_SEARCH_CONFIG,
+        )
+        self.sort_orders: tuple[tuple[SortKey, ...], ...] = tuple(
+            tuple(parse_sort_by(order))
+            for order in getattr(model, "__sort_orders__", ())
+        )
+
+    def has_field(self, field: str) -> bool:
+        """Check that field is a column or a relationship of model."""
+        return field in self.columns or field in self.relationships
+
+    def owner(self, field: str) -> "ModelMeta":
+        """Return metadata of model owning field, `rel.column` -> target."""
+        if "." not in field:
+            return self
+        relationship = self.relationships.get(field.split(".", 1)[0])
+        if relationship is None:
+            return self
+        return get_model_meta(relationship.target)
+
+    def json_path(self, field: str) -> tuple[str, tuple[str, ...]] | None:
+        """Split field of JSONB column into column field and document path.
+
+        `data.a.b` -> ("data", ("a", "b")), `rel.data.a` -> ("rel.data",
+        ("a",)), None if field does not address a JSONB column.
+        """
+        parts = field.split(".")
+        meta: ModelMeta = self
+        size = 1
+        if parts[0] not in self.columns and len(parts) > 1:
+            relationship = self.relationships.get(parts[0])
+            if relationship is None:
+                return None
+            meta = get_model_meta(relationship.target)
+            size = 2
+        column = meta.columns.get(parts[size - 1])
+        if column is None or not column.jsonb:
+            return None
+        return ".".join(parts[:size]), tuple(parts[size:])
+
+    def is_indexed_sort(self, keys: list[SortKey]) -> bool:
+        """Check that sort can be read from an index without a full sort.
+
+        Keys match a prefix of a declared sort order (all directions same
+        or all reversed) or a single indexed column of model.
+        """
+        if len(keys) == 1 and keys[0].field in self.columns:
+            if self.columns[keys[0].field].indexed:
+                return True
+        for order in self.sort_orders:
+            if len(keys) > len(order):
+                continue
+            prefix = order[: len(keys)]
+            if [key.field for key in keys] != [key.field for key in prefix]:
+                continue
+            directions = {
+                key.sort_type == declared.sort_type
+                for key, declared in zip(keys, prefix, strict=True)
+            }
+            if len(directions) == 1:
+                return True
+        return False
+
+    def column(self, field: str) -> ColumnMeta:
+        """Return column metadata, `rel.column` is resolved via relationship.
+
+        Raises:
+            FieldException: Field is not a column of model.
+        """
+        if "." in field:
+            relationship_name, column_name = field.split(".", 1)
+            relationship = self.relationships.get(relationship_name)
+            if relationship is None:
+                raise FieldException(
+                    f"Поле '{relationship_name}' не найдено в {self.model.__name__}",
+                )
+            return get_model_meta(relationship.target).column(column_name)
+        try:
+            return self.columns[field]
+        except KeyError as exc:
+            raise FieldException(
+                f"Поле '{field}' не найдено в {self.model.__name__}",
+            ) from exc
+
+
+@cache
+def get_model_meta(model: type) -> ModelMeta:
+    """Return cached metadata of model."""
+    return ModelMeta(model)
+
+
+def _python_type(column: Column[Any]) -> type | None:
+    """Return python type of column, None if type does not define it."""
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _index_method(index: Index) -> str:
+    """Return access method of index."""
+    return index.dialect_kwargs.get("postgresql_using") or "btree"
+
+
+def _index_ops(index: Index, column: Column[Any]) -> str:
+    """Return operator class of column in index, "" if default."""
+    ops = index.dialect_kwargs.get("postgresql_ops") or {}
+    return ops.get(column.key) or ops.get(column.name) or ""
+
+
+def _column_indexes(column: Column[Any]) -> list[Index]:
+    """Return indexes of table containing column."""
+    return [
+        index
+        for index in column.table.indexes
+        if any(indexed is column for indexed in index.columns)
+    ]
+
+
+def _is_indexed(column: Column[Any]) -> bool:
+    """Check that column leads a primary key, unique constraint or btree index.
+
+    Foreign keys are not indexed by Postgres and do not count.
+    """
+    if column.index or column.unique:
+        return True
+    table = column.table
+    return any(
+        next(iter(index.columns), None) is column
+        and _index_method(index) == "btree"
+        for index in table.indexes
+    ) or any(
+        next(iter(constraint.columns), None) is column
+        for constraint in getattr(table, "constraints", ())
+        if isinstance(constraint, PrimaryKeyConstraint | UniqueConstraint)
+    )
+
+
+def _is_trgm_indexed(column: Column[Any]) -> bool:
+    """Check that column has a GIN/GiST pg_trgm index."""
+    return any(
+        _index_method(index) in ("gin", "gist")
+        and _index_ops(index, column).endswith("_trgm_ops")
+        for index in _column_indexes(column)
+    )
+
+
+def _is_gin_indexed(column: Column[Any]) -> bool:
+    """Check that column has a GIN (not trgm) or to_tsvector search index."""
+    return any(
+        _index_method(index) == "gin"
+        and not _index_ops(index, column).endswith("_trgm_ops")
+        for index in _column_indexes(column)
+    ) or any(
+        index.info.get("search") in (column.key, column.name)
+        for index in column.table.indexes
+    )
+
+
+def _make_coercer(
+    key: str,
+    python_type: type | None,
+) -> Callable[[Any], Any] | None:
+    """Return converter of filter values for column, None if not needed."""
+    if python_type is None or not issubclass(python_type, datetime):
+        return None
+
+    def coerce_datetime(value: Any) -> datetime:
+        """Parse ISO datetime."""
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise FieldException(
+                f"Некорректный формат времени для поля {key}. "
+                "Ожидается ISO формат.",
+            ) from exc
+        except TypeError as exc:
+            raise FieldException(
+                f"Некорректный тип для поля {key}: "
+                f"ожидается str, "
+                f"получено {type(value).__name__}",
+            ) from exc
+
+    return coerce_datetime
@@ -0,0 +1,96 @@
+"""Full-text, trigram and JSONB index declarations for models.
+
+Models declare searchable text columns with `__searchable__` and the
+text search configuration with `__search_config__`:
+
+    class User(Base):
+        __searchable__ = ("username", "email")
+        __table_args__ = (
+            trgm_index("ix_user_username_trgm", "username"),
+            gin_index("ix_user_search_vector", "search_vector"),
+        )
+
+        search_vector: Mapped[str] = search_vector("username", "email")
+
+SEARCH filters match tsvector columns (or to_tsvector of searchable text
+columns, indexed by `search_index`), FUZZY filters use pg_trgm similarity
+of searchable text columns.
+JSONB filters use `jsonb_index` (jsonb_path_ops).
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Computed, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import MappedColumn, mapped_column
+
+DEFAULT_SEARCH_CONFIG = "simple"
+
+
+def search_vector_expression(
+    columns: Sequence[str],
+    config: str = DEFAULT_SEARCH_CONFIG,
+) -> str:
+    """Return SQL of tsvector over columns (NULL columns are skipped)."""
+    document = " || ' ' || ".join(
+        f"coalesce(\"{column}\", '')" for column in columns
+    )
+    return f"to_tsvector('{config}'::regconfig, {document})"
+
+
+def search_vector(
+    *columns: str,
+    config: str = DEFAULT_SEARCH_CONFIG,
+) -> MappedColumn[Any]:
+    """Generated (stored) tsvector column over text columns.
+
+    The column is deferred: it is only loaded when it is requested.
+    """
+    return mapped_column(
+        TSVECTOR,
+        Computed(search_vector_expression(columns, config), persisted=True),
+        deferred=True,
+    )
+
+
+def trgm_index(name: str, column: str) -> Index:
+    """GIN pg_trgm index of text column (FUZZY, LIKE, ILIKE)."""
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
+def gin_index(name: str, column: str) -> Index:
+    """GIN index of tsvector column (SEARCH)."""
+    return Index(name, column, postgresql_using="gin")
+
+
+def search_index(
+    name: str,
+    column: str,
+    config: str = DEFAULT_SEARCH_CONFIG,
+) -> Index:
+    """GIN index of to_tsvector(config, column) (SEARCH by text column).
+
+    Declares the index of `migration.create_search_index`.
+    """
+    return Index(
+        name,
+        text(f"to_tsvector('{config}'::regconfig, \"{column}\")"),
+        postgresql_using="gin",
+        info={"search": column},
+    )
+
+
+def jsonb_index(name: str, column: str) -> Index:
+    """GIN jsonb_path_ops index of JSONB column (@>, @? filters)."""
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "jsonb_path_ops"},
+    )
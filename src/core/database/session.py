@@ -13,6 +13,8 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.expression import Delete, Insert, Update
 
+from src.core.database.guard import setup_statement_timeout
+from src.core.database.instrumentation import setup_statement_counter
 from src.core.setting import settings
 
 session_context: ContextVar[str] = ContextVar("session_context")
@@ -68,6 +70,10 @@ engines = {
     ),
 }
 
+for engine in engines.values():
+    setup_statement_counter(engine)
+setup_statement_timeout(RoutingSession)
+
 
 async_session_factory = async_sessionmaker(
     class_=AsyncSession,
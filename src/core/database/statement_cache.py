@@ -0,0 +1,52 @@
+"""LRU cache of parameterized statements."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class StatementCache:
+    """LRU cache of statements keyed by their shape.
+
+    Statements are stored with bind parameters instead of values, so one
+    entry serves every request of the same shape.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._statements: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return cached statement, None on miss."""
+        statement = self._statements.get(key)
+        if statement is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._statements.move_to_end(key)
+        return statement
+
+    def put(self, key: Hashable, statement: Any) -> None:
+        """Cache statement, evicting the least recently used one."""
+        self._statements[key] = statement
+        self._statements.move_to_end(key)
+        while len(self._statements) > self.maxsize:
+            self._statements.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all statements and reset counters."""
+        self._statements.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        """Return number of cached statements."""
+        return len(self._statements)
+
+    def __repr__(self) -> str:
+        """Return size and hit/miss counters."""
+        return (
+            f"{self.__class__.__name__}(size={len(self)}, "
+            f"maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
+        )
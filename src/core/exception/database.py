@@ -13,3 +13,43 @@ class FieldException(CustomHTTPException):
             status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
             detail=message,
         )
+
+
+class QueryGuardException(CustomHTTPException):
+    """Query is rejected by a guardrail (page size, filters, cost)."""
+
+    def __init__(self, message: str = "Запрос слишком тяжёлый."):
+        super().__init__(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=message,
+        )
+
+
+class QueryTimeoutException(CustomHTTPException):
+    """Query is cancelled by statement_timeout.
+
+    The database did not answer in time, not the client: 504, which
+    clients and proxies do not retry automatically as 408.
+    """
+
+    def __init__(
+        self,
+        message: str = "Превышено время выполнения запроса.",
+    ):
+        super().__init__(
+            status_code=HTTPStatus.GATEWAY_TIMEOUT,
+            detail=message,
+        )
+
+
+class StatementBudgetException(CustomHTTPException):
+    """Request exceeds its budget of statements (N+1 queries)."""
+
+    def __init__(
+        self,
+        message: str = "Превышен бюджет запросов к базе данных.",
+    ):
+        super().__init__(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=message,
+        )
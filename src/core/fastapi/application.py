@@ -8,6 +8,8 @@ from fastapi.responses import ORJSONResponse
 from src.core.fastapi.lifespan import lifespan
 from src.core.fastapi.middleware import LoguruMiddleware
 from src.core.fastapi.middleware.session import SessionMiddleware
+from src.core.fastapi.middleware.statement import StatementCounterMiddleware
+from src.core.helper.type.guard import GuardPolicy
 from src.core.setting import EnvironmentType, project_info, settings
 
 
@@ -53,6 +55,13 @@ def get_app() -> FastAPI:
             Middleware(
                 LoguruMiddleware,
             ),
+            Middleware(
+                StatementCounterMiddleware,
+                max_statements=settings.MAX_STATEMENTS_PER_REQUEST,
+                policy=GuardPolicy.reject
+                if settings.ENVIRONMENT == EnvironmentType.TEST
+                else GuardPolicy.warn,
+            ),
         ],
         lifespan=lifespan,
     )
@@ -2,8 +2,12 @@
 
 from .pagination import get_pagination_params
 from .sort import get_sort_params
+from .statement import StatementBudget
+from .timeout import StatementTimeout
 
 __all__ = (
     "get_pagination_params",
     "get_sort_params",
+    "StatementTimeout",
+    "StatementBudget",
 )
@@ -1,11 +1,24 @@
 """Pagination Dependency."""
 
-from src.core.helper.type.pagination import PaginationParams
+from fastapi import Query
+
+from src.core.helper.type.count import CountMode
+from src.core.helper.type.pagination import PaginationMode, PaginationParams
+from src.core.setting import settings
 
 
 def get_pagination_params(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    mode: PaginationMode = PaginationMode.offset,
+    count_mode: CountMode | None = None,
 ) -> PaginationParams:
     """Depends for pagination."""
-    return PaginationParams(skip=skip, limit=limit)
+    return PaginationParams(
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        mode=mode,
+        count_mode=count_mode,
+    )
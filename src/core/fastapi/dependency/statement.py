@@ -0,0 +1,24 @@
+"""Statement budget Dependency."""
+
+from src.core.database.instrumentation import set_statement_budget
+from src.core.helper.type.guard import GuardPolicy
+
+
+class StatementBudget:
+    """FastAPI Depends setting budget of statements of the route.
+
+    A request of the route issuing more statements is logged (warn) or
+    fails with 500 (reject) before the statement is sent.
+    """
+
+    def __init__(
+        self,
+        max_statements: int,
+        policy: GuardPolicy = GuardPolicy.reject,
+    ):
+        self.max_statements = max_statements
+        self.policy = policy
+
+    async def __call__(self) -> None:
+        """Set budget of statements for the request."""
+        set_statement_budget(self.max_statements, self.policy)
@@ -0,0 +1,18 @@
+"""Statement timeout Dependency."""
+
+from src.core.database.guard import set_statement_timeout
+
+
+class StatementTimeout:
+    """FastAPI Depends setting statement_timeout budget of the route.
+
+    Queries of the route exceeding the budget are cancelled by Postgres
+    and answered with 504.
+    """
+
+    def __init__(self, milliseconds: int):
+        self.milliseconds = milliseconds
+
+    async def __call__(self) -> None:
+        """Set statement_timeout for the request."""
+        set_statement_timeout(self.milliseconds)
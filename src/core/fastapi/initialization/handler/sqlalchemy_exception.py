@@ -1,11 +1,15 @@
 """SQLAlchemy Exception."""
 
-from asyncpg import UniqueViolationError  # type: ignore[import-untyped]
+from asyncpg import (  # type: ignore[import-untyped]
+    QueryCanceledError,
+    UniqueViolationError,
+)
 from fastapi import FastAPI, Request
 from fastapi.responses import ORJSONResponse
 from loguru import logger
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import DBAPIError, IntegrityError
 
+from src.core.exception.database import QueryTimeoutException
 from src.core.helper.scheme.response.error import ErrorResponse
 from src.core.helper.type.exception import LogSeverity
 
@@ -59,3 +63,30 @@ def init_handler_for_sqlalchemy_exception(
                 detail=detail,
             ).model_dump(),
         )
+
+    @app_.exception_handler(DBAPIError)
+    async def dbapi_exception_handler(
+        request: Request,
+        exc: DBAPIError,
+    ) -> ORJSONResponse:
+        if exc.orig is not None and isinstance(
+            exc.orig.__cause__,
+            QueryCanceledError,
+        ):
+            timeout_exc = QueryTimeoutException()
+            if loguru_logger:
+                logger.warning(repr(exc))
+            return ORJSONResponse(
+                status_code=timeout_exc.status_code,
+                content=timeout_exc.as_dict(),
+            )
+        status_code = 500
+        if loguru_logger:
+            logger.exception(repr(exc))
+        return ORJSONResponse(
+            status_code=status_code,
+            content=ErrorResponse(
+                error_code=status_code,
+                detail="Error with query to database.",
+            ).model_dump(),
+        )
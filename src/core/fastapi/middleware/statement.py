@@ -0,0 +1,53 @@
+"""Statement counter middleware."""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.database.instrumentation import count_statements
+from src.core.helper.type.guard import GuardPolicy
+
+STATEMENT_COUNT_HEADER = "X-Statement-Count"
+
+
+class StatementCounterMiddleware:
+    """Counts statements of each request.
+
+    The count is returned in the X-Statement-Count header. With
+    max_statements a request issuing more statements is logged (warn) or
+    fails (reject), e.g. to catch N+1 queries in tests. Routes set their
+    own budget with the StatementBudget dependency.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_statements: int | None = None,
+        policy: GuardPolicy = GuardPolicy.warn,
+    ) -> None:
+        self.app = app
+        self.max_statements = max_statements
+        self.policy = policy
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Count statements of the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_statements(
+            max_statements=self.max_statements,
+            policy=self.policy,
+        ) as counter:
+
+            async def send_with_count(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(STATEMENT_COUNT_HEADER, str(counter.count))
+                await send(message)
+
+            await self.app(scope, receive, send_with_count)
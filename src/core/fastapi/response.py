@@ -0,0 +1,20 @@
+"""Custom responses."""
+
+from typing import Any
+
+from fastapi.responses import Response
+
+
+class RawJSONResponse(Response):
+    """JSON response for content that is already encoded (e.g. by Postgres).
+
+    Content is sent as is, without re-encoding.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Return encoded content unchanged."""
+        if isinstance(content, str):
+            return content.encode()
+        return content
@@ -0,0 +1,5 @@
+"""Generic routes for FastAPI routers."""
+
+from .export import add_export_route
+
+__all__ = ("add_export_route",)
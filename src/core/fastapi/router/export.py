@@ -0,0 +1,42 @@
+"""Export route."""
+
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import APIRouter, Body, Depends
+from fastapi.responses import StreamingResponse
+
+from src.core.controller import BaseController
+from src.core.fastapi.dependency import get_sort_params
+from src.core.fastapi.dependency.projection import get_projection
+from src.core.helper.scheme.request.filter import FilterRequest
+from src.core.helper.type.export import ExportFormat
+from src.core.helper.type.sort import SortParams
+
+
+def add_export_route(
+    router: APIRouter,
+    get_controller: Callable[..., BaseController[Any]],
+    path: str = "/export",
+    **kwargs: Any,
+) -> None:
+    """Add streaming export route for controller model to router."""
+
+    @router.post(path=path, response_class=StreamingResponse, **kwargs)
+    async def export(
+        filter_request: FilterRequest | None = Body(default=None),
+        export_format: ExportFormat = ExportFormat.ndjson,
+        chunk_size: int = 1000,
+        projection: list[str] | None = Depends(get_projection),
+        sort_params: SortParams = Depends(get_sort_params),
+        controller: BaseController[Any] = Depends(get_controller),
+    ) -> StreamingResponse:
+        """Export objects matching filters as NDJSON or CSV stream."""
+        return await controller.export(
+            filter_request=filter_request,
+            export_format=export_format,
+            projection=projection,
+            sort_by=sort_params.sort_by,
+            sort_type=sort_params.sort_type,
+            chunk_size=chunk_size,
+        )
@@ -2,8 +2,14 @@
 
 from pydantic import BaseModel, Field
 
+from src.core.helper.type.count import CountMode
+
 
 class CountResponse(BaseModel):
     """Count response."""
 
-    count: int = Field(..., examples=[100])
+    count: int | None = Field(..., examples=[100])
+    count_mode: CountMode = Field(
+        default=CountMode.exact,
+        examples=[CountMode.exact],
+    )
@@ -2,14 +2,22 @@
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.core.helper.type.count import CountMode
+
 
 class PaginationResponse[T](BaseModel):
     """Pagination response."""
 
-    page: int = Field(..., examples=[0])
+    page: int | None = Field(..., examples=[0])
     page_size: int = Field(..., examples=[0])
-    total_pages: int = Field(..., examples=[0])
-    total_count: int = Field(..., examples=[0])
+    total_pages: int | None = Field(..., examples=[0])
+    total_count: int | None = Field(..., examples=[0])
+    count_mode: CountMode = Field(
+        default=CountMode.exact,
+        examples=[CountMode.exact],
+    )
+    next_cursor: str | None = Field(default=None, examples=[None])
+    prev_cursor: str | None = Field(default=None, examples=[None])
     data: list[T] = Field(...)
 
     model_config = ConfigDict(
@@ -0,0 +1,14 @@
+"""Types for upsert conflicts."""
+
+from enum import StrEnum
+
+
+class ConflictAction(StrEnum):
+    """Actions on a unique conflict.
+
+    nothing: ON CONFLICT DO NOTHING, the existing row is kept.
+    update: ON CONFLICT DO UPDATE SET, the existing row is overwritten.
+    """
+
+    nothing = "nothing"
+    update = "update"
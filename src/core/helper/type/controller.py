@@ -4,7 +4,13 @@ from enum import StrEnum
 
 
 class DTOMode(StrEnum):
-    """DTO Mode."""
+    """DTO Mode.
+
+    rows: columns are selected without building model instances,
+    the result is a list of dicts. Projected `rel.column` values are
+    nested as {"rel": {"column": ...}}.
+    """
 
     pydantic = "pydantic"
     dict = "dict"
+    rows = "rows"
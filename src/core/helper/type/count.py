@@ -0,0 +1,18 @@
+"""Types for counting."""
+
+from enum import StrEnum
+
+
+class CountMode(StrEnum):
+    """Count modes.
+
+    exact: count(*) over the filtered query.
+    estimated: planner row estimate from EXPLAIN.
+    capped: exact count up to a cap, the cap itself if exceeded.
+    none: do not count.
+    """
+
+    exact = "exact"
+    estimated = "estimated"
+    capped = "capped"
+    none = "none"
@@ -0,0 +1,10 @@
+"""Types for export."""
+
+from enum import StrEnum
+
+
+class ExportFormat(StrEnum):
+    """Export formats."""
+
+    ndjson = "ndjson"
+    csv = "csv"
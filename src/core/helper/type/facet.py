@@ -0,0 +1,35 @@
+"""Types for facets (unique values of columns for filters)."""
+
+from pydantic import BaseModel, Field
+
+
+class FacetColumnParams(BaseModel):
+    """Facet parameters of one column."""
+
+    max_values: int | None = Field(default=100, examples=[100])
+    with_counts: bool = Field(default=False, examples=[False])
+    prefix: str | None = Field(default=None, examples=["mar"])
+
+
+class FacetParams(BaseModel):
+    """Facet parameters.
+
+    Columns are addressed by dotted paths for related models,
+    e.g. `org.name`.
+    """
+
+    include: list[str] | None = Field(
+        default=None,
+        examples=[["username", "email"]],
+    )
+    exclude: list[str] = Field(default=[], examples=[["created_at"]])
+    default: FacetColumnParams = Field(default_factory=FacetColumnParams)
+    columns: dict[str, FacetColumnParams] = Field(default={})
+
+    def get(self, path: str) -> FacetColumnParams | None:
+        """Return parameters of column, None if column is excluded."""
+        if path in self.exclude:
+            return None
+        if self.include is not None and path not in self.include:
+            return None
+        return self.columns.get(path, self.default)
@@ -28,3 +28,7 @@ class OperatorType(StrEnum):
     CONTAINS = "CONTAINS"
     NOT_CONTAIN = "NOT_CONTAIN"
     ELEM_MATCH = "ELEM_MATCH"
+    SEARCH = "SEARCH"
+    FUZZY = "FUZZY"
+    JSON_CONTAINS = "JSON_CONTAINS"
+    HAS_KEY = "HAS_KEY"
@@ -0,0 +1,16 @@
+"""Types for query guardrails."""
+
+from enum import StrEnum
+
+
+class GuardPolicy(StrEnum):
+    """What to do with a query that breaks a guardrail.
+
+    allow: run the query.
+    warn: run the query and log a warning.
+    reject: respond with 4xx without running the query.
+    """
+
+    allow = "allow"
+    warn = "warn"
+    reject = "reject"
@@ -1,6 +1,37 @@
 """Types for pagination."""
 
-from pydantic import BaseModel
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from src.core.helper.type.count import CountMode
+from src.core.helper.type.sort import SortType
+
+
+class PaginationMode(StrEnum):
+    """Pagination modes."""
+
+    offset = "offset"
+    cursor = "cursor"
+
+
+class PaginationStrategy(StrEnum):
+    """How the total count of a page is fetched.
+
+    separate: page query and a separate count query.
+    window: one query with a count(*) OVER () column.
+    """
+
+    separate = "separate"
+    window = "window"
+
+
+class CursorDirection(StrEnum):
+    """Cursor directions."""
+
+    next = "next"
+    prev = "prev"
 
 
 class PaginationParams(BaseModel):
@@ -8,3 +39,19 @@ class PaginationParams(BaseModel):
 
     skip: int = 0
     limit: int = 100
+    cursor: str | None = None
+    mode: PaginationMode = PaginationMode.offset
+    count_mode: CountMode | None = None
+
+
+class Cursor(BaseModel):
+    """Decoded keyset pagination cursor.
+
+    Values hold the sort keys and the primary key (tie-breaker) of the
+    boundary row of the page.
+    """
+
+    sort_by: str = Field(...)
+    sort_type: SortType = Field(SortType.asc)
+    values: list[Any] = Field(...)
+    direction: CursorDirection = Field(CursorDirection.next)
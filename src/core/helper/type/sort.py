@@ -1,6 +1,7 @@
 """Types for sorting."""
 
 from enum import StrEnum
+from typing import NamedTuple
 
 from pydantic import BaseModel, Field
 
@@ -11,9 +12,40 @@ class SortType(StrEnum):
     asc = "asc"
     desc = "desc"
 
+    def reverse(self) -> "SortType":
+        """Return opposite sort type."""
+        return SortType.asc if self == SortType.desc else SortType.desc
+
+
+class SortKey(NamedTuple):
+    """Sort key: field (dotted path for related models) and direction."""
+
+    field: str
+    sort_type: SortType
+
 
 class SortParams(BaseModel):
-    """Sorting parameters."""
+    """Sorting parameters.
 
-    sort_by: str | None = Field(None, examples=["id"])
+    sort_by holds comma separated fields, `-field` is sorted opposite to
+    sort_type, e.g. `org.name,-created_at`.
+    """
+
+    sort_by: str | None = Field(None, examples=["id", "org.name,-created_at"])
     sort_type: SortType = Field(SortType.asc, examples=["asc", "desc"])
+
+
+def parse_sort_by(
+    sort_by: str,
+    sort_type: SortType | None = SortType.asc,
+) -> list[SortKey]:
+    """Parse `a,-b` into sort keys, `-` reverses sort_type."""
+    sort_type = sort_type or SortType.asc
+    keys = []
+    for field in sort_by.split(","):
+        field = field.strip()
+        if field.startswith("-"):
+            keys.append(SortKey(field[1:].strip(), sort_type.reverse()))
+        elif field:
+            keys.append(SortKey(field.removeprefix("+").strip(), sort_type))
+    return keys
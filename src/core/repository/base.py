@@ -2,25 +2,36 @@
 
 # TODO: eng lang and maybe with_related in update and update_by_filters
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
 from typing import (
     Any,
 )
 
-from src.core.exception.base import NotFoundException
-from src.core.exception.database import FieldException
+from src.core.exception.base import BadRequestException, NotFoundException
+from src.core.exception.database import FieldException, QueryGuardException
 from src.core.helper.scheme.request.filter import (
     FilterParam,
     FilterRequest,
 )
+from src.core.helper.type.conflict import ConflictAction
+from src.core.helper.type.count import CountMode
+from src.core.helper.type.facet import FacetParams
 from src.core.helper.type.filter import FilterType, OperatorType
+from src.core.helper.type.pagination import (
+    Cursor,
+    CursorDirection,
+    PaginationMode,
+)
 from src.core.helper.type.sort import SortType
+from src.core.setting import settings
+from src.core.util.cursor import encode_cursor
 
 
 class BaseRepository[ModelType, SessionType, QueryType](ABC):
     """Базовый класс для репозиториев данных."""
 
+    max_limit: int | None = settings.MAX_PAGE_LIMIT
+
     def __init__(self, model: ModelType, db_session: SessionType):
         self.session = db_session
         self.model_class = model
@@ -33,6 +44,9 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         sort_type: SortType | None = SortType.asc,
         projection: list[str] | None = None,
         with_related: Sequence[Any] | bool | None = None,
+        cursor: Cursor | None = None,
+        pagination_mode: PaginationMode = PaginationMode.offset,
+        rows: bool = False,
     ) -> list[ModelType]:
         """Возвращает список экземпляров модели.
 
@@ -43,16 +57,57 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
             sort_type: Направление сортировки.
             projection: Выборка по определённым полям.
             with_related: Указание подтягивание отношений с другими моделями.
+            cursor: Курсор для keyset-пагинации.
+            pagination_mode: Режим пагинации.
+            rows: Вернуть строки колонок вместо экземпляров модели.
+
+        Notes:
+            В режиме cursor возвращается до limit + 1 записей: лишняя
+            запись означает, что в направлении курсора есть ещё страница.
 
         Returns:
             Список экземпляров модели.
         """
-        query = self._query()
-        query = self._with_related(query=query, with_related=with_related)
-        query = self._apply_projection(query=query, projection=projection)
+        self._guard_limit(limit)
+        if not rows and pagination_mode == PaginationMode.offset:
+            query = self._page_query(
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                projection=projection,
+                with_related=with_related,
+            )
+            return await self._all(query)
+
+        if rows:
+            query = self._rows_query(
+                projection=self._rows_projection(
+                    projection=projection,
+                    sort_by=sort_by,
+                    pagination_mode=pagination_mode,
+                ),
+            )
+        else:
+            query = self._query()
+            query = self._with_related(query=query, with_related=with_related)
+            query = self._apply_projection(query=query, projection=projection)
+
+        if pagination_mode == PaginationMode.cursor:
+            return await self._all_by_cursor(
+                query=query,
+                cursor=cursor,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                limit=limit,
+                rows=rows,
+            )
+
         query = self._sort_by(query=query, sort_by=sort_by, sort_type=sort_type)
         query = self._paginate(query=query, skip=skip, limit=limit)
 
+        if rows:
+            return await self._all_rows(query)
         return await self._all(query)
 
     async def get_by(
@@ -67,6 +122,7 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         unique: bool = False,
         projection: list[str] | None = None,
         with_related: Sequence[Any] | bool | None = None,
+        rows: bool = False,
     ) -> ModelType | None | list[ModelType]:
         """Возвращает экземпляр модели, соответствующий полю и значению.
 
@@ -81,14 +137,38 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
             unique: Уникальный параметр.
             projection: Выборка по определённым полям.
             with_related: Указание подтягивание отношений с другими моделями.
+            rows: Вернуть строки колонок вместо экземпляров модели.
 
         Returns:
             Экземпляр модели.
+
+        Notes:
+            Уникальные запросы по равенству уникальной колонки (id, uuid)
+            одного тика event loop объединяются в один запрос.
         """
         self._validate_params(field)
-        query = self._query()
-        query = self._with_related(query=query, with_related=with_related)
-        query = self._apply_projection(query=query, projection=projection)
+        if (
+            unique
+            and not rows
+            and operator == OperatorType.EQUALS
+            and self._batchable(
+                field=field,
+                value=value,
+                with_related=with_related,
+            )
+        ):
+            return await self._load(
+                field=field,
+                value=value,
+                projection=projection,
+                with_related=with_related,
+            )
+        if rows:
+            query = self._rows_query(projection=projection)
+        else:
+            query = self._query()
+            query = self._with_related(query=query, with_related=with_related)
+            query = self._apply_projection(query=query, projection=projection)
         query = self._filter(
             query=query,
             filter_request=FilterRequest(
@@ -100,11 +180,16 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         )
 
         if unique:
+            if rows:
+                return await self._one_row_or_none(query)
             return await self._one_or_none(query)
 
+        self._guard_limit(limit)
         query = self._sort_by(query=query, sort_by=sort_by, sort_type=sort_type)
         query = self._paginate(query=query, skip=skip, limit=limit)
 
+        if rows:
+            return await self._all_rows(query)
         return await self._all(query)
 
     async def get_by_filters(
@@ -117,6 +202,9 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         unique: bool = False,
         projection: list[str] | None = None,
         with_related: Sequence[Any] | bool | None = None,
+        cursor: Cursor | None = None,
+        pagination_mode: PaginationMode = PaginationMode.offset,
+        rows: bool = False,
     ) -> ModelType | None | list[ModelType]:
         """Возвращает экземпляры модели, соответствующие фильтрам.
 
@@ -129,13 +217,41 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
             unique: Уникальная запись.
             projection: Выборка по определённым полям.
             with_related: Указание подтягивание отношений с другими моделями.
+            cursor: Курсор для keyset-пагинации.
+            pagination_mode: Режим пагинации.
+            rows: Вернуть строки колонок вместо экземпляров модели.
+
+        Notes:
+            В режиме cursor возвращается до limit + 1 записей (см. get_all).
 
         Returns:
             Список экземпляров модели.
         """
-        query = self._query()
-        query = self._with_related(query=query, with_related=with_related)
-        query = self._apply_projection(query=query, projection=projection)
+        self._guard_limit(limit)
+        if not unique and not rows and pagination_mode == PaginationMode.offset:
+            query = self._page_query(
+                filter_request=filter_request,
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                projection=projection,
+                with_related=with_related,
+            )
+            return await self._all(query)
+
+        if rows:
+            query = self._rows_query(
+                projection=self._rows_projection(
+                    projection=projection,
+                    sort_by=sort_by,
+                    pagination_mode=pagination_mode,
+                ),
+            )
+        else:
+            query = self._query()
+            query = self._with_related(query=query, with_related=with_related)
+            query = self._apply_projection(query=query, projection=projection)
         if filter_request is not None and len(filter_request.filters) > 0:
             for param in filter_request.filters:
                 self._validate_params(param.field)
@@ -145,7 +261,20 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         data: ModelType | None | list[ModelType]
 
         if unique:
-            data = await self._one_or_none(query)
+            data = await (
+                self._one_row_or_none(query)
+                if rows
+                else self._one_or_none(query)
+            )
+        elif pagination_mode == PaginationMode.cursor:
+            data = await self._all_by_cursor(
+                query=query,
+                cursor=cursor,
+                sort_by=sort_by,
+                sort_type=sort_type,
+                limit=limit,
+                rows=rows,
+            )
         else:
             query = self._sort_by(
                 query=query,
@@ -154,29 +283,215 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
             )
             query = self._paginate(query=query, skip=skip, limit=limit)
 
-            data = await self._all(query)
+            data = await (self._all_rows(query) if rows else self._all(query))
 
         return data
 
+    async def get_json_by_filters(
+        self,
+        filter_request: FilterRequest | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_type: SortType | None = SortType.asc,
+        projection: list[str] | None = None,
+    ) -> tuple[bytes, int]:
+        """Возвращает страницу, соответствующую фильтрам, как JSON-массив.
+
+        Args:
+            filter_request: Фильтры для совпадения.
+            skip: Количество записей для пропуска.
+            limit: Количество записей для возврата.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            projection: Выборка по определённым полям, иначе все колонки.
+
+        Notes:
+            JSON собирается базой данных, экземпляры модели не создаются.
+
+        Returns:
+            JSON-массив объектов в байтах и кол-во объектов в нём.
+        """
+        self._guard_limit(limit)
+        query = self._rows_query(projection=projection)
+        if filter_request is not None and len(filter_request.filters) > 0:
+            for param in filter_request.filters:
+                self._validate_params(param.field)
+
+            query = self._filter(query=query, filter_request=filter_request)
+        query = self._sort_by(query=query, sort_by=sort_by, sort_type=sort_type)
+        query = self._paginate(query=query, skip=skip, limit=limit)
+
+        return await self._all_json(query)
+
+    async def iter_by_filters(
+        self,
+        filter_request: FilterRequest | None = None,
+        sort_by: str | None = None,
+        sort_type: SortType | None = SortType.asc,
+        projection: list[str] | None = None,
+        with_related: Sequence[Any] | bool | None = None,
+        chunk_size: int = 1000,
+        expunge: bool = True,
+    ) -> AsyncIterator[list[ModelType]]:
+        """Итерирует экземпляры модели, соответствующие фильтрам, пачками.
+
+        Args:
+            filter_request: Фильтры для совпадения.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            projection: Выборка по определённым полям.
+            with_related: Указание подтягивание отношений с другими моделями.
+            chunk_size: Кол-во записей в одной пачке.
+            expunge: Убирать ли пачку из сессии после обработки.
+
+        Notes:
+            Результат читается серверным курсором, в памяти держится
+            только текущая пачка.
+
+        Yields:
+            Пачки экземпляров модели.
+        """
+        if chunk_size <= 0:
+            raise BadRequestException("Размер пачки должен быть больше 0")
+
+        query = self._query()
+        query = self._with_related(query=query, with_related=with_related)
+        query = self._apply_projection(query=query, projection=projection)
+        if filter_request is not None and len(filter_request.filters) > 0:
+            for param in filter_request.filters:
+                self._validate_params(param.field)
+
+            query = self._filter(query=query, filter_request=filter_request)
+        query = self._sort_by(query=query, sort_by=sort_by, sort_type=sort_type)
+
+        async for chunk in self._stream(
+            query=query,
+            chunk_size=chunk_size,
+            expunge=expunge,
+        ):
+            yield chunk
+
     async def count(
         self,
         filter_request: FilterRequest | None = None,
-    ) -> int:
+        count_mode: CountMode = CountMode.exact,
+        count_cap: int = 10_000,
+    ) -> int | None:
         """Возвращает кол-во записей, соответствующих фильтрам.
 
         Args:
             filter_request: Фильтры для совпадения.
+            count_mode: Способ подсчёта.
+            count_cap: Предел подсчёта для режима capped.
+
+        Notes:
+            В режиме capped считается не более count_cap + 1 записей:
+            результат больше count_cap означает, что записей больше предела.
 
         Returns:
-            Кол-во записей.
+            Кол-во записей, None для режима none.
         """
+        if count_mode == CountMode.none:
+            return None
+
         query = self._query()
         if filter_request is not None and len(filter_request.filters) > 0:
             for param in filter_request.filters:
                 self._validate_params(param.field)
-                # query = self._maybe_join(query=query, field=param.field)
             query = self._filter(query, filter_request)
-        return await self._count(query)
+
+        match count_mode:
+            case CountMode.estimated:
+                return await self._count_estimated(query)
+            case CountMode.capped:
+                query = self._paginate(query=query, skip=0, limit=count_cap + 1)
+                return await self._count(query)
+            case _:
+                return await self._count(query)
+
+    async def get_all_with_count(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_type: SortType | None = SortType.asc,
+        projection: list[str] | None = None,
+        with_related: Sequence[Any] | bool | None = None,
+    ) -> tuple[list[ModelType], int]:
+        """Возвращает страницу экземпляров модели и общее кол-во записей.
+
+        Args:
+            skip: Количество записей для пропуска.
+            limit: Количество записей для возврата.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            projection: Выборка по определённым полям.
+            with_related: Указание подтягивание отношений с другими моделями.
+
+        Notes:
+            Страница и кол-во получаются одним запросом (см. _all_with_count).
+
+        Returns:
+            Список экземпляров модели и кол-во записей.
+        """
+        return await self.get_by_filters_with_count(
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            sort_type=sort_type,
+            projection=projection,
+            with_related=with_related,
+        )
+
+    async def get_by_filters_with_count(
+        self,
+        filter_request: FilterRequest | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_type: SortType | None = SortType.asc,
+        projection: list[str] | None = None,
+        with_related: Sequence[Any] | bool | None = None,
+    ) -> tuple[list[ModelType], int]:
+        """Возвращает страницу по фильтрам и общее кол-во совпадений.
+
+        Args:
+            filter_request: Фильтры для совпадения.
+            skip: Количество записей для пропуска.
+            limit: Количество записей для возврата.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            projection: Выборка по определённым полям.
+            with_related: Указание подтягивание отношений с другими моделями.
+
+        Notes:
+            Запрос страницы тот же, что у get_by_filters (_page_query), к
+            нему добавляется count(*) OVER (). Если страница пуста, кол-во
+            нельзя взять из строк и оно считается отдельным запросом.
+            Пустая первая страница с limit > 0 значит, что записей нет.
+
+        Returns:
+            Список экземпляров модели и кол-во записей.
+        """
+        self._guard_limit(limit)
+        query = self._page_query(
+            filter_request=filter_request,
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            sort_type=sort_type,
+            projection=projection,
+            with_related=with_related,
+        )
+        data, total_count = await self._all_with_count(query)
+        if total_count is None:
+            total_count = (
+                await self.count(filter_request=filter_request) or 0
+                if skip > 0 or limit == 0
+                else 0
+            )
+        return data, total_count
 
     async def create(self, attributes: dict[str, Any]) -> ModelType:
         """Создает экземпляр модели.
@@ -193,6 +508,107 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         await self._create(created_model)
         return created_model
 
+    async def create_many(
+        self,
+        attributes: list[dict[str, Any]],
+        chunk_size: int = 1000,
+        returning: bool = True,
+    ) -> list[ModelType]:
+        """Создает экземпляры модели пачкой.
+
+        Args:
+            attributes: Атрибуты для создания моделей.
+            chunk_size: Кол-во строк в одном запросе.
+            returning: Возвращать ли созданные экземпляры модели.
+
+        Notes:
+            Поля валидируются один раз на всю пачку.
+
+        Returns:
+            Созданные экземпляры модели, пустой список без returning.
+        """
+        if not attributes:
+            return []
+        for field in set().union(*attributes):
+            self._validate_params(field)
+        return await self._create_many(
+            attributes=attributes,
+            chunk_size=chunk_size,
+            returning=returning,
+        )
+
+    async def upsert(
+        self,
+        attributes: dict[str, Any],
+        index_elements: list[str],
+        on_conflict: ConflictAction = ConflictAction.update,
+        update_fields: list[str] | None = None,
+        returning: bool = True,
+    ) -> ModelType | None:
+        """Создает или обновляет экземпляр модели одним запросом.
+
+        Args:
+            attributes: Атрибуты модели.
+            index_elements: Уникальные поля, по которым определяется конфликт.
+            on_conflict: Действие при конфликте.
+            update_fields: Поля для обновления при конфликте,
+                по умолчанию все переданные, кроме index_elements.
+            returning: Возвращать ли экземпляр модели.
+
+        Returns:
+            Экземпляр модели, None если строка не изменена или без returning.
+        """
+        upserted_models = await self.upsert_many(
+            attributes=[attributes],
+            index_elements=index_elements,
+            on_conflict=on_conflict,
+            update_fields=update_fields,
+            returning=returning,
+        )
+        return upserted_models[0] if upserted_models else None
+
+    async def upsert_many(
+        self,
+        attributes: list[dict[str, Any]],
+        index_elements: list[str],
+        on_conflict: ConflictAction = ConflictAction.update,
+        update_fields: list[str] | None = None,
+        chunk_size: int = 1000,
+        returning: bool = True,
+    ) -> list[ModelType]:
+        """Создает или обновляет экземпляры модели пачкой.
+
+        Args:
+            attributes: Атрибуты моделей.
+            index_elements: Уникальные поля, по которым определяется конфликт.
+            on_conflict: Действие при конфликте.
+            update_fields: Поля для обновления при конфликте,
+                по умолчанию все переданные, кроме index_elements.
+            chunk_size: Кол-во строк в одном запросе.
+            returning: Возвращать ли экземпляры модели.
+
+        Notes:
+            При on_conflict=nothing строки, попавшие в конфликт,
+            не возвращаются.
+
+        Returns:
+            Созданные и обновленные экземпляры модели.
+        """
+        if not attributes:
+            return []
+        for field in set().union(
+            *attributes, index_elements, update_fields or []
+        ):
+            self._validate_params(field)
+        return await self._upsert_many(
+            attributes=attributes,
+            index_elements=index_elements,
+            on_conflict=on_conflict,
+            update_fields=update_fields,
+            chunk_size=chunk_size,
+            returning=returning,
+        )
+
     async def update(
         self,
         model: ModelType,
@@ -204,22 +620,20 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
             model: Модель для обновления.
             attributes: Атрибуты для обновления экземпляра модели.
 
+        Notes:
+            Значения-словари сливаются с текущими значениями полей
+            по правилам deep_merge_dict.
+
         Returns:
             Обновленный экземпляр модели.
         """
         if model is None:
             raise NotFoundException("Сущность не найдена")
 
-        for field, value in attributes.items():
+        for field in attributes:
             self._validate_params(field)
-            current = getattr(model, field, None)
-            if isinstance(current, dict) and isinstance(value, dict):
-                self.deep_merge_dict(current, value)
-                setattr(model, field, current)
-            else:
-                setattr(model, field, value)
 
-        await self._update(model)
+        await self._update(model=model, attributes=attributes)
         return model
 
     async def delete(self, model: ModelType) -> ModelType:
@@ -273,21 +687,39 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         self,
         filter_request: FilterRequest | None = None,
         sort_type: SortType | None = SortType.asc,
+        facet_params: FacetParams | None = None,
     ) -> dict[str, list[Any]]:
         """Возвращает словарь уникальных значений полей модели.
 
         Args:
             filter_request: Запрос для фильтров,
             sort_type: Направление сортировки.
+            facet_params: Колонки, лимиты, частоты и поиск по префиксу.
 
         Notes:
             Фильтрует по get_by_filters и достает уникальные значения.
+            Значения каждой колонки ограничены max_values, с with_counts
+            это top-K значений по частоте вида {"value": ..., "count": ...}.
 
         Returns:
             Словарь уникальных значений.
         """
         raise NotImplementedError
 
+    def _guard_limit(self, limit: int) -> None:
+        """Проверяет размер страницы по max_limit модели.
+
+        Raises:
+            QueryGuardException: Страница без ограничения (limit=-1) или
+                больше max_limit.
+        """
+        if self.max_limit is None:
+            return
+        if limit < 0 or limit > self.max_limit:
+            raise QueryGuardException(
+                f"limit должен быть от 0 до {self.max_limit}",
+            )
+
     def deep_merge_dict(
         self,
         to: dict[str, Any],
@@ -300,14 +732,180 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
             else:
                 to[k] = v
 
+    def make_cursor(
+        self,
+        model: ModelType,
+        sort_by: str | None,
+        sort_type: SortType | None = SortType.asc,
+        direction: CursorDirection = CursorDirection.next,
+    ) -> str:
+        """Возвращает курсор, указывающий на границу страницы.
+
+        Args:
+            model: Граничная запись страницы.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            direction: Направление, в котором курсор продолжает выборку.
+
+        Returns:
+            Непрозрачный курсор.
+        """
+        sort_by = self._resolve_sort_by(sort_by)
+        return encode_cursor(
+            Cursor(
+                sort_by=sort_by,
+                sort_type=sort_type or SortType.asc,
+                values=self._cursor_values(model=model, sort_by=sort_by),
+                direction=direction,
+            ),
+        )
+
+    @abstractmethod
+    def related_paths(self, paths: Iterable[str]) -> list[str]:
+        """Оставляет пути, которые являются связями модели.
+
+        Args:
+            paths: Пути полей, `rel.nested` - связь связанной модели.
+
+        Returns:
+            Пути связей для with_related.
+        """
+        raise NotImplementedError
+
+    def _page_query(
+        self,
+        filter_request: FilterRequest | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_type: SortType | None = SortType.asc,
+        projection: list[str] | None = None,
+        with_related: Sequence[Any] | bool | None = None,
+    ) -> QueryType:
+        """Собирает запрос страницы экземпляров модели по фильтрам.
+
+        Args:
+            filter_request: Фильтры для совпадения.
+            skip: Количество записей для пропуска.
+            limit: Количество записей для возврата.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            projection: Выборка по определённым полям.
+            with_related: Указание подтягивание отношений с другими моделями.
+
+        Returns:
+            Запрос страницы.
+        """
+        query = self._query()
+        query = self._with_related(query=query, with_related=with_related)
+        query = self._apply_projection(query=query, projection=projection)
+        if filter_request is not None and len(filter_request.filters) > 0:
+            for param in filter_request.filters:
+                self._validate_params(param.field)
+
+            query = self._filter(query=query, filter_request=filter_request)
+        query = self._sort_by(query=query, sort_by=sort_by, sort_type=sort_type)
+        return self._paginate(query=query, skip=skip, limit=limit)
+
+    def _rows_projection(
+        self,
+        projection: list[str] | None,
+        sort_by: str | None,
+        pagination_mode: PaginationMode,
+    ) -> list[str] | None:
+        """Добавляет к выборке поля сортировки, нужные для курсора."""
+        if not projection or pagination_mode != PaginationMode.cursor:
+            return projection
+        return list(
+            dict.fromkeys(
+                [
+                    *projection,
+                    *self._cursor_key_names(self._resolve_sort_by(sort_by)),
+                ],
+            ),
+        )
+
+    async def _all_by_cursor(
+        self,
+        query: QueryType,
+        cursor: Cursor | None,
+        sort_by: str | None,
+        sort_type: SortType | None,
+        limit: int,
+        rows: bool = False,
+    ) -> list[ModelType]:
+        """Возвращает страницу keyset-пагинации в порядке сортировки.
+
+        Args:
+            query: Запрос.
+            cursor: Курсор, None для первой страницы.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            limit: Размер страницы.
+            rows: Вернуть строки колонок вместо экземпляров модели.
+
+        Returns:
+            До limit + 1 экземпляров модели.
+        """
+        if limit <= 0:
+            raise BadRequestException(
+                "Для пагинации по курсору limit должен быть больше 0",
+            )
+        query = self._paginate_by_cursor(
+            query=query,
+            cursor=cursor,
+            sort_by=sort_by,
+            sort_type=sort_type,
+            limit=limit,
+        )
+        data = list(
+            await (self._all_rows(query) if rows else self._all(query)),
+        )
+        if cursor is not None and cursor.direction == CursorDirection.prev:
+            data.reverse()
+        return data
+
     @abstractmethod
     async def _create(self, model: ModelType) -> None:
         """Вызов метода создания."""
         raise NotImplementedError
 
     @abstractmethod
-    async def _update(self, model: ModelType) -> None:
-        """Вызов метода обновления."""
+    async def _create_many(
+        self,
+        attributes: list[dict[str, Any]],
+        chunk_size: int,
+        returning: bool,
+    ) -> list[ModelType]:
+        """Вызов метода пакетного создания."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _upsert_many(
+        self,
+        attributes: list[dict[str, Any]],
+        index_elements: list[str],
+        on_conflict: ConflictAction,
+        update_fields: list[str] | None,
+        chunk_size: int,
+        returning: bool,
+    ) -> list[ModelType]:
+        """Вызов метода пакетного upsert."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _update(
+        self,
+        model: ModelType,
+        attributes: dict[str, Any],
+    ) -> None:
+        """Вызов метода обновления.
+
+        Args:
+            model: Модель для обновления.
+            attributes: Атрибуты для обновления, словари сливаются
+                с текущими значениями по правилам deep_merge_dict.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -334,6 +932,11 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
     ) -> QueryType:
         """Make query with related.
 
+        Args:
+            query: Запрос.
+            with_related: Опции загрузки связей, пути связей (`rel`,
+                `rel.nested`) или True - все связи модели.
+
         Returns:
             QueryType instance.
         """
@@ -356,11 +959,46 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
     ) -> QueryType:
         """Возвращает запрос, который может указать на использование связанной сущности.
 
+        Args:
+            query: Запрос.
+            field: Поле, `rel.column` - поле связанной сущности.
+
         Returns:
             Запрос со связанной сущностью.
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _batchable(
+        self,
+        field: str,
+        value: Any,
+        with_related: Sequence[Any] | bool | None,
+    ) -> bool:
+        """Можно ли загрузить запись по полю пачкой (см. _load)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _load(
+        self,
+        field: str,
+        value: Any,
+        projection: list[str] | None,
+        with_related: Sequence[Any] | bool | None,
+    ) -> ModelType | None:
+        """Загружает запись по значению уникального поля пачкой.
+
+        Args:
+            field: Уникальное поле.
+            value: Значение для совпадения.
+            projection: Выборка по определённым полям.
+            with_related: Указание подтягивание отношений с другими моделями.
+
+        Returns:
+            Экземпляр модели.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def _all(self, query: QueryType) -> list[ModelType]:
         """Возвращает все результаты запроса.
@@ -373,6 +1011,81 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _rows_query(self, projection: list[str] | None) -> QueryType:
+        """Возвращает запрос колонок модели без построения экземпляров.
+
+        Args:
+            projection: Выборка по определённым полям, иначе все колонки.
+
+        Returns:
+            Запрос колонок.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _all_rows(self, query: QueryType) -> list[Any]:
+        """Возвращает все строки запроса колонок.
+
+        Args:
+            query: Запрос для выполнения.
+
+        Returns:
+            Список строк с доступом к полям по имени.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _one_row_or_none(self, query: QueryType) -> Any | None:
+        """Возвращает одну строку запроса колонок или None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _all_json(self, query: QueryType) -> tuple[bytes, int]:
+        """Возвращает строки запроса колонок JSON-массивом, собранным в базе.
+
+        Args:
+            query: Запрос колонок для выполнения.
+
+        Returns:
+            JSON-массив объектов в байтах и кол-во объектов в нём.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _stream(
+        self,
+        query: QueryType,
+        chunk_size: int,
+        expunge: bool,
+    ) -> AsyncIterator[list[ModelType]]:
+        """Возвращает результаты запроса пачками через серверный курсор.
+
+        Args:
+            query: Запрос для выполнения.
+            chunk_size: Кол-во записей в одной пачке.
+            expunge: Убирать ли пачку из сессии после обработки.
+
+        Returns:
+            Асинхронный итератор по пачкам экземпляров модели.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _all_with_count(
+        self,
+        query: QueryType,
+    ) -> tuple[list[ModelType], int | None]:
+        """Возвращает все результаты запроса и кол-во записей без пагинации.
+
+        Args:
+            query: Запрос для выполнения.
+
+        Returns:
+            Список экземпляров модели и кол-во, None если строк нет.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def _one_or_none(self, query: QueryType) -> ModelType | None:
         """Возвращает первый результат запроса или None.
@@ -439,6 +1152,18 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def _count_estimated(self, query: QueryType) -> int:
+        """Возвращает оценку количества записей по плану запроса.
+
+        Args:
+            query: Запрос для оценки.
+
+        Returns:
+            Оценка планировщика.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _paginate(
         self,
@@ -465,63 +1190,63 @@ class BaseRepository[ModelType, SessionType, QueryType](ABC):
         sort_by: str | None,
         sort_type: SortType | None = SortType.asc,
     ) -> QueryType:
-        """Возвращает запрос, отсортированный по указанной колонке.
+        """Возвращает запрос, отсортированный по указанным колонкам.
 
         Args:
             query: Запрос для сортировки.
-            sort_by: Поле для сортировки.
+            sort_by: Поля для сортировки через запятую, `-поле` - в
+                обратном sort_type направлении, `rel.поле` - поле связи.
             sort_type: Направление сортировки.
 
+        Notes:
+            Последним ключом добавляется первичный ключ (tie-breaker).
+
         Returns:
             Отсортированный запрос.
         """
         raise NotImplementedError
 
-    def _get_deep_unique_from_dict(
-        self,
-        columns: dict[str, Any],
-    ) -> dict[str, Any] | list[dict[str, Any]]:
-        """Рекурсивно обходит словарь/список/примитив.
-
-        1) Если встретили словарь - углубляемся по ключам.
-        2) Если встретили список из словарей - собираем уникальные значения по
-            ключам, рекурсивно обрабатывая значения.
-        3) Если встретили список "простых" (или смешанных) элементов - рекурсивно
-            обрабатываем каждый элемент и сохраняем только уникальные.
-        4) Если встретили примитив (int, str, bool и т.д.) - возвращаем как есть.
-        """
-        # Если это словарь, обрабатываем по ключам
-        if isinstance(columns, dict):
-            result = {}
-            for key, value in columns.items():
-                result[key] = self._get_deep_unique_from_dict(value)
-            return result
-
-        # Если это список
-        elif isinstance(columns, list):
-            # Проверяем, что все элементы - словари
-            if all(isinstance(item, dict) for item in columns):
-                # Собираем уникальные значения по ключам
-                aggregated = defaultdict(list)
-                for item in columns:
-                    for k, v in item.items():
-                        processed_v = self._get_deep_unique_from_dict(v)
-                        if processed_v not in aggregated[k]:
-                            aggregated[k].append(processed_v)
-                return self._get_deep_unique_from_dict(aggregated)
+    @abstractmethod
+    def _paginate_by_cursor(
+        self,
+        query: QueryType,
+        cursor: Cursor | None,
+        sort_by: str | None,
+        sort_type: SortType | None = SortType.asc,
+        limit: int = 100,
+    ) -> QueryType:
+        """Возвращает запрос с keyset-пагинацией.
+
+        Args:
+            query: Запрос.
+            cursor: Курсор, None для первой страницы.
+            sort_by: Поле для сортировки.
+            sort_type: Направление сортировки.
+            limit: Размер страницы.
+
+        Notes:
+            Сортирует по полям и первичному ключу (tie-breaker), при
+            направлении prev порядок обращён. Выбирает limit + 1 записей.
+
+        Returns:
+            Запрос с условием поиска по курсору.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _resolve_sort_by(self, sort_by: str | None) -> str:
+        """Возвращает поле сортировки с учётом значения по умолчанию."""
+        raise NotImplementedError
 
-            else:
-                # Список не из одних dict (или смешанный) — рекурсивно обрабатываем каждый элемент
-                processed_list = []
-                for item in columns:
-                    processed_item = self._get_deep_unique_from_dict(item)
-                    if processed_item not in processed_list:
-                        processed_list.append(processed_item)
-                return processed_list
-
-        # Если это не список и не словарь (примитив: int, str, bool, и т.п.)
-        else:
-            return columns
+    @abstractmethod
+    def _cursor_values(self, model: ModelType, sort_by: str) -> list[Any]:
+        """Возвращает значения ключей сортировки и первичного ключа записи."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _cursor_key_names(self, sort_by: str) -> list[str]:
+        """Возвращает поля сортировки и первичный ключ (tie-breaker)."""
+        raise NotImplementedError
 
     @abstractmethod
     def _get_model_field_type(
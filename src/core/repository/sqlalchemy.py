@@ -3,39 +3,113 @@
 # ruff: noqa: D102
 # mypy: disable-error-code="type-arg,arg-type,assignment,call-overload,call-arg,attr-defined"
 # TODO: typing...
-from collections.abc import Sequence
+import asyncio
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Iterable,
+    Sequence,
+)
 from datetime import datetime
+from functools import partial
 from typing import (
     Any,
+    ClassVar,
 )
 
+import orjson
+from loguru import logger
 from sqlalchemy import (
+    CTE,
     BinaryExpression,
+    BindParameter,
+    Column,
+    Delete,
+    Integer,
+    Join,
+    Row,
     Select,
+    String,
+    Text,
+    Update,
+    all_,
     and_,
+    any_,
+    bindparam,
+    case,
+    cast,
     delete,
+    false,
     func,
+    insert,
+    inspect,
+    literal,
+    literal_column,
     not_,
     or_,
+    tuple_,
     update,
 )
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased, load_only
+from sqlalchemy.orm import (
+    aliased,
+    joinedload,
+    load_only,
+    raiseload,
+    selectinload,
+)
 from sqlalchemy.orm.relationships import RelationshipDirection
 from sqlalchemy.sql.expression import select
+from sqlalchemy.sql.util import surface_selectables
 
 from src.core.database.base import Base
+from src.core.database.explain import Explain
+from src.core.database.instrumentation import count_statements
+from src.core.database.model_meta import (
+    ModelMeta,
+    RelationshipMeta,
+    get_model_meta,
+)
+from src.core.database.statement_cache import StatementCache
 from src.core.exception.base import (
     BadRequestException,
 )
-from src.core.exception.database import FieldException
+from src.core.exception.database import FieldException, QueryGuardException
 from src.core.helper.scheme.request.filter import (
     FilterParam,
     FilterRequest,
 )
+from src.core.helper.type.conflict import ConflictAction
+from src.core.helper.type.facet import FacetColumnParams, FacetParams
 from src.core.helper.type.filter import FilterType, OperatorType
-from src.core.helper.type.sort import SortType
+from src.core.helper.type.guard import GuardPolicy
+from src.core.helper.type.pagination import Cursor, CursorDirection
+from src.core.helper.type.sort import SortKey, SortType, parse_sort_by
 from src.core.repository import BaseRepository
+from src.core.util.loader import BatchLoader
+
+JSON_OPERATORS = (
+    OperatorType.ELEM_MATCH,
+    OperatorType.JSON_CONTAINS,
+    OperatorType.HAS_KEY,
+)
+JSON_TEXT_OPERATORS = (
+    OperatorType.STARTS_WITH,
+    OperatorType.ENDS_WITH,
+    OperatorType.NOT_START_WITH,
+    OperatorType.NOT_END_WITH,
+    OperatorType.CONTAINS,
+    OperatorType.NOT_CONTAIN,
+)
+JSON_ORDER_OPERATORS = (
+    OperatorType.GREATER,
+    OperatorType.EQUALS_OR_GREATER,
+    OperatorType.LESS,
+    OperatorType.EQUALS_OR_LESS,
+)
 
 
 class SQLAlchemyRepository[
@@ -50,14 +124,307 @@ class SQLAlchemyRepository[
     model_class: type[ModelType]
     session: type[SessionType]
 
+    copy_threshold: int = 10_000
+    statement_cache: StatementCache = StatementCache()
+    unnest_threshold: int = 1000
+    facet_params: FacetParams = FacetParams()
+    facet_exclude: frozenset[str] = frozenset()
+    rows_exclude: frozenset[str] = frozenset()
+    unindexed_sort_policy: GuardPolicy = GuardPolicy.warn
+    unindexed_filter_policy: GuardPolicy = GuardPolicy.warn
+    max_query_cost: float | None = None
+    strict_loading: bool = False
+    batch_loading: bool = True
+    max_batch_size: int = 1000
+    shared_batch_loading: bool = False
+    session_factory: Callable[[], AsyncSession] | None = None
+    shared_batch_loaders: ClassVar[dict[Hashable, BatchLoader]] = {}
+
     async def _create(self, model: ModelType) -> None:
         self.session.add(model)
 
+    async def _create_many(
+        self,
+        attributes: list[dict[str, Any]],
+        chunk_size: int,
+        returning: bool,
+    ) -> list[ModelType]:
+        if not returning and len(attributes) >= self.copy_threshold:
+            for start in range(0, len(attributes), chunk_size):
+                await self._copy_many(attributes[start : start + chunk_size])
+            return []
+
+        stmt = insert(self.model_class)
+        created: list[ModelType] = []
+        for start in range(0, len(attributes), chunk_size):
+            chunk = attributes[start : start + chunk_size]
+            if returning:
+                result = await self.session.scalars(
+                    stmt.returning(self.model_class),
+                    chunk,
+                )
+                created.extend(result.all())
+            else:
+                await self.session.execute(stmt, chunk)
+        return created
+
+    async def _copy_many(self, attributes: list[dict[str, Any]]) -> None:
+        """Загружает строки через COPY (asyncpg copy_records_to_table).
+
+        Notes:
+            Python-умолчания колонок вычисляются на клиенте, SQL-умолчания
+            (например now()) - одним запросом на пачку через
+            generate_series, чтобы volatile-выражения считались на строку.
+            Колонки без значений и client-side умолчаний не передаются,
+            для них работает server_default.
+        """
+        mapper = self.model_class.__mapper__
+        table = self.model_class.__table__
+        provided = {
+            mapper.get_property(key).columns[0].key
+            for row in attributes
+            for key in row
+        }
+        columns = [
+            column
+            for column in table.columns
+            if column.key in provided or column.default is not None
+        ]
+        clause_columns = [
+            column
+            for column in columns
+            if column.key not in provided
+            and column.default is not None
+            and column.default.is_clause_element
+        ]
+
+        clause_defaults: list[Any] = []
+        if clause_columns:
+            clause_defaults = (
+                await self.session.execute(
+                    select(
+                        *(column.default.arg for column in clause_columns),
+                    ).select_from(func.generate_series(1, len(attributes))),
+                )
+            ).all()
+
+        records = []
+        for index, row in enumerate(attributes):
+            values = {
+                mapper.get_property(key).columns[0].key: value
+                for key, value in row.items()
+            }
+            record = []
+            for column in columns:
+                if column.key in values:
+                    record.append(values[column.key])
+                elif column.default is None:
+                    record.append(None)
+                elif column.default.is_clause_element:
+                    record.append(
+                        clause_defaults[index][clause_columns.index(column)],
+                    )
+                elif column.default.is_callable:
+                    record.append(column.default.arg(None))
+                else:
+                    record.append(column.default.arg)
+            records.append(tuple(record))
+
+        connection = await self.session.connection(
+            bind_arguments={"clause": insert(table)},
+        )
+        raw_connection = await connection.get_raw_connection()
+        driver_connection: Any = raw_connection.driver_connection
+        await driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=[column.name for column in columns],
+            schema_name=table.schema,
+        )
+
+    async def _upsert_many(
+        self,
+        attributes: list[dict[str, Any]],
+        index_elements: list[str],
+        on_conflict: ConflictAction,
+        update_fields: list[str] | None,
+        chunk_size: int,
+        returning: bool,
+    ) -> list[ModelType]:
+        mapper = self.model_class.__mapper__
+        conflict_columns = [
+            mapper.get_property(key).columns[0] for key in index_elements
+        ]
+        if update_fields is None:
+            update_fields = [
+                key
+                for key in dict.fromkeys(
+                    key for row in attributes for key in row
+                )
+                if key not in index_elements
+            ]
+
+        stmt = postgresql.insert(self.model_class)
+        set_: dict[str, Any] = {}
+        for key in update_fields:
+            column = mapper.get_property(key).columns[0]
+            set_[column.name] = stmt.excluded[column.key]
+        if set_:
+            for column in self.model_class.__table__.columns:
+                if column.onupdate is None or column.name in set_:
+                    continue
+                if column.onupdate.is_clause_element:
+                    set_[column.name] = column.onupdate.arg
+                elif column.onupdate.is_callable:
+                    set_[column.name] = column.onupdate.arg(None)
+                else:
+                    set_[column.name] = column.onupdate.arg
+
+        if on_conflict == ConflictAction.update and set_:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_=set_,
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+
+        upserted: list[ModelType] = []
+        for start in range(0, len(attributes), chunk_size):
+            chunk = attributes[start : start + chunk_size]
+            if returning:
+                result = await self.session.scalars(
+                    stmt.returning(self.model_class),
+                    chunk,
+                    execution_options={"populate_existing": True},
+                )
+                upserted.extend(result.all())
+            else:
+                await self.session.execute(stmt, chunk)
+        return upserted
+
     async def _update(
         self,
         model: ModelType,
+        attributes: dict[str, Any],
     ) -> None:
+        """Обновляет строку одним UPDATE ... RETURNING.
+
+        Notes:
+            Словари для JSON/JSONB колонок сливаются базой (jsonb_set, ||),
+            для остальных колонок - deep_merge_dict со значением колонки
+            (незагруженное значение сначала загружается).
+            Отношения присваиваются экземпляру и сохраняются flush.
+        """
+        values: dict[str, Any] = {}
+        for field, value in attributes.items():
+            if field not in self._meta.columns:
+                setattr(model, field, value)
+                continue
+            if isinstance(value, dict) and not self._meta.columns[field].json:
+                if field not in model.__dict__:
+                    await self.session.refresh(model, attribute_names=[field])
+                current = model.__dict__.get(field)
+                if isinstance(current, dict):
+                    self.deep_merge_dict(current, value)
+                    value = current
+            values[field] = value
+
+        # Сначала несохранённые изменения (и первичный ключ новой записи).
         await self.session.flush()
+        if not values:
+            return
+
+        primary_key = self._meta.primary_key
+        stmt = (
+            update(self.model_class)
+            .where(
+                self._meta.columns[primary_key].attribute
+                == getattr(model, primary_key),
+            )
+            .values(**self._update_values(values))
+            .returning(self.model_class)
+        )
+        await self._write(stmt)
+
+    def _update_values(self, attributes: dict[str, Any]) -> dict[str, Any]:
+        """Значения UPDATE, словари для JSON/JSONB колонок - выражения слияния.
+
+        JSON колонка сливается через приведение к JSONB и обратно.
+        """
+        values = {}
+        for field, value in attributes.items():
+            column = self._meta.columns.get(field)
+            if not isinstance(value, dict) or column is None or not column.json:
+                values[field] = value
+            elif column.jsonb:
+                values[field] = self._json_patch(column.attribute, value)
+            else:
+                values[field] = cast(
+                    self._json_patch(
+                        cast(column.attribute, postgresql.JSONB),
+                        value,
+                    ),
+                    column.column.type,
+                )
+        return values
+
+    def _json_patch(self, column: Any, patch: dict[str, Any]) -> Any:
+        """Deep-merge patch в JSONB колонку выражением на стороне базы.
+
+        Повторяет deep_merge_dict: вложенные словари сливаются, остальные
+        значения заменяются. Если значение колонки не объект, оно
+        заменяется patch. Параллельные обновления разных ключей не
+        затирают друг друга.
+        """
+        return case(
+            (
+                func.jsonb_typeof(column) == "object",
+                self._json_merge(column, column, (), patch),
+            ),
+            else_=literal(patch, postgresql.JSONB),
+        )
+
+    def _json_merge(
+        self,
+        document: Any,
+        column: Any,
+        path: tuple[str, ...],
+        patch: dict[str, Any],
+    ) -> Any:
+        """Сливает patch в document - значение column по пути path.
+
+        Не словари добавляются одним ||, словари - jsonb_set с рекурсивно
+        слитым текущим значением ключа ({} если это не объект).
+        """
+        scalars = {
+            key: value
+            for key, value in patch.items()
+            if not isinstance(value, dict)
+        }
+        if scalars:
+            document = document.op("||", return_type=postgresql.JSONB)(
+                literal(scalars, postgresql.JSONB),
+            )
+        for key, value in patch.items():
+            if not isinstance(value, dict):
+                continue
+            key_path = (*path, key)
+            current = column[key_path]
+            document = func.jsonb_set(
+                document,
+                literal([key], postgresql.ARRAY(Text)),
+                self._json_merge(
+                    case(
+                        (func.jsonb_typeof(current) == "object", current),
+                        else_=literal({}, postgresql.JSONB),
+                    ),
+                    column,
+                    key_path,
+                    value,
+                ),
+                type_=postgresql.JSONB,
+            )
+        return document
 
     async def _delete(self, model: ModelType) -> None:
         await self.session.delete(model)
@@ -75,8 +442,14 @@ class SQLAlchemyRepository[
                     field=param.field,
                     value=param.value,
                     operator=param.operator,
+                    exists=True,
                 ),
             )
+        self._guard_filters(
+            filter_request.filters,
+            filter_request.type,
+            allow_empty=False,
+        )
 
         stmt = (
             update(self.model_class)
@@ -85,13 +458,11 @@ class SQLAlchemyRepository[
                 if filter_request.type == FilterType.AND
                 else or_(*conditions),
             )
-            .values(**attributes)
+            .values(**self._update_values(attributes))
             .returning(self.model_class)
         )
 
-        select_stmt = self._query().from_statement(stmt)
-
-        return await self._all(select_stmt)
+        return await self._write(stmt)
 
     async def delete_by_filters(
         self,
@@ -101,8 +472,18 @@ class SQLAlchemyRepository[
         for param in filter_request.filters:
             self._validate_params(param.field)
             conditions.append(
-                self._get_by(param.field, param.value, param.operator),
+                self._get_by(
+                    param.field,
+                    param.value,
+                    param.operator,
+                    exists=True,
+                ),
             )
+        self._guard_filters(
+            filter_request.filters,
+            filter_request.type,
+            allow_empty=False,
+        )
 
         stmt = (
             delete(self.model_class)
@@ -114,97 +495,208 @@ class SQLAlchemyRepository[
             .returning(self.model_class)
         )
 
-        select_stmt = self._query().from_statement(stmt)
-
-        return await self._all(select_stmt)
+        return await self._write(stmt)
 
     async def get_columns_unique_values(
         self,
         filter_request: FilterRequest | None = None,
         sort_type: SortType | None = SortType.asc,
-        _depth: int = 0,
+        facet_params: FacetParams | None = None,
         _max_depth: int = 1,
     ) -> dict[str, list[Any]]:
         query = self._query()
         if filter_request is not None and len(filter_request.filters) > 0:
             for param in filter_request.filters:
-                # query = self._maybe_join(query=query, field=param.field)
                 self._validate_params(param.field)
             query = self._filter(query=query, filter_request=filter_request)
 
-        unique_values = {}
-        for field in self.model_class.__mapper__.columns.keys():
-            atr = getattr(self.model_class, field)
+        facets: list[tuple[tuple[str, ...], FacetColumnParams]] = []
+        columns: list[Any] = []
+        self._collect_facets(
+            model=self.model_class,
+            source=query.cte("facet_source"),
+            sort_type=sort_type,
+            facet_params=facet_params or self.facet_params,
+            facets=facets,
+            columns=columns,
+            path=(),
+            depth=0,
+            max_depth=_max_depth,
+        )
+        if not columns:
+            return {}
 
-            if sort_type == SortType.desc:
-                distinct_query = (
-                    query.with_only_columns(
-                        atr,
-                    )
-                    .distinct()
-                    .order_by(atr.desc())
-                )
+        with count_statements() as counter:
+            row = (await self.session.execute(select(*columns))).one()
+        logger.debug(
+            f"Facets for {self.model_class.__name__}: "
+            f"{len(columns)} column(s), {counter.count} round trip(s)",
+        )
+
+        unique_values: dict[str, Any] = {}
+        for (path, params), values in zip(facets, row, strict=True):
+            target = unique_values
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            if values is None:
+                target[path[-1]] = []
+            elif params.with_counts:
+                target[path[-1]] = [
+                    {"value": value, "count": count}
+                    for value, count in orjson.loads(values)
+                ]
             else:
-                distinct_query = (
-                    query.with_only_columns(
-                        atr,
-                    )
-                    .distinct()
-                    .order_by(atr.asc())
+                target[path[-1]] = list(values)
+
+        return unique_values
+
+    def _collect_facets(
+        self,
+        model: type[Base],
+        source: CTE,
+        sort_type: SortType | None,
+        facet_params: FacetParams,
+        facets: list[tuple[tuple[str, ...], FacetColumnParams]],
+        columns: list[Any],
+        path: tuple[str, ...],
+        depth: int,
+        max_depth: int,
+    ) -> None:
+        """Собирает подзапросы уникальных значений колонок модели.
+
+        Args:
+            model: Модель, строки которой лежат в source.
+            source: CTE со строками модели.
+            sort_type: Направление сортировки значений.
+            facet_params: Параметры фасетов.
+            facets: Пути и параметры фасетов ответа (заполняется).
+            columns: Подзапросы для общего запроса (заполняется).
+            path: Путь модели от корневой.
+            depth: Глубина модели от корневой.
+            max_depth: Максимальная глубина связанных моделей.
+
+        Notes:
+            Связанные MANYTOONE модели фильтруются по внешним ключам из
+            source подзапросом, поэтому все значения выбираются одним
+            запросом.
+        """
+        for key, column in model.__mapper__.columns.items():
+            facet_path = ".".join((*path, key))
+            params = (
+                None
+                if facet_path in self.facet_exclude
+                else facet_params.get(facet_path)
+            )
+            if params is None:
+                continue
+            facets.append(((*path, key), params))
+            columns.append(
+                self._facet_values(
+                    source_column=source.c[column.key],
+                    params=params,
+                    sort_type=sort_type,
+                ),
+            )
+
+        if depth >= max_depth:
+            return
+
+        for name, relationship in model.__mapper__.relationships.items():
+            if relationship.direction != RelationshipDirection.MANYTOONE:
+                continue
+            local_column: Column = next(iter(relationship.local_columns))
+            remote_column = next(iter(local_column.foreign_keys)).column
+            sub_model = relationship.entity.class_
+            sub_source = (
+                select(sub_model)
+                .where(
+                    getattr(
+                        sub_model,
+                        sub_model.__mapper__.get_property_by_column(
+                            remote_column,
+                        ).key,
+                    ).in_(
+                        select(source.c[local_column.key])
+                        .correlate(None)
+                        .scalar_subquery(),
+                    ),
                 )
+                .cte("_".join(("facet_source", *path, name)))
+            )
+            self._collect_facets(
+                model=sub_model,
+                source=sub_source,
+                sort_type=sort_type,
+                facet_params=facet_params,
+                facets=facets,
+                columns=columns,
+                path=(*path, name),
+                depth=depth + 1,
+                max_depth=max_depth,
+            )
 
-            result = await self.session.execute(distinct_query)
-            unique_values[field] = [row[0] for row in result.fetchall()]
-
-        # обработка связных полей
-        if _depth < _max_depth:
-            for (
-                sub_model_name,
-                sub_model,
-            ) in self.model_class.__mapper__.relationships.items():
-                if sub_model.direction == RelationshipDirection.MANYTOONE:
-                    sub_repository: SQLAlchemyRepository = SQLAlchemyRepository(
-                        model=sub_model.entity.class_,
-                        db_session=self.session,
-                    )
-                    linked_model_foreign_key = next(
-                        iter(sub_model.local_columns),
-                    ).key
-                    linked_model_ids = unique_values.get(
-                        linked_model_foreign_key,
-                    )
-                    if linked_model_ids is None:
-                        continue
-
-                    sub_filter_request = FilterRequest(
-                        filters=[
-                            FilterParam(
-                                field=next(
-                                    iter(
-                                        next(
-                                            iter(sub_model.local_columns),
-                                        ).foreign_keys,
-                                    ),
-                                ).column.key,
-                                value=linked_model_ids,
-                                operator=OperatorType.IN,
-                            ),
-                        ],
-                    )
-                    sub_unique_values = (
-                        await sub_repository.get_columns_unique_values(
-                            filter_request=sub_filter_request,
-                            _depth=_depth + 1,
-                            _max_depth=_max_depth,
-                        )
-                    )
-                    unique_values[sub_model_name] = sub_unique_values
+    def _facet_values(
+        self,
+        source_column: Any,
+        params: FacetColumnParams,
+        sort_type: SortType | None,
+    ) -> Any:
+        """Возвращает подзапрос ограниченного списка значений колонки.
+
+        Args:
+            source_column: Колонка CTE.
+            params: Параметры фасета колонки.
+            sort_type: Направление сортировки значений.
+
+        Notes:
+            С with_counts выбираются top-K значений по частоте в виде
+            json-массива пар [значение, кол-во].
 
-        if unique_values:
-            unique_values = self._get_deep_unique_from_dict(
-                columns=unique_values,
+        Returns:
+            Скалярный подзапрос.
+        """
+
+        def order(column: Any) -> Any:
+            return column.desc() if sort_type == SortType.desc else column.asc()
+
+        value = source_column.label("value")
+        if params.with_counts:
+            count = func.count().label("count")
+            values = (
+                select(value, count)
+                .group_by(source_column)
+                .order_by(count.desc(), order(value))
             )
-        return unique_values
+        else:
+            values = select(value).distinct().order_by(order(value))
+
+        if params.prefix is not None:
+            text_column = (
+                source_column
+                if isinstance(source_column.type, String)
+                else cast(source_column, Text)
+            )
+            values = values.where(
+                text_column.startswith(params.prefix, autoescape=True),
+            )
+        if params.max_values is not None:
+            values = values.limit(params.max_values)
+        values = values.subquery()
+
+        if params.with_counts:
+            aggregate = func.json_agg(
+                aggregate_order_by(
+                    func.json_build_array(values.c.value, values.c.count),
+                    values.c.count.desc(),
+                    order(values.c.value),
+                ),
+            )
+        else:
+            aggregate = func.array_agg(
+                aggregate_order_by(values.c.value, order(values.c.value)),
+            )
+
+        return select(aggregate).correlate(None).scalar_subquery()
 
     def _query(
         self,
@@ -213,20 +705,82 @@ class SQLAlchemyRepository[
 
         return query
 
+    def related_paths(self, paths: Iterable[str]) -> list[str]:
+        result = []
+        for path in paths:
+            meta = self._meta
+            for name in path.split("."):
+                relationship = meta.relationships.get(name)
+                if relationship is None:
+                    break
+                meta = get_model_meta(relationship.target)
+            else:
+                result.append(path)
+        return result
+
     def _with_related(
         self,
         query: QueryType,
-        with_related: Sequence[Any] | None = None,  # type: ignore[override]
+        with_related: Sequence[Any] | bool | None = None,
     ) -> QueryType:
-        if with_related:
-            query = query.options(*with_related)
+        """Добавляет загрузку связей.
+
+        Пути связей планируются автоматически: many-to-one/one-to-one -
+        joinedload, коллекции - selectinload (страница не умножается на
+        размер коллекции), `rel.nested` - цепочка загрузчиков. Остальные
+        элементы передаются как опции загрузки.
+
+        Notes:
+            В strict_loading незапланированные связи - raiseload: обращение
+            к ним падает сразу, а не делает неявный запрос (MissingGreenlet
+            в async сессии).
+        """
+        if with_related is True:
+            with_related = list(self._meta.relationships)
+        options = [
+            self._strict(self._loader(item)) if isinstance(item, str) else item
+            for item in with_related or ()
+        ]
+        if self.strict_loading:
+            options.append(raiseload("*"))
+        if options:
+            query = query.options(*options)
         return query
 
+    def _loader(self, path: str) -> Any:
+        """Загрузчик связи по пути `rel.nested`."""
+        meta = self._meta
+        loader: Any = None
+        for name in path.split("."):
+            relationship = meta.relationships.get(name)
+            if relationship is None:
+                raise FieldException(
+                    f"Связь '{name}' не найдена в {meta.model.__name__}",
+                )
+            strategy = selectinload if relationship.uselist else joinedload
+            loader = (
+                strategy(relationship.attribute)
+                if loader is None
+                else getattr(loader, strategy.__name__)(relationship.attribute)
+            )
+            meta = get_model_meta(relationship.target)
+        return loader
+
+    def _strict(self, loader: Any) -> Any:
+        """В strict_loading запрещает ленивую загрузку связей под loader."""
+        if self.strict_loading:
+            return loader.raiseload("*")
+        return loader
+
     def _apply_projection(
         self,
         query: QueryType,
         projection: list[str] | None,
     ) -> QueryType:
+        """Загружает только колонки projection.
+
+        Поля `rel.column` загружаются загрузчиком связи с load_only.
+        """
         if not projection:
             return query
 
@@ -234,95 +788,535 @@ class SQLAlchemyRepository[
             self._validate_params(field)
 
         columns = []
+        related: dict[str, list[Any]] = {}
         for field in projection:
+            attribute = self._meta.column(field).attribute
             if "." in field:
-                rel_name, column = field.split(".")
-                rel_model = aliased(
-                    getattr(self.model_class, rel_name).property.mapper.class_,
-                )
-                columns.append(getattr(rel_model, column))
+                related.setdefault(field.split(".")[0], []).append(attribute)
             else:
-                columns.append(getattr(self.model_class, field))
+                columns.append(attribute)
 
-        return query.options(load_only(*columns))
+        options = [
+            self._strict(
+                self._loader(name).load_only(
+                    *attributes,
+                    raiseload=self.strict_loading,
+                ),
+            )
+            for name, attributes in related.items()
+        ]
+        if columns or not options:
+            options.append(
+                load_only(*columns, raiseload=self.strict_loading),
+            )
+        return query.options(*options)
 
     def _maybe_join(
         self,
         query: QueryType,
         field: str,
     ) -> QueryType:
-        if "." in field:
-            relationship_name, column_name = field.split(".")
-            model = aliased(
-                getattr(
-                    self.model_class,
-                    relationship_name,
-                ).property.mapper.class_,
-            )
-            return query.join(model)
+        """LEFT JOIN связи many-to-one/one-to-one поля `rel.column`.
+
+        Связи-коллекции не присоединяются: фильтры по ним - EXISTS,
+        сортировка и выборка строк по ним запрещены.
+        """
+        relationship = self._field_relationship(field)
+        if relationship is None or relationship.uselist:
+            return query
+        return self._join(query, relationship.key)  # type: ignore[return-value]
 
+    def _plan_joins(self, query: Select, fields: Sequence[str]) -> Select:
+        """Присоединяет связи полей фильтров, сортировки и выборки.
+
+        Каждая связь присоединяется один раз под общим алиасом.
+        """
+        for field in dict.fromkeys(fields):
+            query = self._maybe_join(query=query, field=field)
         return query
 
+    def _field_relationship(self, field: str) -> RelationshipMeta | None:
+        """Связь поля `rel.column`, None для полей модели и JSON-путей."""
+        if "." not in field:
+            return None
+        return self._meta.relationships.get(field.split(".")[0])
+
     def _get_by[BinaryExpression](
         self,
         field: str,
         value: Any,
         operator: OperatorType = OperatorType.EQUALS,
+        exists: bool = False,
     ) -> BinaryExpression:  # type: ignore[type-var]
+        value = self._filter_value(field=field, value=value, operator=operator)
+        return self._compare(  # type: ignore[return-value]
+            field=field,
+            value=value,
+            operator=operator,
+            large=self._is_large(value, operator),
+            exists=exists,
+        )
+
+    def _filter_value(
+        self,
+        field: str,
+        value: Any,
+        operator: OperatorType,
+    ) -> Any:
+        json_field = self._json_field(field=field, operator=operator)
+        if json_field is not None:
+            return self._json_value(
+                path=json_field[1],
+                value=value,
+                operator=operator,
+            )
         if operator in [OperatorType.IN, OperatorType.NOT_IN]:
             if type(value) is not list:
                 raise BadRequestException(
                     "Для операторов IN, NOT_IN значение value должно быть списком",
                 )
-        else:
-            value = self.__convert_datetime(field, value)
+            return value
+        if operator in [OperatorType.SEARCH, OperatorType.FUZZY]:
+            self._validate_search(field, operator)
+            if type(value) is not str:
+                raise BadRequestException(
+                    "Для операторов SEARCH, FUZZY значение value должно быть строкой",
+                )
+            return value
+        return self.__convert_datetime(field, value)
 
-        if "." in field:
-            relationship_name, column_name = field.split(".")
-            model = aliased(
-                getattr(
-                    self.model_class,
-                    relationship_name,
-                ).property.mapper.class_,
+    def _compare(
+        self,
+        field: str,
+        value: Any,
+        operator: OperatorType,
+        large: bool = False,
+        exists: bool = False,
+    ) -> BinaryExpression:
+        """Условие фильтра.
+
+        Notes:
+            Поля связей-коллекций (и любых связей при exists) сравниваются
+            в EXISTS по своему алиасу, строки модели не размножаются.
+            Поля many-to-one связей сравниваются по общему алиасу, который
+            присоединяет _plan_joins.
+        """
+        relationship = self._field_relationship(field)
+        if relationship is not None and (exists or relationship.uselist):
+            alias: Any = aliased(relationship.target)
+            condition = self._compare_column(
+                field=field,
+                value=value,
+                operator=operator,
+                large=large,
+                alias=alias,
             )
-        else:
-            model = self.model_class
-            column_name = field
+            comparator = relationship.attribute.of_type(alias)
+            if relationship.uselist:
+                return comparator.any(condition)
+            return comparator.has(condition)
+        return self._compare_column(
+            field=field,
+            value=value,
+            operator=operator,
+            large=large,
+        )
+
+    def _compare_column(
+        self,
+        field: str,
+        value: Any,
+        operator: OperatorType,
+        large: bool = False,
+        alias: Any = None,
+    ) -> BinaryExpression:
+        json_field = self._json_field(field=field, operator=operator)
+        if json_field is not None:
+            return self._compare_json(
+                column=self._field_column(json_field[0], alias=alias),
+                path=json_field[1],
+                value=value,
+                operator=operator,
+            )
+        column = self._field_column(field, alias=alias)
+
+        if operator in [OperatorType.SEARCH, OperatorType.FUZZY]:
+            self._validate_search(field, operator)
 
         match operator:
             case OperatorType.IN:
-                return getattr(model, column_name).in_(value)
+                return self._in(column, value, large=large)
             case OperatorType.EQUALS:
-                return getattr(model, column_name) == value
+                return column == value
             case OperatorType.NOT_IN:
-                return not_(getattr(model, column_name).in_(value))
+                return self._in(column, value, large=large, negate=True)
             case OperatorType.NOT_EQUAL:
-                return getattr(model, column_name) != value
+                return column != value
             case OperatorType.GREATER:
-                return getattr(model, column_name) > value
+                return column > value
             case OperatorType.EQUALS_OR_GREATER:
-                return getattr(model, column_name) >= value
+                return column >= value
             case OperatorType.LESS:
-                return getattr(model, column_name) < value
+                return column < value
             case OperatorType.EQUALS_OR_LESS:
-                return getattr(model, column_name) <= value
+                return column <= value
             case OperatorType.STARTS_WITH:
-                return getattr(model, column_name).startswith(value)
+                return column.startswith(value)
             case OperatorType.ENDS_WITH:
-                return getattr(model, column_name).endswith(value)
+                return column.endswith(value)
             case OperatorType.NOT_START_WITH:
-                return not_(getattr(model, column_name).startswith(value))
+                return not_(column.startswith(value))
             case OperatorType.NOT_END_WITH:
-                return not_(getattr(model, column_name).endswith(value))
+                return not_(column.endswith(value))
             case OperatorType.CONTAINS:
-                return getattr(model, column_name).contains(value)
+                return column.contains(value)
             case OperatorType.NOT_CONTAIN:
-                return (not_(getattr(model, column_name).contains(value)),)  # type: ignore[return-value]
+                return not_(column.contains(value))
+            case OperatorType.SEARCH:
+                return self._search_vector(field, column).op("@@")(
+                    self._search_query(field, value),
+                )
+            case OperatorType.FUZZY:
+                return column.op("%")(value)
             case _:
                 raise BadRequestException(
                     f"Оператор {operator} не поддерживается",
                 )
 
+    def _json_field(
+        self,
+        field: str,
+        operator: OperatorType,
+    ) -> tuple[str, tuple[str, ...]] | None:
+        """Поле JSONB-колонки и путь в документе, None для обычных полей.
+
+        Raises:
+            BadRequestException: JSON-оператор для поля не JSONB-колонки.
+        """
+        json_path = self._meta.json_path(field)
+        if operator in JSON_OPERATORS:
+            if json_path is None:
+                raise BadRequestException(
+                    f"Оператор {operator} применим только к JSONB полям",
+                )
+            return json_path
+        if json_path is None or not json_path[1]:
+            return None
+        return json_path
+
+    def _json_value(
+        self,
+        path: tuple[str, ...],
+        value: Any,
+        operator: OperatorType,
+    ) -> Any:
+        """Значение параметра для JSONB-фильтра.
+
+        JSON_CONTAINS и ELEM_MATCH сводятся к документу для @>, HAS_KEY -
+        к jsonpath для @?. Оба оператора поддерживаются GIN индексом
+        jsonb_path_ops. Равенство и сравнения по пути - значение по пути.
+        """
+        match operator:
+            case OperatorType.HAS_KEY:
+                if type(value) is not str:
+                    raise BadRequestException(
+                        "Для оператора HAS_KEY значение value должно быть строкой",
+                    )
+                return "$" + "".join(
+                    f".{orjson.dumps(key).decode()}" for key in (*path, value)
+                )
+            case OperatorType.ELEM_MATCH:
+                if type(value) is not dict:
+                    raise BadRequestException(
+                        "Для оператора ELEM_MATCH значение value должно быть объектом",
+                    )
+                return self._json_document(path, [value])
+            case OperatorType.JSON_CONTAINS:
+                return self._json_document(path, value)
+            case _ if operator in JSON_TEXT_OPERATORS:
+                if type(value) is not str:
+                    raise BadRequestException(
+                        f"Для оператора {operator} значение value должно быть строкой",
+                    )
+                return value
+            case _ if operator in (
+                OperatorType.EQUALS,
+                OperatorType.NOT_EQUAL,
+                *JSON_ORDER_OPERATORS,
+            ):
+                return value
+            case _:
+                raise BadRequestException(
+                    f"Оператор {operator} не поддерживается для JSON-путей",
+                )
+
+    @staticmethod
+    def _json_document(path: tuple[str, ...], value: Any) -> Any:
+        """Документ с value по пути: (a, b), 1 -> {"a": {"b": 1}}."""
+        for key in reversed(path):
+            value = {key: value}
+        return value
+
+    def _compare_json(
+        self,
+        column: Any,
+        path: tuple[str, ...],
+        value: Any,
+        operator: OperatorType,
+    ) -> Any:
+        match operator:
+            case OperatorType.JSON_CONTAINS | OperatorType.ELEM_MATCH:
+                return column.contains(value)
+            case OperatorType.HAS_KEY:
+                if not isinstance(value, BindParameter):
+                    value = bindparam(None, value, type_=String)
+                return column.op("@?")(cast(value, postgresql.JSONPATH))
+            case _ if operator in (
+                OperatorType.EQUALS,
+                OperatorType.NOT_EQUAL,
+                *JSON_ORDER_OPERATORS,
+            ):
+                if not isinstance(value, BindParameter):
+                    value = bindparam(None, value, type_=postgresql.JSONB)
+                match operator:
+                    case OperatorType.EQUALS:
+                        return column[path] == value
+                    case OperatorType.NOT_EQUAL:
+                        return column[path] != value
+                    case OperatorType.GREATER:
+                        return column[path] > value
+                    case OperatorType.EQUALS_OR_GREATER:
+                        return column[path] >= value
+                    case OperatorType.LESS:
+                        return column[path] < value
+                    case _:
+                        return column[path] <= value
+            case OperatorType.STARTS_WITH:
+                return column[path].astext.startswith(value)
+            case OperatorType.ENDS_WITH:
+                return column[path].astext.endswith(value)
+            case OperatorType.NOT_START_WITH:
+                return not_(column[path].astext.startswith(value))
+            case OperatorType.NOT_END_WITH:
+                return not_(column[path].astext.endswith(value))
+            case OperatorType.CONTAINS:
+                return column[path].astext.contains(value)
+            case OperatorType.NOT_CONTAIN:
+                return not_(column[path].astext.contains(value))
+            case _:
+                raise BadRequestException(
+                    f"Оператор {operator} не поддерживается для JSON-путей",
+                )
+
+    def _field_column(self, field: str, alias: Any = None) -> Any:
+        """Колонка поля, `rel.column` - колонка алиаса отношения.
+
+        По умолчанию берётся общий алиас связи (см. _plan_joins).
+        """
+        if "." in field:
+            relationship_name, column_name = field.split(".")
+            return getattr(
+                alias or self._meta.relationships[relationship_name].alias,
+                column_name,
+            )
+        return getattr(self.model_class, field)
+
+    def _validate_search(self, field: str, operator: OperatorType) -> None:
+        meta = self._meta.owner(field)
+        if field.rsplit(".", 1)[-1] not in meta.searchable:
+            raise BadRequestException(
+                f"Поле {field} не поддерживает поиск",
+            )
+        # Сходство pg_trgm определено только для текста, не для tsvector.
+        column = self._meta.column(field)
+        if operator == OperatorType.FUZZY and (
+            column.tsvector or column.python_type is not str
+        ):
+            raise BadRequestException(
+                f"Нечёткий поиск по полю {field} недоступен: поле не текстовое",
+            )
+
+    def _search_vector(self, field: str, column: Any) -> Any:
+        """Tsvector колонки: tsvector-колонка как есть, текст - to_tsvector.
+
+        Конфигурация подставляется литералом, чтобы выражение совпадало
+        с индексом to_tsvector('config', column).
+        """
+        if self._meta.column(field).tsvector:
+            return column
+        config = self._meta.owner(field).search_config
+        return func.to_tsvector(
+            literal_column(f"'{config}'::regconfig"), column
+        )
+
+    def _search_query(self, field: str, value: Any) -> Any:
+        config = self._meta.owner(field).search_config
+        return func.websearch_to_tsquery(
+            literal_column(f"'{config}'::regconfig"),
+            value,
+        )
+
+    def _search_rank(
+        self,
+        filters: list[FilterParam],
+        binds: list[Any],
+    ) -> Any | None:
+        """Релевантность строки по SEARCH (ts_rank) и FUZZY (similarity).
+
+        Returns:
+            Сумма рангов, None если поисковых фильтров нет.
+        """
+        ranks = []
+        for param, value in zip(filters, binds, strict=True):
+            if not self._is_ranked(param):
+                continue
+            column = self._field_column(param.field)
+            if param.operator == OperatorType.SEARCH:
+                ranks.append(
+                    func.ts_rank(
+                        self._search_vector(param.field, column),
+                        self._search_query(param.field, value),
+                    ),
+                )
+            else:
+                ranks.append(func.similarity(column, value))
+        if not ranks:
+            return None
+        rank = ranks[0]
+        for other in ranks[1:]:
+            rank = rank + other
+        return rank
+
+    def _is_ranked(self, param: FilterParam) -> bool:
+        """Учитывается ли фильтр в релевантности (SEARCH/FUZZY не по коллекции)."""
+        if param.operator not in [OperatorType.SEARCH, OperatorType.FUZZY]:
+            return False
+        relationship = self._field_relationship(param.field)
+        return relationship is None or not relationship.uselist
+
+    def _guard_filters(
+        self,
+        filters: list[FilterParam],
+        filter_type: FilterType,
+        allow_empty: bool = True,
+    ) -> None:
+        """Проверяет, что фильтры могут использовать индекс.
+
+        Notes:
+            Для AND достаточно одного фильтра по индексированной колонке,
+            для OR индексированными должны быть все. Иначе применяется
+            unindexed_filter_policy. Без фильтров (allow_empty=False для
+            массовых UPDATE/DELETE) - тоже.
+        """
+        if self.unindexed_filter_policy == GuardPolicy.allow:
+            return
+        if not filters:
+            if allow_empty:
+                return
+            if self.unindexed_filter_policy == GuardPolicy.reject:
+                raise QueryGuardException(
+                    "Массовое изменение без фильтров запрещено",
+                )
+            logger.warning(
+                "Bulk statement without filters of {}",
+                self.model_class.__name__,
+            )
+            return
+        indexed = [self._is_indexed_filter(param) for param in filters]
+        if any(indexed) if filter_type == FilterType.AND else all(indexed):
+            return
+        fields = ", ".join(
+            param.field
+            for param, is_indexed in zip(filters, indexed, strict=True)
+            if not is_indexed
+        )
+        if self.unindexed_filter_policy == GuardPolicy.reject:
+            raise QueryGuardException(
+                f"Фильтр по неиндексированным полям {fields} запрещён",
+            )
+        logger.warning(
+            "Unindexed filter {} of {}",
+            fields,
+            self.model_class.__name__,
+        )
+
+    def _is_indexed_filter(self, param: FilterParam) -> bool:
+        """Может ли фильтр использовать индекс колонки.
+
+        Notes:
+            SEARCH - GIN (tsvector, to_tsvector), FUZZY и LIKE по
+            подстроке - pg_trgm, JSON-операторы (@>, @?) - GIN, равенство и
+            диапазоны - btree. Отрицания (NOT_*) и сравнения по JSON-пути
+            индекс не используют.
+        """
+        json_field = self._meta.json_path(param.field)
+        field = json_field[0] if json_field is not None else param.field
+        if not self._has_field(field.split(".")[0]):
+            return False
+        try:
+            column = self._meta.column(field)
+        except FieldException:
+            return False
+        if json_field is not None and (
+            json_field[1] or param.operator in JSON_OPERATORS
+        ):
+            return column.gin_indexed and param.operator in JSON_OPERATORS
+        match param.operator:
+            case OperatorType.SEARCH:
+                return column.gin_indexed
+            case (
+                OperatorType.FUZZY
+                | OperatorType.CONTAINS
+                | OperatorType.ENDS_WITH
+            ):
+                return column.trgm_indexed
+            case OperatorType.STARTS_WITH:
+                return column.trgm_indexed or column.indexed
+            case (
+                OperatorType.EQUALS
+                | OperatorType.IN
+                | OperatorType.GREATER
+                | OperatorType.EQUALS_OR_GREATER
+                | OperatorType.LESS
+                | OperatorType.EQUALS_OR_LESS
+            ):
+                return column.indexed
+            case _:
+                return False
+
+    def _is_large(self, value: Any, operator: OperatorType) -> bool:
+        return (
+            operator in [OperatorType.IN, OperatorType.NOT_IN]
+            and len(value) >= self.unnest_threshold
+        )
+
+    def _in(
+        self,
+        column: Any,
+        value: Any,
+        large: bool = False,
+        negate: bool = False,
+    ) -> Any:
+        """IN одним параметром-массивом.
+
+        Списки меньше unnest_threshold сравниваются через = ANY(:array),
+        большие - через IN (SELECT unnest(:array)): такой запрос
+        планировщик выполняет хешированным semi-join, а не просмотром
+        массива для каждой строки.
+        """
+        array = self._array(column, value)
+        if large:
+            clause = column.in_(select(func.unnest(array)).scalar_subquery())
+            return not_(clause) if negate else clause
+        return column != all_(array) if negate else column == any_(array)
+
+    @staticmethod
+    def _array(column: Any, value: Any) -> BindParameter:
+        """Список одним параметром-массивом типа колонки (= ANY(:array))."""
+        if isinstance(value, BindParameter):
+            return value
+        return bindparam(None, value, type_=postgresql.ARRAY(column.type))
+
     def _filter(
         self,
         query: Select,
@@ -337,6 +1331,11 @@ class SQLAlchemyRepository[
                     operator=param.operator,
                 ),
             )
+        self._guard_filters(filter_request.filters, filter_request.type)
+        query = self._plan_joins(
+            query,
+            [param.field for param in filter_request.filters],
+        )
 
         match filter_request.type:
             case FilterType.OR:
@@ -350,6 +1349,138 @@ class SQLAlchemyRepository[
 
         return query
 
+    def _page_query(
+        self,
+        filter_request: FilterRequest | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_type: SortType | None = SortType.asc,
+        projection: list[str] | None = None,
+        with_related: Sequence[Any] | bool | None = None,
+    ) -> Select:
+        """Запрос страницы с именованными параметрами, кэшируется по форме.
+
+        Notes:
+            Без sort_by страница с SEARCH/FUZZY фильтрами сортируется по
+            релевантности (ts_rank, similarity).
+        """
+        filters = filter_request.filters if filter_request is not None else []
+        filter_type = (
+            filter_request.type
+            if filter_request is not None
+            else FilterType.AND
+        )
+        for param in filters:
+            self._validate_params(param.field)
+        values = {
+            f"filter_{index}": self._filter_value(
+                field=param.field,
+                value=param.value,
+                operator=param.operator,
+            )
+            for index, param in enumerate(filters)
+        }
+        # Проверки выполняются при каждом вызове, а не только при сборке.
+        self._guard_filters(filters, filter_type)
+        sort_keys = (
+            None
+            if sort_by is None and any(map(self._is_ranked, filters))
+            else self._sort_keys(sort_by=sort_by, sort_type=sort_type)
+        )
+        if limit > -1:
+            values["skip"] = skip
+            values["limit"] = limit
+
+        # Опции загрузчиков не хешируются, такие запросы не кэшируются,
+        # пути связей - кэшируются.
+        cacheable = isinstance(with_related, bool | None) or all(
+            isinstance(item, str) for item in with_related
+        )
+        # Запрос зависит и от класса репозитория (_query), и от модели:
+        # один класс может работать с разными model.
+        key = (
+            type(self),
+            self.model_class,
+            tuple(
+                (
+                    param.field,
+                    param.operator,
+                    self._is_large(values[f"filter_{index}"], param.operator),
+                )
+                for index, param in enumerate(filters)
+            ),
+            filter_type if filters else None,
+            sort_by,
+            sort_type,
+            tuple(projection or ()),
+            limit > -1,
+            bool(with_related)
+            if isinstance(with_related, bool | None)
+            else tuple(with_related),
+            self.strict_loading,
+        )
+        query = self.statement_cache.get(key) if cacheable else None
+        if query is None:
+            query = self._query()
+            query = self._with_related(query=query, with_related=with_related)
+            query = self._apply_projection(query=query, projection=projection)
+            query = self._plan_joins(query, [param.field for param in filters])
+            binds = [
+                self._bind(name=f"filter_{index}", param=param)
+                for index, param in enumerate(filters)
+            ]
+            if filters:
+                conditions = [
+                    self._compare(
+                        field=param.field,
+                        value=bind,
+                        operator=param.operator,
+                        large=self._is_large(
+                            values[f"filter_{index}"],
+                            param.operator,
+                        ),
+                    )
+                    for index, (param, bind) in enumerate(
+                        zip(filters, binds, strict=True),
+                    )
+                ]
+                query = query.where(
+                    or_(*conditions)
+                    if filter_type == FilterType.OR
+                    else and_(*conditions),
+                )
+            if sort_keys is None:
+                query = query.order_by(
+                    self._search_rank(filters=filters, binds=binds).desc(),  # type: ignore[union-attr]
+                    self._meta.columns[self._meta.primary_key].attribute,
+                )
+            else:
+                query = self._order_by(query=query, keys=sort_keys)
+            if limit > -1:
+                query = query.offset(bindparam("skip", type_=Integer)).limit(
+                    bindparam("limit", type_=Integer),
+                )
+            if cacheable:
+                self.statement_cache.put(key, query)
+
+        return query.params(values)
+
+    def _bind(self, name: str, param: FilterParam) -> BindParameter:
+        if self._json_field(field=param.field, operator=param.operator):
+            if (
+                param.operator in JSON_TEXT_OPERATORS
+                or param.operator == OperatorType.HAS_KEY
+            ):
+                return bindparam(name, type_=String)
+            return bindparam(name, type_=postgresql.JSONB)
+        column = self._meta.column(param.field).column
+        if param.operator in [OperatorType.IN, OperatorType.NOT_IN]:
+            return bindparam(name, type_=postgresql.ARRAY(column.type))
+        if param.operator in [OperatorType.SEARCH, OperatorType.FUZZY]:
+            return bindparam(name, type_=String)
+        return bindparam(name, type_=column.type)
+
     def _paginate(
         self,
         query: Select,
@@ -366,29 +1497,506 @@ class SQLAlchemyRepository[
         sort_by: str | None = None,
         sort_type: SortType | None = SortType.asc,
     ) -> Select:
-        if sort_by is None:
-            if hasattr(self.model_class, "updated_at"):
-                sort_by = "updated_at"
+        return self._order_by(
+            query=query,
+            keys=self._sort_keys(sort_by=sort_by, sort_type=sort_type),
+        )
+
+    def _order_by(self, query: Select, keys: list[SortKey]) -> Select:
+        """Сортировка по keys.
+
+        Notes:
+            NULL идут последними при asc и первыми при desc (как в
+            Postgres по умолчанию), для nullable полей это задаётся явно:
+            на этот порядок опирается _seek.
+        """
+        query = self._plan_joins(query, [key.field for key in keys])
+        order = []
+        for key in keys:
+            column = self._field_column(key.field)
+            if key.sort_type == SortType.desc:
+                column = column.desc()
+                if self._is_nullable(key.field):
+                    column = column.nulls_first()
             else:
-                return query
-        self._validate_params(sort_by)
+                column = column.asc()
+                if self._is_nullable(key.field):
+                    column = column.nulls_last()
+            order.append(column)
+        return query.order_by(*order)
+
+    def _is_nullable(self, field: str) -> bool:
+        """Может ли поле быть NULL, `rel.column` - всегда (LEFT JOIN)."""
+        return "." in field or bool(self._meta.column(field).column.nullable)
+
+    def _sort_keys(
+        self,
+        sort_by: str | None,
+        sort_type: SortType | None = SortType.asc,
+        check_index: bool = True,
+    ) -> list[SortKey]:
+        """Ключи сортировки с первичным ключом в конце (tie-breaker).
+
+        Notes:
+            С check_index сортировка проверяется по индексированным
+            колонкам и `__sort_orders__` модели, при несовпадении
+            применяется unindexed_sort_policy.
+        """
+        keys = parse_sort_by(self._resolve_sort_by(sort_by), sort_type)
+        if not keys:
+            raise BadRequestException("Не указаны поля для сортировки")
+        for key in keys:
+            self._validate_sort_field(key.field)
+        if len({key.field for key in keys}) != len(keys):
+            raise BadRequestException("Поля сортировки повторяются")
+
+        if check_index and not self._meta.is_indexed_sort(keys):
+            self._unindexed_sort(keys)
 
+        primary_key = self._meta.primary_key
+        if primary_key not in (key.field for key in keys):
+            keys.append(SortKey(primary_key, keys[-1].sort_type))
+        return keys
+
+    def _validate_sort_field(self, field: str) -> None:
+        self._validate_params(field)
+        if "." in field:
+            relationship = self._meta.relationships.get(field.split(".")[0])
+            if relationship is not None and relationship.uselist:
+                raise BadRequestException(
+                    f"Сортировка по полю {field} связи один-ко-многим "
+                    "не поддерживается",
+                )
         try:
-            order_column = getattr(self.model_class, sort_by)
-        except AttributeError as exc:
+            column = self._meta.column(field)
+        except FieldException as exc:
             raise BadRequestException(
-                f"Поля {sort_by} нет в полях сущности {self.model_class.__name__}",
+                f"Поля {field} нет в полях сущности {self.model_class.__name__}",
             ) from exc
+        if not column.sortable:
+            raise BadRequestException(f"Сортировка по полю {field} недоступна")
+
+    def _unindexed_sort(self, keys: list[SortKey]) -> None:
+        sort_by = ",".join(f"{key.field} {key.sort_type}" for key in keys)
+        match self.unindexed_sort_policy:
+            case GuardPolicy.reject:
+                raise BadRequestException(
+                    f"Сортировка {sort_by} не поддерживается индексом",
+                )
+            case GuardPolicy.warn:
+                logger.warning(
+                    "Unindexed sort {} of {}",
+                    sort_by,
+                    self.model_class.__name__,
+                )
+
+    def _join(self, query: Select, relationship_name: str) -> Select:
+        """LEFT JOIN алиаса отношения, если его ещё нет в запросе."""
+        relationship = self._meta.relationships[relationship_name]
+        selectable = inspect(relationship.alias).selectable
+        for from_clause in query.get_final_froms():
+            if not isinstance(from_clause, Join):
+                continue
+            nested = surface_selectables(from_clause)  # type: ignore[no-untyped-call]
+            if selectable in nested:
+                return query
+        return query.outerjoin(
+            relationship.attribute.of_type(relationship.alias),
+        )
+
+    def _paginate_by_cursor(
+        self,
+        query: Select,
+        cursor: Cursor | None,
+        sort_by: str | None,
+        sort_type: SortType | None = SortType.asc,
+        limit: int = 100,
+    ) -> Select:
+        sort_by = self._resolve_sort_by(sort_by)
+        sort_type = sort_type or SortType.asc
+        keys = self._sort_keys(sort_by=sort_by, sort_type=sort_type)
+
+        if cursor is not None:
+            if cursor.sort_by != sort_by or cursor.sort_type != sort_type:
+                raise BadRequestException(
+                    "Курсор не соответствует параметрам сортировки",
+                )
+            if len(cursor.values) != len(keys):
+                raise BadRequestException("Некорректный курсор пагинации")
+
+            if cursor.direction == CursorDirection.prev:
+                keys = [
+                    SortKey(key.field, key.sort_type.reverse()) for key in keys
+                ]
+
+        query = self._order_by(query=query, keys=keys)
+
+        if cursor is not None:
+            values = [
+                None
+                if value is None
+                else self.__convert_datetime(key.field, value)
+                for key, value in zip(keys, cursor.values, strict=True)
+            ]
+            query = query.where(self._seek(keys=keys, values=values))
 
+        return query.limit(limit + 1)
+
+    def _seek(self, keys: list[SortKey], values: list[Any]) -> Any:
+        """Условие строк после курсора в порядке keys.
+
+        Одинаковые направления без NULL - сравнение кортежей (читается
+        индексом), иначе - (a > x) OR (a = x AND b < y) ... с учётом
+        положения NULL (см. _order_by).
+        """
+        columns = [self._field_column(key.field) for key in keys]
+        nullable = [self._is_nullable(key.field) for key in keys]
+        if (
+            len({key.sort_type for key in keys}) == 1
+            and not any(nullable)
+            and None not in values
+        ):
+            left, right = (
+                (tuple_(*columns), tuple(values))
+                if len(keys) > 1
+                else (columns[0], values[0])
+            )
+            return (
+                left < right
+                if keys[0].sort_type == SortType.desc
+                else left > right
+            )
+        conditions = []
+        for index, key in enumerate(keys):
+            conditions.append(
+                and_(
+                    *(
+                        # None - IS NULL.
+                        columns[previous] == values[previous]
+                        for previous in range(index)
+                    ),
+                    self._after(
+                        column=columns[index],
+                        value=values[index],
+                        sort_type=key.sort_type,
+                        nullable=nullable[index],
+                    ),
+                ),
+            )
+        return or_(*conditions)
+
+    @staticmethod
+    def _after(
+        column: Any,
+        value: Any,
+        sort_type: SortType,
+        nullable: bool,
+    ) -> Any:
+        """Условие значений column строго после value.
+
+        NULL последние при asc и первые при desc.
+        """
         if sort_type == SortType.desc:
-            return query.order_by(order_column.desc())
+            return column.is_not(None) if value is None else column < value
+        if value is None:
+            return false()
+        return (
+            or_(column > value, column.is_(None))
+            if nullable
+            else column > value
+        )
 
-        return query.order_by(order_column.asc())
+    def _resolve_sort_by(self, sort_by: str | None) -> str:
+        if sort_by is not None:
+            return sort_by
+        if self._meta.sort_orders:
+            return ",".join(key.field for key in self._meta.sort_orders[0])
+        return self._primary_key_name()
+
+    def _cursor_values(self, model: ModelType, sort_by: str) -> list[Any]:
+        return [
+            self._cursor_value(model, name)
+            for name in self._cursor_key_names(sort_by)
+        ]
+
+    def _cursor_value(self, model: Any, name: str) -> Any:
+        if isinstance(model, Row):
+            return model._mapping[name]
+        value = model
+        for attribute in name.split("."):
+            if attribute in inspect(value).unloaded:
+                raise BadRequestException(
+                    f"Для курсора по полю {name} связь должна быть загружена",
+                )
+            value = getattr(value, attribute)
+            if value is None:
+                return None
+        return value
+
+    def _cursor_key_names(self, sort_by: str) -> list[str]:
+        return [
+            key.field
+            for key in self._sort_keys(sort_by=sort_by, check_index=False)
+        ]
+
+    def _primary_key_name(self) -> str:
+        return self._meta.primary_key
+
+    def _batchable(
+        self,
+        field: str,
+        value: Any,
+        with_related: Sequence[Any] | bool | None,
+    ) -> bool:
+        if not self.batch_loading or field not in self._meta.columns:
+            return False
+        column = self._meta.columns[field].column
+        if not (
+            column.unique
+            or (column.primary_key and len(column.table.primary_key) == 1)
+        ):
+            return False
+        if not isinstance(with_related, bool | None) and not all(
+            isinstance(item, str) for item in with_related
+        ):
+            return False
+        return self._batch_key(field=field, value=value) is not None
+
+    def _batch_key(self, field: str, value: Any) -> Any:
+        """Значение, приведённое к типу колонки, None - не приводится."""
+        column = self._meta.columns[field]
+        python_type = column.python_type
+        if value is None or python_type is None or python_type in (dict, list):
+            return None
+        if column.coerce is not None:
+            return column.coerce(value)
+        if isinstance(value, python_type):
+            return value
+        try:
+            return python_type(value)
+        except (TypeError, ValueError):
+            return None
+
+    async def _load(
+        self,
+        field: str,
+        value: Any,
+        projection: list[str] | None,
+        with_related: Sequence[Any] | bool | None,
+    ) -> ModelType | None:
+        """Загружает запись загрузчиком пачек.
+
+        Загрузчики живут в session.info (запрос) или, при
+        shared_batch_loading, в процессе: пачки читаются в отдельной
+        сессии session_factory и объединяют запросы разных запросов.
+
+        Notes:
+            Общий загрузчик не видит незакоммиченных изменений сессии
+            запроса, поэтому используется, только пока у сессии нет
+            транзакции (ничего не записано), иначе - загрузчик запроса.
+        """
+        shared = (
+            self.shared_batch_loading
+            and self.session_factory is not None
+            and not self.session.in_transaction()
+        )
+        key = (
+            self.model_class,
+            field,
+            tuple(projection or ()),
+            with_related
+            if isinstance(with_related, bool | None)
+            else tuple(with_related),
+            self.strict_loading,
+        )
+        loaders = (
+            self.shared_batch_loaders
+            if shared
+            else self.session.info.setdefault("batch_loaders", {})
+        )
+        loader = loaders.get(key)
+        if loader is None:
+            # Общий загрузчик не должен держать сессию запроса.
+            owner = (
+                type(self)(model=self.model_class, db_session=None)
+                if shared
+                else self
+            )
+            loader = loaders[key] = BatchLoader(
+                partial(
+                    owner._load_batch,
+                    field=field,
+                    projection=projection,
+                    with_related=with_related,
+                    shared=shared,
+                ),
+                max_batch_size=self.max_batch_size,
+            )
+        model = await loader.load(self._batch_key(field=field, value=value))
+        if shared and model is not None:
+            model = await self.session.merge(model, load=False)
+        return model
+
+    async def _load_batch(
+        self,
+        values: list[Any],
+        field: str,
+        projection: list[str] | None,
+        with_related: Sequence[Any] | bool | None,
+        shared: bool,
+    ) -> list[ModelType | None]:
+        """Читает пачку одним запросом с `unnest(:values) WITH ORDINALITY`.
+
+        Записи сопоставляются со значениями по номеру значения в базе
+        (сравнение по типу и collation колонки), а не в python.
+
+        Returns:
+            Записи в порядке values, None для не найденных.
+        """
+        column = self._meta.columns[field].attribute
+        batch = (
+            func.unnest(self._array(column, values))
+            .table_valued("value", with_ordinality="ordinality")
+            .render_derived(name="batch")
+        )
+        query = self._query()
+        query = self._with_related(query=query, with_related=with_related)
+        query = self._apply_projection(query=query, projection=projection)
+        query = query.join(batch, column == batch.c.value).add_columns(
+            batch.c.ordinality,
+        )
+        if shared:
+            # У общего загрузчика нет сессии запроса, EXPLAIN идёт в его
+            # собственной сессии.
+            async with self.session_factory() as session:  # type: ignore[misc]
+                await self._guard_cost(query, session=session)
+                rows = (await session.execute(query)).all()
+        else:
+            # Пачки разных загрузчиков делят сессию запроса.
+            async with self.session.info.setdefault(
+                "batch_lock",
+                asyncio.Lock(),
+            ):
+                await self._guard_cost(query)
+                rows = (await self.session.execute(query)).all()
+        models: list[ModelType | None] = [None] * len(values)
+        for model, ordinality in rows:
+            models[ordinality - 1] = model
+        return models
 
     async def _all(self, query: Select) -> list[ModelType]:
+        await self._guard_cost(query)
         query = await self.session.scalars(query)
         return query.all()
 
+    async def _stream(
+        self,
+        query: Select,
+        chunk_size: int,
+        expunge: bool,
+    ) -> AsyncIterator[list[ModelType]]:
+        await self._guard_cost(query)
+        result = await self.session.stream_scalars(
+            query.execution_options(yield_per=chunk_size),
+        )
+        try:
+            async for chunk in result.partitions():
+                yield chunk
+                if expunge:
+                    for model in chunk:
+                        self.session.expunge(model)
+        finally:
+            await result.close()
+
+    def _rows_query(self, projection: list[str] | None) -> Select:
+        """Запрос строк колонок projection.
+
+        Notes:
+            Без projection выбираются колонки модели, кроме deferred
+            (например, search_vector) и rows_exclude (например, хэш пароля).
+        """
+        if not projection:
+            return select(
+                *(
+                    getattr(self.model_class, attribute.key)
+                    for attribute in self.model_class.__mapper__.column_attrs
+                    if not attribute.deferred
+                    and attribute.key not in self.rows_exclude
+                ),
+            )
+
+        for field in projection:
+            self._validate_params(field)
+
+        columns = []
+        for field in dict.fromkeys([self._primary_key_name(), *projection]):
+            relationship = self._field_relationship(field)
+            if relationship is not None and relationship.uselist:
+                raise BadRequestException(
+                    f"Выборка поля {field} связи один-ко-многим "
+                    "не поддерживается",
+                )
+            column = self._field_column(field)
+            columns.append(column.label(field) if "." in field else column)
+
+        query = select(*columns).select_from(self.model_class)
+        return self._plan_joins(query, projection)
+
+    async def _all_rows(self, query: Select) -> list[Row]:
+        await self._guard_cost(query)
+        result = await self.session.execute(query)
+        return list(result.all())
+
+    async def _one_row_or_none(self, query: Select) -> Row | None:
+        result = await self.session.execute(query)
+        return result.one_or_none()
+
+    async def _all_json(self, query: Select) -> tuple[bytes, int]:
+        await self._guard_cost(query)
+        # json_agg по отсортированному (и ограниченному) подзапросу
+        # сохраняет его порядок.
+        page = query.subquery("page")
+        result = await self.session.execute(
+            select(
+                cast(
+                    func.coalesce(
+                        func.json_agg(page.table_valued()),
+                        literal_column("'[]'::json"),
+                    ),
+                    Text,
+                ),
+                func.count(),
+            ),
+        )
+        data, page_size = result.one()
+        return data.encode(), page_size
+
+    async def _all_with_count(
+        self,
+        query: Select,
+    ) -> tuple[list[ModelType], int | None]:
+        await self._guard_cost(query)
+        query = query.add_columns(func.count().over().label("total_count"))
+        rows = (await self.session.execute(query)).all()
+        if not rows:
+            return [], None
+        return [row[0] for row in rows], rows[0][1]
+
+    async def _write(self, stmt: Update | Delete) -> list[ModelType]:
+        """Выполняет UPDATE/DELETE ... RETURNING и возвращает записи.
+
+        Notes:
+            Запрос выполняется сам, а не через from_statement: по нему
+            RoutingSession выбирает writer.
+        """
+        result = await self.session.scalars(
+            stmt.execution_options(
+                synchronize_session="fetch",
+                populate_existing=True,
+            ),
+        )
+        return list(result.all())
+
     async def _one_or_none(self, query: Select) -> ModelType | None:
         query = await self.session.scalars(query)
         return query.one_or_none()
@@ -400,37 +2008,65 @@ class SQLAlchemyRepository[
         )
         return query.one()
 
+    async def _count_estimated(self, query: Select) -> int:
+        plan = await self._explain(query)
+        return int(plan["Plan Rows"])
+
+    async def _guard_cost(
+        self,
+        query: Any,
+        session: AsyncSession | None = None,
+    ) -> None:
+        """Отклоняет запрос, оценка стоимости которого больше max_query_cost.
+
+        Args:
+            query: Запрос.
+            session: Сессия для EXPLAIN, по умолчанию сессия репозитория.
+
+        Notes:
+            Стоимость берётся из EXPLAIN без выполнения запроса, это один
+            дополнительный запрос, поэтому проверка включается явно.
+        """
+        if self.max_query_cost is None or not isinstance(query, Select):
+            return
+        cost = (await self._explain(query, session=session))["Total Cost"]
+        if cost > self.max_query_cost:
+            raise QueryGuardException(
+                f"Оценка стоимости запроса {cost} больше {self.max_query_cost}",
+            )
+
+    async def _explain(
+        self,
+        query: Select,
+        session: AsyncSession | None = None,
+    ) -> dict[str, Any]:
+        """Корневой узел плана EXPLAIN (FORMAT JSON)."""
+        result = await (session or self.session).execute(Explain(query))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = orjson.loads(plan)
+        return plan[0]["Plan"]
+
+    @property
+    def _meta(self) -> ModelMeta:
+        return get_model_meta(self.model_class)
+
     def __convert_datetime(
         self,
         field: str,
         value: Any,
     ) -> datetime | Any:
-        if issubclass(
-            self._get_model_field_type(self.model_class, field),
-            datetime,
-        ):
-            try:
-                return datetime.fromisoformat(value)
-            except ValueError as exc:
-                raise FieldException(
-                    f"Некорректный формат времени для поля {field}. "
-                    "Ожидается ISO формат.",
-                ) from exc
-            except TypeError as exc:
-                raise FieldException(
-                    f"Некорректный тип для поля {field}: "
-                    f"ожидается str, "
-                    f"получено {type(value).__name__}",
-                ) from exc
-        return value
+        coerce = self._meta.column(field).coerce
+        if coerce is None:
+            return value
+        return coerce(value)
 
     def _get_model_field_type(
         self,
         _model: ModelType,
         _field: str,
     ) -> type:
-        field_type = getattr(_model, _field).type.python_type
-        return field_type
+        return get_model_meta(_model).column(_field).python_type or object
 
     def _has_field(self, field: str) -> bool:
-        return field in self.model_class.__mapper__.columns.keys()
+        return self._meta.has_field(field)
@@ -29,6 +29,9 @@ class Settings(BaseSettings):
         default_factory=lambda: {"id", "created_at", "updated_at"},
     )
 
+    MAX_STATEMENTS_PER_REQUEST: int | None = Field(None)
+    MAX_PAGE_LIMIT: int = Field(1000)
+
     POSTGRES_HOST: str = Field(...)
     POSTGRES_PORT: int = Field(...)
     POSTGRES_DB: str = Field(...)
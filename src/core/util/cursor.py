@@ -0,0 +1,29 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+
+import orjson
+from pydantic import ValidationError
+
+from src.core.exception.base import BadRequestException
+from src.core.helper.type.pagination import Cursor
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode cursor into url-safe opaque string."""
+    raw = orjson.dumps(cursor.model_dump(mode="json"))
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(value: str) -> Cursor:
+    """Decode opaque string into cursor.
+
+    Raises:
+        BadRequestException: Cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        return Cursor.model_validate(orjson.loads(raw))
+    # binascii.Error, non-ASCII input and JSONDecodeError are ValueError.
+    except (ValueError, ValidationError) as exc:
+        raise BadRequestException("Некорректный курсор пагинации") from exc
@@ -0,0 +1,68 @@
+"""Cached pydantic adapters and models for DTO mapping."""
+
+from functools import cache
+from typing import Any, get_args
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+
+@cache
+def list_adapter(scheme: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Return cached adapter validating and dumping a list of scheme."""
+    return TypeAdapter(list[scheme])  # type: ignore[valid-type]
+
+
+@cache
+def partial_scheme(
+    scheme: type[BaseModel],
+    fields: frozenset[str],
+) -> type[BaseModel]:
+    """Return cached model of scheme with only given fields."""
+    return create_model(  # type: ignore[call-overload]
+        f"{scheme.__name__}Partial",
+        __config__=scheme.model_config,
+        __doc__=scheme.__doc__,
+        **{
+            name: (field.annotation, field)
+            for name, field in scheme.model_fields.items()
+            if name in fields
+        },
+    )
+
+
+@cache
+def nested_paths(scheme: type[BaseModel]) -> tuple[str, ...]:
+    """Return dotted paths of scheme fields holding nested schemes.
+
+    `org: OrgResponse` -> "org", `members: list[MemberResponse]` of
+    OrgResponse -> "org.members". Recursive schemes are followed once.
+    """
+    return tuple(_nested_paths(scheme, frozenset({scheme})))
+
+
+def _nested_paths(
+    scheme: type[BaseModel],
+    seen: frozenset[type[BaseModel]],
+) -> list[str]:
+    """Collect nested paths of scheme, skipping schemes in seen."""
+    paths = []
+    for name, field in scheme.model_fields.items():
+        nested = _nested_scheme(field.annotation)
+        if nested is None or nested in seen:
+            continue
+        paths.append(name)
+        paths.extend(
+            f"{name}.{path}" for path in _nested_paths(nested, seen | {nested})
+        )
+    return paths
+
+
+def _nested_scheme(annotation: Any) -> type[BaseModel] | None:
+    """Return scheme of annotation (`X`, `X | None`, `list[X]`), if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for argument in get_args(annotation):
+        scheme = _nested_scheme(argument)
+        if scheme is not None:
+            return scheme
+    return None
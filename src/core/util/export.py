@@ -0,0 +1,49 @@
+"""Incremental encoders for streaming export."""
+
+import csv
+import io
+from collections.abc import Sequence
+from datetime import date, datetime, time
+from typing import Any
+
+import orjson
+
+from src.core.helper.type.export import ExportFormat
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+def encode_ndjson(
+    rows: Sequence[Sequence[Any]], fields: Sequence[str]
+) -> bytes:
+    """Encode rows into NDJSON lines, one object per row."""
+    return b"".join(
+        orjson.dumps(dict(zip(fields, row, strict=True)), default=str) + b"\n"
+        for row in rows
+    )
+
+
+def encode_csv(
+    rows: Sequence[Sequence[Any]],
+    fields: Sequence[str],
+    header: bool = False,
+) -> bytes:
+    """Encode rows into CSV lines, optionally preceded by a header."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(fields)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def _csv_value(value: Any) -> Any:
+    """Convert value into CSV cell, nested values are encoded as JSON."""
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    if isinstance(value, dict | list | tuple):
+        return orjson.dumps(value, default=str).decode()
+    return value
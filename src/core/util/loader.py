@@ -0,0 +1,84 @@
+"""Batching loader of keys (DataLoader)."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+
+
+class BatchLoader[KeyType: Hashable, ValueType]:
+    """Loads keys requested in one event loop tick with one batch call.
+
+    The first load schedules a dispatch with call_soon, so every key
+    requested by coroutines running before the loop gets to it (e.g. in
+    one asyncio.gather) is passed to one call of batch_load. Loads of a
+    key already in flight share its result. Results are not kept after
+    the batch is resolved.
+
+    batch_load returns values in the order of its keys.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[KeyType]], Awaitable[Sequence[ValueType]]],
+        max_batch_size: int = 1000,
+    ):
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self._pending: dict[KeyType, asyncio.Future[ValueType]] = {}
+        self._queue: list[KeyType] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: KeyType) -> ValueType:
+        """Return value of key, loaded in a batch."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        # A cancelled caller must not cancel the load shared with others.
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[KeyType]) -> list[ValueType]:
+        """Return values of keys in their order."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        """Start batches of queued keys."""
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch_size):
+            task = asyncio.ensure_future(
+                self._load_batch(queue[start : start + self.max_batch_size]),
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, keys: list[KeyType]) -> None:
+        """Load batch and resolve futures of its keys.
+
+        Keys stay in flight until the batch is resolved: loads of them
+        issued meanwhile wait for this batch.
+        """
+        futures = [self._pending[key] for key in keys]
+        try:
+            values = await self.batch_load(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"batch_load returned {len(values)} values "
+                    f"for {len(keys)} keys",
+                )
+        except BaseException as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+        else:
+            for future, value in zip(futures, values, strict=True):
+                if not future.done():
+                    future.set_result(value)
+        finally:
+            for key in keys:
+                self._pending.pop(key, None)
@@ -0,0 +1,38 @@
+"""Add User search
+
+Revision ID: 3b9d41c7e2a8
+Revises: ff8b0152932e
+Create Date: 2025-11-23 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from src.core.database.migration import (
+    add_search_vector,
+    create_trgm_extension,
+    create_trgm_index,
+    drop_search_vector,
+    drop_trgm_index,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d41c7e2a8'
+down_revision: Union[str, Sequence[str], None] = 'ff8b0152932e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_trgm_extension()
+    create_trgm_index('user', 'username')
+    create_trgm_index('user', 'email')
+    add_search_vector('user', ['username', 'email'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_search_vector('user')
+    drop_trgm_index('user', 'email')
+    drop_trgm_index('user', 'username')
@@ -0,0 +1,29 @@
+"""Add User sort index
+
+Revision ID: 8c2e5f1a9d47
+Revises: 3b9d41c7e2a8
+Create Date: 2025-11-24 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2e5f1a9d47'
+down_revision: Union[str, Sequence[str], None] = '3b9d41c7e2a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_user_created_at_id', 'user', ['created_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_created_at_id', table_name='user')
@@ -0,0 +1,159 @@
+"""Test configuration: settings and fakes of the database session."""
+
+import os
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("PORT", "8000")
+os.environ.setdefault("POSTGRES_HOST", "localhost")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+os.environ.setdefault("POSTGRES_DB", "ft")
+os.environ.setdefault("POSTGRES_USER", "dev")
+os.environ.setdefault("POSTGRES_PASSWORD", "dev1234")
+
+from src.core.database.instrumentation import (  # noqa: E402
+    setup_statement_counter,
+)
+from src.core.database.session import RoutingSession  # noqa: E402
+
+
+class FakeResult:
+    """Result of FakeSession returning given rows."""
+
+    def __init__(self, rows: list[Any]):
+        self.rows = rows
+
+    def all(self) -> list[Any]:
+        """Return rows."""
+        return list(self.rows)
+
+    def one_or_none(self) -> Any:
+        """Return the first row or None."""
+        return self.rows[0] if self.rows else None
+
+    def scalar_one(self) -> Any:
+        """Return the first row, zero count without rows."""
+        return self.rows[0] if self.rows else 0
+
+    def scalars(self) -> "FakeResult":
+        """Return rows as scalars."""
+        return self
+
+
+class FakeSession:
+    """Session answering statements with given rows.
+
+    Statements are answered by results in order, then by rows. They are
+    not executed, they are compiled for Postgres (asyncpg) into sql, so
+    tests assert on the SQL the repository would send.
+    """
+
+    def __init__(
+        self,
+        rows: list[Any] | None = None,
+        in_transaction: bool = False,
+        results: list[list[Any]] | None = None,
+    ):
+        self.rows = rows or []
+        self.results = list(results or [])
+        self.sql: list[str] = []
+        self.info: dict[str, Any] = {}
+        self._in_transaction = in_transaction
+
+    def in_transaction(self) -> bool:
+        """Return whether session has a transaction."""
+        return self._in_transaction
+
+    def _record(self, statement: Any) -> FakeResult:
+        """Compile statement into sql."""
+        self.sql.append(
+            str(statement.compile(dialect=postgresql.asyncpg.dialect())),
+        )
+        return FakeResult(self.results.pop(0) if self.results else self.rows)
+
+    async def __aenter__(self) -> "FakeSession":
+        """Use session as its own context."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Nothing to close."""
+
+    async def merge(self, instance: Any, load: bool = True) -> Any:
+        """Return instance."""
+        return instance
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        """Record statement."""
+        return self._record(statement)
+
+    async def scalars(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        """Record statement."""
+        return self._record(statement)
+
+    async def scalar(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        """Record statement."""
+        return self._record(statement).scalar_one()
+
+
+@pytest.fixture
+def fake_session() -> type[FakeSession]:
+    """Return class of sessions recording compiled statements."""
+    return FakeSession
+
+
+class SQLiteCursor(sqlite3.Cursor):
+    """sqlite3 cursor usable by AsyncSession."""
+
+    async def _async_soft_close(self) -> None:
+        """Nothing to release: sqlite3 results are not streamed."""
+
+
+class SQLiteConnection(sqlite3.Connection):
+    """sqlite3 connection with cursors usable by AsyncSession."""
+
+    def cursor(self, factory: Any = SQLiteCursor) -> Any:
+        """Return cursor."""
+        return super().cursor(factory)
+
+
+@pytest.fixture
+def sqlite_engines(tmp_path: Path) -> Iterator[dict[str, Any]]:
+    """Writer and reader engines of one SQLite database.
+
+    Engines stand in for AsyncEngine of RoutingSession (sync_engine) and
+    count their statements like the Postgres engines.
+    """
+    path = tmp_path / "test.db"
+    engines = {
+        name: SimpleNamespace(
+            sync_engine=create_engine(
+                "sqlite://",
+                creator=lambda: sqlite3.connect(path, factory=SQLiteConnection),
+            ),
+        )
+        for name in ("writer", "reader")
+    }
+    for engine in engines.values():
+        setup_statement_counter(engine)  # type: ignore[arg-type]
+    yield engines
+    for engine in engines.values():
+        engine.sync_engine.dispose()
+
+
+@pytest.fixture
+def routing_session(sqlite_engines: dict[str, Any]) -> AsyncSession:
+    """Session routing statements to the SQLite writer and reader."""
+    return AsyncSession(
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        engines=sqlite_engines,
+    )
@@ -0,0 +1,134 @@
+"""Batching of unique lookups (get_by id/uuid)."""
+
+import asyncio
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from src.app.model import User
+from src.app.repository import UserRepository
+from src.core.util.loader import BatchLoader
+
+
+def test_loader_batches_one_tick_in_order() -> None:
+    """Keys of one tick are loaded by one call, duplicates share it."""
+    calls: list[list[int]] = []
+
+    async def batch_load(keys: list[int]) -> list[int]:
+        calls.append(keys)
+        return [key * 10 for key in keys]
+
+    async def main() -> list[int]:
+        loader = BatchLoader(batch_load)
+        return list(
+            await asyncio.gather(*(loader.load(key) for key in [3, 1, 3, 2])),
+        )
+
+    assert asyncio.run(main()) == [30, 10, 30, 20]
+    assert calls == [[3, 1, 2]]
+
+
+def test_loader_fails_every_key_of_failed_batch() -> None:
+    """An error of batch_load is raised for every key of the batch."""
+
+    async def batch_load(keys: list[int]) -> list[int]:
+        raise RuntimeError("boom")
+
+    async def main() -> list[Any]:
+        loader = BatchLoader(batch_load)
+        return list(
+            await asyncio.gather(
+                loader.load(1),
+                loader.load(2),
+                return_exceptions=True,
+            ),
+        )
+
+    assert all(isinstance(error, RuntimeError) for error in asyncio.run(main()))
+
+
+def test_repository_matches_rows_by_ordinality(
+    fake_session: Callable[..., Any],
+) -> None:
+    """Lookups are one unnest query, rows are matched in the database."""
+    users = [
+        User(id=uuid.uuid4(), username=f"user{index}", email="e")
+        for index in range(3)
+    ]
+    session = fake_session(rows=[(users[2], 2), (users[0], 1)])
+    repository = UserRepository(model=User, db_session=session)
+
+    async def main() -> list[Any]:
+        return list(
+            await asyncio.gather(
+                *(
+                    repository.get_by(field="id", value=value, unique=True)
+                    for value in [
+                        users[0].id,
+                        str(users[2].id),
+                        users[1].id,
+                        users[0].id,
+                    ]
+                ),
+            ),
+        )
+
+    assert asyncio.run(main()) == [users[0], users[2], None, users[0]]
+    [sql] = session.sql
+    assert "WITH ORDINALITY AS batch(value, ordinality)" in sql
+
+
+def test_shared_loader_is_not_used_inside_transaction(
+    fake_session: Callable[..., Any],
+) -> None:
+    """A session with a transaction may hold writes the shared loader misses."""
+    user = User(id=uuid.uuid4(), username="user", email="e")
+    session = fake_session(rows=[(user, 1)], in_transaction=True)
+
+    class SharedUserRepository(UserRepository):
+        """User repository with process-wide batching."""
+
+        shared_batch_loading = True
+
+        @staticmethod
+        def session_factory() -> Any:
+            """Fail: shared batches must not be read here."""
+            raise AssertionError("shared loader used")
+
+    repository = SharedUserRepository(model=User, db_session=session)
+    found = asyncio.run(
+        repository.get_by(field="id", value=user.id, unique=True),
+    )
+    assert found is user
+    [sql] = session.sql
+    assert "unnest" in sql
+
+
+def test_shared_loader_guards_cost_in_its_own_session(
+    fake_session: Callable[..., Any],
+) -> None:
+    """With max_query_cost the shared batch is EXPLAINed by its session."""
+    user = User(id=uuid.uuid4(), username="user", email="e")
+    shared_session = fake_session(
+        results=[[[{"Plan": {"Total Cost": 1.0}}]], [(user, 1)]],
+    )
+
+    class SharedUserRepository(UserRepository):
+        """User repository with process-wide batching and a cost budget."""
+
+        shared_batch_loading = True
+        max_query_cost = 100.0
+
+        @staticmethod
+        def session_factory() -> Any:
+            """Return session of shared batches."""
+            return shared_session
+
+    repository = SharedUserRepository(model=User, db_session=fake_session())
+    found = asyncio.run(
+        repository.get_by(field="id", value=user.id, unique=True),
+    )
+    assert found is user
+    explain, batch = shared_session.sql
+    assert explain.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "unnest" in batch
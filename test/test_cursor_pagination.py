@@ -0,0 +1,120 @@
+"""Keyset pagination over nullable sort keys."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from sqlalchemy import ForeignKey
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from src.core.database.base import Base
+from src.core.helper.type.guard import GuardPolicy
+from src.core.helper.type.pagination import PaginationMode
+from src.core.helper.type.sort import SortType
+from src.core.repository import SQLAlchemyRepository
+from src.core.util.cursor import decode_cursor
+
+
+class Project(Base):
+    """Project."""
+
+    __tablename__ = "test_cursor_project"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column()
+
+
+class Task(Base):
+    """Task with an optional rank and project."""
+
+    __tablename__ = "test_cursor_task"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    rank: Mapped[int | None] = mapped_column(nullable=True)
+    project_id: Mapped[int | None] = mapped_column(
+        ForeignKey("test_cursor_project.id"),
+        nullable=True,
+    )
+    project: Mapped[Project | None] = relationship()
+
+
+class Repository(SQLAlchemyRepository):  # type: ignore[type-arg]
+    """Repository without guards."""
+
+    unindexed_sort_policy = GuardPolicy.allow
+
+
+RANKS = {1: 2, 2: None, 3: 1, 4: None, 5: 3, 6: 1}
+PROJECTS = {1: 1, 2: None, 3: 2, 4: 1, 5: None, 6: 2}
+
+
+async def walk(
+    repository: Repository,
+    sort_by: str,
+    sort_type: SortType,
+) -> list[int]:
+    """Return ids of all pages of size 2 in order."""
+    ids: list[int] = []
+    cursor = None
+    while True:
+        page = await repository.get_all(
+            limit=2,
+            sort_by=sort_by,
+            sort_type=sort_type,
+            with_related=["project"],
+            cursor=cursor,
+            pagination_mode=PaginationMode.cursor,
+        )
+        ids.extend(task.id for task in page[:2])
+        if len(page) <= 2:
+            return ids
+        cursor = decode_cursor(
+            repository.make_cursor(
+                page[1], sort_by=sort_by, sort_type=sort_type
+            ),
+        )
+
+
+@pytest.fixture
+def repository(
+    sqlite_engines: dict[str, Any],
+    routing_session: AsyncSession,
+) -> Repository:
+    """Repository of six tasks, some without rank and project."""
+    engine = sqlite_engines["writer"].sync_engine
+    Base.metadata.create_all(
+        engine,
+        tables=[Project.__table__, Task.__table__],  # type: ignore[list-item]
+    )
+    with engine.begin() as connection:
+        connection.execute(
+            Project.__table__.insert(),  # type: ignore[attr-defined]
+            [{"id": 1, "name": "b"}, {"id": 2, "name": "a"}],
+        )
+        connection.execute(
+            Task.__table__.insert(),  # type: ignore[attr-defined]
+            [
+                {"id": id_, "rank": RANKS[id_], "project_id": PROJECTS[id_]}
+                for id_ in RANKS
+            ],
+        )
+    return Repository(model=Task, db_session=routing_session)
+
+
+@pytest.mark.parametrize(
+    ("sort_by", "sort_type", "expected"),
+    [
+        ("rank", SortType.asc, [3, 6, 1, 5, 2, 4]),
+        ("rank", SortType.desc, [4, 2, 5, 1, 6, 3]),
+        ("project.name", SortType.asc, [3, 6, 1, 4, 2, 5]),
+        ("project.name", SortType.desc, [5, 2, 4, 1, 6, 3]),
+    ],
+)
+def test_pages_keep_rows_with_null_sort_keys(
+    repository: Repository,
+    sort_by: str,
+    sort_type: SortType,
+    expected: list[int],
+) -> None:
+    """NULL keys (own or of a missing relation) are paged, not dropped."""
+    assert asyncio.run(walk(repository, sort_by, sort_type)) == expected
@@ -0,0 +1,130 @@
+"""DTO mapping of controllers."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import create_engine, literal, null, select
+from src.app.model import User
+from src.app.repository import UserRepository
+from src.core.controller import SQLAlchemyController
+from src.core.helper.type.controller import DTOMode
+from src.core.util.dto import list_adapter
+
+
+class OrgResponse(BaseModel):
+    """Organization response."""
+
+    name: str
+
+
+class MemberResponse(BaseModel):
+    """Member response."""
+
+    id: int
+    org: OrgResponse | None
+
+
+def controller() -> SQLAlchemyController[Any]:
+    """Return controller of member responses without repository."""
+    return SQLAlchemyController(
+        model=None,
+        repository=None,  # type: ignore[arg-type]
+        exclude_fields=set(),
+        response_scheme=MemberResponse,  # type: ignore[arg-type]
+    )
+
+
+def rows(*orgs: str | None) -> list[Any]:
+    """Return rows of members labelled like repository rows mode."""
+    with create_engine("sqlite://").connect() as connection:
+        return [
+            connection.execute(
+                select(
+                    literal(index).label("id"),
+                    (null() if org is None else literal(org)).label("org.name"),
+                    literal("secret").label("hashed_password"),
+                ),
+            ).one()
+            for index, org in enumerate(orgs)
+        ]
+
+
+def test_rows_nest_relationship_columns() -> None:
+    """`rel.col` labels are nested, a missing relation is None.
+
+    Columns outside the response scheme are dropped.
+    """
+    data = controller().dto(
+        rows("acme", None),
+        DTOMode.rows,
+        projection=["id", "org.name"],
+    )
+
+    assert data == [
+        {"id": 0, "org": {"name": "acme"}},
+        {"id": 1, "org": None},
+    ]
+
+
+def test_rows_validate_against_response_scheme() -> None:
+    """Nested rows are valid response schemes."""
+    [data] = controller().dto(rows("acme"), DTOMode.rows)  # type: ignore[misc]
+
+    assert MemberResponse.model_validate(data).org == OrgResponse(name="acme")
+
+
+def test_rows_mode_selects_plain_columns(
+    fake_session: Callable[..., Any],
+) -> None:
+    """Rows mode is one SELECT of columns, not of model entities.
+
+    Deferred columns and rows_exclude (search_vector, hashed_password)
+    are not selected by default.
+    """
+    session = fake_session()
+    repository = UserRepository(model=User, db_session=session)
+
+    asyncio.run(repository.get_all(limit=10, rows=True))
+
+    [sql] = session.sql
+    columns = sql[len("SELECT ") : sql.index(" \nFROM")].split(", ")
+    assert sorted(columns) == [
+        '"user".created_at',
+        '"user".email',
+        '"user".id',
+        '"user".updated_at',
+        '"user".username',
+    ]
+
+
+def test_model_dump_does_not_change_instance() -> None:
+    """model_dump returns loaded attributes and leaves the instance usable."""
+    user = User(username="alice", email="e", hashed_password="h")  # noqa: S106
+
+    data = user.model_dump()
+
+    assert data["username"] == "alice"
+    assert "_sa_instance_state" not in data
+    assert user.model_dump() == data
+    assert user._sa_instance_state is not None  # type: ignore[attr-defined]
+
+
+def test_lists_are_validated_by_one_cached_adapter() -> None:
+    """A list of models is validated in one call of a cached adapter."""
+    members = [
+        MemberResponse(id=index, org=OrgResponse(name="acme"))
+        for index in range(3)
+    ]
+    dto_controller = controller()
+
+    first = dto_controller.dto(members, DTOMode.pydantic)
+    adapter = list_adapter(MemberResponse)
+    second = dto_controller.dto(members, DTOMode.pydantic, projection=["id"])
+
+    assert first == members
+    assert list_adapter(MemberResponse) is adapter
+    assert [item.model_dump() for item in second] == [  # type: ignore[union-attr]
+        {"id": index} for index in range(3)
+    ]
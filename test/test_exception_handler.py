@@ -0,0 +1,26 @@
+"""Database exception handlers."""
+
+from asyncpg import QueryCanceledError  # type: ignore[import-untyped]
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import DBAPIError
+from src.core.fastapi.initialization.handler.sqlalchemy_exception import (
+    init_handler_for_sqlalchemy_exception,
+)
+
+
+def test_statement_timeout_is_gateway_timeout() -> None:
+    """A query cancelled by statement_timeout is 504, not 408."""
+    app = FastAPI()
+    init_handler_for_sqlalchemy_exception(app)
+
+    @app.get("/")
+    async def route() -> None:
+        orig = Exception("canceling statement due to statement timeout")
+        orig.__cause__ = QueryCanceledError()
+        raise DBAPIError("SELECT 1", {}, orig)
+
+    response = TestClient(app).get("/")
+
+    assert response.status_code == 504
+    assert response.json()["error_code"] == 504
@@ -0,0 +1,157 @@
+"""Join planning: one JOIN per relationship, EXISTS for collections."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy import ForeignKey, create_engine
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
+from src.core.database.base import Base
+from src.core.helper.scheme.request.filter import FilterParam, FilterRequest
+from src.core.helper.type.filter import FilterType, OperatorType
+from src.core.helper.type.guard import GuardPolicy
+from src.core.repository import SQLAlchemyRepository
+
+
+class Org(Base):
+    """Organization with a collection of members."""
+
+    __tablename__ = "test_org"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column()
+    members: Mapped[list["Member"]] = relationship(back_populates="org")
+
+
+class Member(Base):
+    """Member of an organization."""
+
+    __tablename__ = "test_member"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    org_id: Mapped[int] = mapped_column(ForeignKey("test_org.id"))
+    org: Mapped[Org] = relationship(back_populates="members")
+
+
+class Repository(SQLAlchemyRepository):  # type: ignore[type-arg]
+    """Repository without guards."""
+
+    unindexed_filter_policy = GuardPolicy.allow
+    unindexed_sort_policy = GuardPolicy.allow
+
+
+@pytest.fixture
+def make_repository(
+    fake_session: Callable[[], Any],
+) -> Callable[[type[Base]], Repository]:
+    """Return factory of repositories recording their statements."""
+
+    def make(model: type[Base]) -> Repository:
+        return Repository(model=model, db_session=fake_session())
+
+    return make
+
+
+def filters(*params: tuple[str, Any, OperatorType]) -> FilterRequest:
+    """Return AND filter request of (field, value, operator)."""
+    return FilterRequest(
+        filters=[
+            FilterParam(field=field, value=value, operator=operator)
+            for field, value, operator in params
+        ],
+        type=FilterType.AND,
+    )
+
+
+def last_sql(repository: Repository) -> str:
+    """Return the last statement of repository compiled for Postgres."""
+    return repository.session.sql[-1]
+
+
+def test_filter_and_sort_by_relationship_join_once(
+    make_repository: Callable[[type[Base]], Repository],
+) -> None:
+    """Filter, sort and projection by org.* share one LEFT JOIN."""
+    repository = make_repository(Member)
+    asyncio.run(
+        repository.get_by_filters(
+            filter_request=filters(("org.name", "acme", OperatorType.EQUALS)),
+            sort_by="org.name",
+            limit=5,
+        ),
+    )
+    sql = last_sql(repository)
+    assert sql.count("JOIN test_org") == 1
+    assert "LEFT OUTER JOIN test_org AS" in sql
+    assert "EXISTS" not in sql
+
+
+def test_rows_projection_and_filter_join_once(
+    make_repository: Callable[[type[Base]], Repository],
+) -> None:
+    """Rows mode selects org.name through the same single JOIN."""
+    repository = make_repository(Member)
+    asyncio.run(
+        repository.get_by_filters(
+            filter_request=filters(("org.name", "acme", OperatorType.EQUALS)),
+            projection=["org.name"],
+            limit=5,
+            rows=True,
+        ),
+    )
+    sql = last_sql(repository)
+    assert sql.count("JOIN test_org") == 1
+
+
+def test_collection_filter_uses_exists(
+    make_repository: Callable[[type[Base]], Repository],
+) -> None:
+    """Filter by members.* is an EXISTS subquery, not a JOIN."""
+    repository = make_repository(Org)
+    asyncio.run(
+        repository.get_by_filters(
+            filter_request=filters(("members.id", [1, 2], OperatorType.IN)),
+            limit=5,
+        ),
+    )
+    sql = last_sql(repository)
+    assert "EXISTS (SELECT 1" in sql
+    assert "JOIN" not in sql
+
+
+@pytest.mark.parametrize("method", ["update_by_filters", "delete_by_filters"])
+def test_bulk_statements_filter_relationships_with_exists(
+    make_repository: Callable[[type[Base]], Repository],
+    method: str,
+) -> None:
+    """UPDATE/DELETE cannot join, relationship filters are EXISTS."""
+    repository = make_repository(Member)
+    request = filters(("org.name", "acme", OperatorType.EQUALS))
+    if method == "update_by_filters":
+        asyncio.run(repository.update_by_filters(request, {"org_id": 2}))
+    else:
+        asyncio.run(repository.delete_by_filters(request))
+    sql = last_sql(repository)
+    assert "EXISTS (SELECT 1" in sql
+    assert "JOIN" not in sql
+
+
+def test_collection_filter_does_not_duplicate_rows(
+    make_repository: Callable[[type[Base]], Repository],
+) -> None:
+    """An org with two matching members is returned once."""
+    engine = create_engine("sqlite://")
+    Org.__table__.create(engine)  # type: ignore[attr-defined]
+    Member.__table__.create(engine)  # type: ignore[attr-defined]
+    with Session(engine) as session:
+        org = Org(id=1, name="acme")
+        session.add_all([org, Member(id=1, org=org), Member(id=2, org=org)])
+        session.commit()
+
+    query = make_repository(Org)._page_query(
+        filter_request=filters(("members.id", 0, OperatorType.GREATER)),
+        limit=10,
+    )
+    with Session(engine) as session:
+        assert [org.id for org in session.scalars(query).all()] == [1]
@@ -0,0 +1,76 @@
+"""Filters by paths of JSONB columns."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, mapped_column
+from src.core.database.base import Base
+from src.core.helper.scheme.request.filter import FilterParam, FilterRequest
+from src.core.helper.type.filter import FilterType, OperatorType
+from src.core.helper.type.guard import GuardPolicy
+from src.core.repository import SQLAlchemyRepository
+
+
+class Document(Base):
+    """Document with a JSONB body."""
+
+    __tablename__ = "test_json_document"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    data: Mapped[dict[str, Any]] = mapped_column(postgresql.JSONB)
+
+
+class Repository(SQLAlchemyRepository):  # type: ignore[type-arg]
+    """Repository without guards."""
+
+    unindexed_filter_policy = GuardPolicy.allow
+
+
+def where(
+    fake_session: Callable[[], Any],
+    operator: OperatorType,
+    value: Any,
+) -> tuple[str, dict[str, Any]]:
+    """Return WHERE clause and parameters of a filter by data.a."""
+    repository = Repository(model=Document, db_session=fake_session())
+    query = repository._page_query(
+        filter_request=FilterRequest(
+            filters=[
+                FilterParam(field="data.a", value=value, operator=operator)
+            ],
+            type=FilterType.AND,
+        ),
+        limit=10,
+    )
+    compiled = query.compile(dialect=postgresql.asyncpg.dialect())
+    sql = str(compiled)
+    return sql[sql.index("WHERE") : sql.index("ORDER BY")], compiled.params
+
+
+@pytest.mark.parametrize(
+    ("operator", "sign"),
+    [(OperatorType.EQUALS, "="), (OperatorType.NOT_EQUAL, "!=")],
+)
+def test_equality_compares_value_at_path(
+    fake_session: Callable[[], Any],
+    operator: OperatorType,
+    sign: str,
+) -> None:
+    """EQUALS/NOT_EQUAL compare the value at the path, not containment."""
+    sql, params = where(fake_session, operator, [1])
+
+    assert f"(test_json_document.data #> $1) {sign} $2::JSONB" in sql
+    assert "@>" not in sql
+    assert params["filter_0"] == [1]
+
+
+def test_contains_is_containment_of_document(
+    fake_session: Callable[[], Any],
+) -> None:
+    """JSON_CONTAINS matches supersets through @> of a document."""
+    sql, params = where(fake_session, OperatorType.JSON_CONTAINS, [1])
+
+    assert "test_json_document.data @> $1::JSONB" in sql
+    assert params["filter_0"] == {"a": [1]}
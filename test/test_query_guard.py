@@ -0,0 +1,78 @@
+"""Query guards: EXPLAIN cost and estimated counts."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, mapped_column
+from src.core.database.base import Base
+from src.core.exception.database import QueryGuardException
+from src.core.helper.scheme.request.filter import FilterParam, FilterRequest
+from src.core.helper.type.filter import FilterType, OperatorType
+from src.core.helper.type.guard import GuardPolicy
+from src.core.repository import SQLAlchemyRepository
+
+
+class Document(Base):
+    """Document with a JSONB body."""
+
+    __tablename__ = "test_guard_document"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    data: Mapped[dict[str, Any]] = mapped_column(postgresql.JSONB)
+
+
+class Repository(SQLAlchemyRepository):  # type: ignore[type-arg]
+    """Repository with a cost budget and no index guards."""
+
+    max_query_cost = 100.0
+    unindexed_filter_policy = GuardPolicy.allow
+    unindexed_sort_policy = GuardPolicy.allow
+
+
+def plan(cost: float, rows: int) -> list[dict[str, Any]]:
+    """Return EXPLAIN (FORMAT JSON) output."""
+    return [{"Plan": {"Total Cost": cost, "Plan Rows": rows}}]
+
+
+JSON_FILTER = FilterRequest(
+    filters=[
+        FilterParam(
+            field="data.a",
+            value={"b": 1},
+            operator=OperatorType.EQUALS,
+        ),
+    ],
+    type=FilterType.AND,
+)
+
+
+def test_explain_binds_typed_parameters(
+    fake_session: Callable[..., Any],
+) -> None:
+    """EXPLAIN is a SQLAlchemy statement, JSONB values are typed binds."""
+    session = fake_session(rows=[plan(cost=1.0, rows=42)])
+    repository = Repository(model=Document, db_session=session)
+    query = repository._page_query(filter_request=JSON_FILTER, limit=10)
+
+    assert asyncio.run(repository._count_estimated(query)) == 42
+    [sql] = session.sql
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "::JSONB" in sql
+
+
+def test_query_over_cost_budget_is_rejected(
+    fake_session: Callable[..., Any],
+) -> None:
+    """A page costlier than max_query_cost is not executed."""
+    session = fake_session(rows=[plan(cost=1000.0, rows=1)])
+    repository = Repository(model=Document, db_session=session)
+
+    with pytest.raises(QueryGuardException):
+        asyncio.run(
+            repository.get_by_filters(filter_request=JSON_FILTER, limit=10),
+        )
+    [sql] = session.sql
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
@@ -0,0 +1,98 @@
+"""Statement budgets of requests."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.database.instrumentation import count_statements
+from src.core.exception.database import StatementBudgetException
+from src.core.fastapi.application import get_app
+from src.core.fastapi.dependency import StatementBudget
+from src.core.fastapi.middleware.statement import (
+    STATEMENT_COUNT_HEADER,
+    StatementCounterMiddleware,
+)
+from src.core.helper.type.guard import GuardPolicy
+from src.core.setting import settings
+
+
+def request(
+    session: AsyncSession,
+    statements: int,
+    messages: list[dict[str, Any]],
+    max_statements: int | None,
+    policy: GuardPolicy = GuardPolicy.reject,
+) -> None:
+    """Run a request of statements through the middleware.
+
+    Messages sent by the middleware are appended to messages.
+    """
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        for _ in range(statements):
+            await session.execute(text("SELECT 1"))
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": []},
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message: Any) -> None:
+        messages.append(message)
+
+    middleware = StatementCounterMiddleware(
+        app,
+        max_statements=max_statements,
+        policy=policy,
+    )
+    asyncio.run(middleware({"type": "http"}, None, send))  # type: ignore[arg-type]
+
+
+def test_request_within_budget_reports_count(
+    routing_session: AsyncSession,
+) -> None:
+    """The statement count is returned in the response header."""
+    messages: list[dict[str, Any]] = []
+    request(routing_session, statements=2, messages=messages, max_statements=2)
+
+    headers = dict(messages[0]["headers"])
+    assert headers[STATEMENT_COUNT_HEADER.lower().encode()] == b"2"
+
+
+def test_app_rejects_request_over_max_statements_per_request(
+    monkeypatch: pytest.MonkeyPatch,
+    routing_session: AsyncSession,
+) -> None:
+    """In the test environment the app fails requests over the budget."""
+    monkeypatch.setattr(settings, "MAX_STATEMENTS_PER_REQUEST", 2)
+    [middleware] = [
+        middleware
+        for middleware in get_app().user_middleware
+        if middleware.cls is StatementCounterMiddleware
+    ]
+    messages: list[dict[str, Any]] = []
+
+    with pytest.raises(StatementBudgetException):
+        request(
+            routing_session,
+            statements=3,
+            messages=messages,
+            **middleware.kwargs,
+        )
+    assert messages == []
+
+
+def test_route_budget_overrides_request_budget(
+    routing_session: AsyncSession,
+) -> None:
+    """StatementBudget sets the budget of the current request."""
+
+    async def main() -> None:
+        with count_statements():
+            await StatementBudget(max_statements=1)()
+            await routing_session.execute(text("SELECT 1"))
+            with pytest.raises(StatementBudgetException):
+                await routing_session.execute(text("SELECT 2"))
+
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""Cache of page statements."""
+
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, mapped_column
+from src.core.database.base import Base
+from src.core.repository import SQLAlchemyRepository
+
+
+class Author(Base):
+    """Author."""
+
+    __tablename__ = "test_cache_author"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column()
+
+
+class Book(Base):
+    """Book."""
+
+    __tablename__ = "test_cache_book"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column()
+
+
+class Repository(SQLAlchemyRepository):  # type: ignore[type-arg]
+    """One repository class for every model."""
+
+
+def sql(query: Any) -> str:
+    """Compile query for Postgres."""
+    return str(query.compile(dialect=postgresql.asyncpg.dialect()))
+
+
+def test_one_repository_class_caches_statements_per_model(
+    fake_session: Callable[[], Any],
+) -> None:
+    """A statement of one model is not returned for another model."""
+    authors = Repository(model=Author, db_session=fake_session())
+    books = Repository(model=Book, db_session=fake_session())
+
+    author_sql = sql(authors._page_query(limit=10))
+    book_sql = sql(books._page_query(limit=10))
+
+    assert "FROM test_cache_author" in author_sql
+    assert "FROM test_cache_book" in book_sql
+    assert "test_cache_author" not in book_sql
+
+
+def test_statement_of_same_shape_is_reused(
+    fake_session: Callable[[], Any],
+) -> None:
+    """Pages of one shape share the statement, values are bound."""
+    repository = Repository(model=Author, db_session=fake_session())
+
+    first = repository._page_query(skip=0, limit=10)
+    second = repository._page_query(skip=10, limit=10)
+
+    assert sql(first) == sql(second)
+    assert first.compile().params["skip"] == 0
+    assert second.compile().params["skip"] == 10
@@ -0,0 +1,68 @@
+"""Statements of controller transactions."""
+
+import asyncio
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+from src.core.controller import SQLAlchemyController
+from src.core.database.base import Base
+from src.core.database.instrumentation import count_statements
+from src.core.database.mixin import TimestampMixin
+from src.core.repository import SQLAlchemyRepository
+
+
+class Ticket(Base, TimestampMixin):
+    """Ticket with server-generated values."""
+
+    __tablename__ = "test_transaction_ticket"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column()
+    status: Mapped[str] = mapped_column(server_default=text("'open'"))
+
+
+class TicketResponse(BaseModel):
+    """Ticket response."""
+
+    id: int
+    title: str
+    status: str
+
+
+class Controller(SQLAlchemyController[Ticket]):
+    """Controller of tickets."""
+
+
+def test_create_and_update_issue_one_statement_each(
+    sqlite_engines: dict[str, Any],
+    routing_session: AsyncSession,
+) -> None:
+    """Server values come back by RETURNING, there is no refresh SELECT."""
+    Ticket.__table__.create(sqlite_engines["writer"].sync_engine)  # type: ignore[attr-defined]
+    controller = Controller(
+        model=Ticket,
+        repository=SQLAlchemyRepository(  # type: ignore[var-annotated]
+            model=Ticket,
+            db_session=routing_session,
+        ),
+        exclude_fields=set(),
+        response_scheme=TicketResponse,  # type: ignore[arg-type]
+    )
+
+    async def main() -> None:
+        with count_statements() as counter:
+            ticket = await controller.create({"id": 1, "title": "a"})
+        assert counter.count == 1
+        assert ticket.status == "open"
+        assert ticket.created_at is not None
+
+        with count_statements() as counter:
+            ticket = await controller.update(ticket, {"title": "b"})
+        assert counter.count == 1
+        assert ticket.title == "b"
+        assert ticket.updated_at is not None
+
+    asyncio.run(main())
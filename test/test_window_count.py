@@ -0,0 +1,55 @@
+"""Page and total count in one statement."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from src.app.model import User
+from src.app.repository import UserRepository
+from src.core.helper.scheme.request.filter import FilterParam, FilterRequest
+from src.core.helper.type.filter import FilterType, OperatorType
+
+SEARCH = FilterRequest(
+    filters=[
+        FilterParam(
+            field="search_vector",
+            value="alice",
+            operator=OperatorType.SEARCH,
+        ),
+    ],
+    type=FilterType.AND,
+)
+
+
+def test_window_count_keeps_relevance_order(
+    fake_session: Callable[..., Any],
+) -> None:
+    """SEARCH pages with a window count are still ordered by rank."""
+    user = User(username="alice", email="e")
+    session = fake_session(rows=[(user, 7)])
+    repository = UserRepository(model=User, db_session=session)
+
+    data, total_count = asyncio.run(
+        repository.get_by_filters_with_count(filter_request=SEARCH, limit=10),
+    )
+
+    assert (data, total_count) == ([user], 7)
+    [sql] = session.sql
+    assert "count(*) OVER () AS total_count" in sql
+    assert "ORDER BY ts_rank(" in sql
+
+
+def test_window_count_uses_page_statement_cache(
+    fake_session: Callable[..., Any],
+) -> None:
+    """The page statement comes from the same cache as get_by_filters."""
+    repository = UserRepository(model=User, db_session=fake_session())
+    cache = repository.statement_cache
+    asyncio.run(repository.get_by_filters(filter_request=SEARCH, limit=10))
+    hits = cache.hits
+
+    asyncio.run(
+        repository.get_by_filters_with_count(filter_request=SEARCH, limit=10),
+    )
+
+    assert cache.hits == hits + 1
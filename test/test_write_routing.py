@@ -0,0 +1,69 @@
+"""Writes go to the writer engine of RoutingSession."""
+
+import asyncio
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+from src.core.database.base import Base
+from src.core.helper.scheme.request.filter import FilterParam, FilterRequest
+from src.core.helper.type.filter import FilterType, OperatorType
+from src.core.repository import SQLAlchemyRepository
+
+
+class Note(Base):
+    """Note."""
+
+    __tablename__ = "test_routing_note"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    text: Mapped[str] = mapped_column()
+
+
+class Repository(SQLAlchemyRepository):  # type: ignore[type-arg]
+    """Repository of notes."""
+
+
+def record_statements(engines: dict[str, Any]) -> dict[str, list[str]]:
+    """Return statements executed by each engine."""
+    statements: dict[str, list[str]] = {name: [] for name in engines}
+    for name, engine in engines.items():
+
+        def record(*args: Any, name: str = name) -> None:
+            statements[name].append(args[2].split()[0])
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+    return statements
+
+
+def test_update_and_delete_returning_go_to_writer(
+    sqlite_engines: dict[str, Any],
+    routing_session: AsyncSession,
+) -> None:
+    """UPDATE/DELETE ... RETURNING load models but run on the writer."""
+    Note.__table__.create(sqlite_engines["writer"].sync_engine)  # type: ignore[attr-defined]
+    repository = Repository(model=Note, db_session=routing_session)
+    by_id = FilterRequest(
+        filters=[
+            FilterParam(field="id", value=1, operator=OperatorType.EQUALS)
+        ],
+        type=FilterType.AND,
+    )
+
+    async def main() -> None:
+        await repository.create({"id": 1, "text": "a"})
+        await routing_session.commit()
+        routing_session.expunge_all()
+        statements = record_statements(sqlite_engines)
+        note = await routing_session.get(Note, 1)
+        await repository.update(note, {"text": "b"})
+        await repository.update_by_filters(by_id, {"text": "c"})
+        await repository.delete_by_filters(by_id)
+        await routing_session.commit()
+        assert statements == {
+            "writer": ["UPDATE", "UPDATE", "DELETE"],
+            "reader": ["SELECT"],
+        }
+
+    asyncio.run(main())